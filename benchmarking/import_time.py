@@ -0,0 +1,75 @@
+import statistics
+import subprocess
+import sys
+
+import pandas as pd
+
+# Optional stacks that only the modules needing them should load
+HEAVY_PACKAGES = [
+    "jax",
+    "scipy",
+    "pandas",
+    "statsmodels",
+    "matplotlib",
+    "mesa",
+    "networkx",
+    "ndlib",
+    "jitcdde",
+    "numba",
+]
+
+MODULES = [
+    "innovate",
+    "innovate.backend",
+    "innovate.diffuse.bass",
+    "innovate.diffuse.logistic",
+    "innovate.fitters.scipy_fitter",
+    "innovate.compete.competition",
+    "innovate.abm",
+    "innovate.preprocess",
+    "innovate.plots",
+]
+
+# numpy is imported first and timed separately: every module needs it
+_PROBE = """
+import sys, time
+import numpy
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted({{name.partition(".")[0] for name in sys.modules}} & set({heavy!r}))
+print(elapsed)
+print(",".join(loaded))
+"""
+
+
+def run_import_benchmark(module, repeats=5):
+    """Imports a module in fresh interpreters and returns the median time."""
+    times = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_PACKAGES)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split("\n")
+        times.append(float(output[0]))
+    return {
+        "module": module,
+        "time": statistics.median(times),
+        "heavy_imports": output[1] or "-",
+    }
+
+
+def main():
+    """Runs the import benchmarks and prints the results."""
+    print("Running import benchmarks...")
+    results = [run_import_benchmark(module) for module in MODULES]
+
+    df = pd.DataFrame(results)
+    print("\n--- Import Time Results ---")
+    print(df.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+from innovate.utils.lazy import attach
+
+# Subpackages are imported on first attribute access, so ``import innovate``
+# does not load the optional stacks behind them (JAX, mesa, matplotlib, ...)
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "abm",
+        "adopt",
+        "backend",
+        "base",
+        "causal",
+        "compete",
+        "data",
+        "diffuse",
+        "dynamics",
+        "ecosystem",
+        "ecosystems",
+        "fail",
+        "fitters",
+        "hype",
+        "models",
+        "path_dependence",
+        "plots",
+        "policy",
+        "preprocess",
+        "reduce",
+        "substitute",
+        "utils",
+    ],
+)
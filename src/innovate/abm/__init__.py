@@ -1,16 +1,17 @@
-from .agent import InnovationAgent
-from .model import InnovationModel
-from .competitive_diffusion import CompetitiveDiffusionAgent, CompetitiveDiffusionModel
-from .sentiment_hype_cycle import SentimentHypeAgent, SentimentHypeModel
-from .disruptive_innovation import DisruptiveInnovationAgent, DisruptiveInnovationModel
+from innovate.utils.lazy import attach
 
-__all__ = [
-    "InnovationAgent",
-    "InnovationModel",
-    "CompetitiveDiffusionAgent",
-    "CompetitiveDiffusionModel",
-    "SentimentHypeAgent",
-    "SentimentHypeModel",
-    "DisruptiveInnovationAgent",
-    "DisruptiveInnovationModel",
-]
+# The agent-based models need mesa, which is only imported once one of them
+# is accessed
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "InnovationAgent": ".agent",
+        "InnovationModel": ".model",
+        "CompetitiveDiffusionAgent": ".competitive_diffusion",
+        "CompetitiveDiffusionModel": ".competitive_diffusion",
+        "SentimentHypeAgent": ".sentiment_hype_cycle",
+        "SentimentHypeModel": ".sentiment_hype_cycle",
+        "DisruptiveInnovationAgent": ".disruptive_innovation",
+        "DisruptiveInnovationModel": ".disruptive_innovation",
+    },
+)
@@ -1,4 +1,5 @@
 from innovate.backend import current_backend as B
+import numpy as np
 import pandas as pd
 from innovate.base.base import DiffusionModel
 from typing import Sequence
@@ -31,18 +32,17 @@ def categorize_adopters(model: DiffusionModel, t: Sequence[float]) -> pd.DataFra
     late_majority_end = mean_adoption_time + std_dev_adoption_time
 
     # Categorize each time point
-    categories = []
-    for time_point in t:
-        if time_point <= innovators_end:
-            categories.append("Innovators")
-        elif time_point <= early_adopters_end:
-            categories.append("Early Adopters")
-        elif time_point <= early_majority_end:
-            categories.append("Early Majority")
-        elif time_point <= late_majority_end:
-            categories.append("Late Majority")
-        else:
-            categories.append("Laggards")
+    t_arr = np.asarray(t)
+    categories = np.select(
+        [
+            t_arr <= innovators_end,
+            t_arr <= early_adopters_end,
+            t_arr <= early_majority_end,
+            t_arr <= late_majority_end,
+        ],
+        ["Innovators", "Early Adopters", "Early Majority", "Late Majority"],
+        default="Laggards",
+    )
 
     return pd.DataFrame(
         {"time": t, "adoption_rate": adoption_rate, "category": categories}
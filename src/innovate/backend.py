@@ -1,28 +1,112 @@
-"""Backend selection for the :mod:`innovate` library."""
+"""Backend selection for the :mod:`innovate` library.
+
+The active backend is resolved at call time. :func:`use_backend` sets the
+process-wide default, and :func:`using` overrides it for the current
+context only (the current thread or asyncio task), so NumPy-backed and
+JAX-backed work can run side by side in one process::
+
+    with innovate.backend.using("jax"):
+        model.predict(t)  # JAX inside the block, on this thread only
+
+``current_backend`` forwards every attribute lookup to the active backend,
+so modules that bind it at import time still follow both mechanisms.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
 
 from innovate.backends.numpy_backend import NumPyBackend
 
-# JAX and diffrax are optional dependencies
-try:
-    from innovate.backends.jax_backend import JaxBackend  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency may be missing
-    JaxBackend = None
+_BACKENDS: Dict[str, object] = {}
+_default_backend = None
+# Backend selected by ``using`` in the current context; None means the default
+_ACTIVE_BACKEND: ContextVar[Optional[object]] = ContextVar(
+    "innovate_backend", default=None
+)
+
 
-current_backend = NumPyBackend()
+def _create_backend(backend: str):
+    """Returns the shared instance of the backend called ``backend``."""
+    if backend not in _BACKENDS:
+        # JAX and Numba are imported on first use so that they stay optional
+        # and do not slow down importing innovate
+        if backend == "jax":
+            try:
+                from innovate.backends.jax_backend import JaxBackend
+            except ImportError as error:
+                raise ImportError(
+                    "JAX backend is not available. Install jax and diffrax to use it."
+                ) from error
+            _BACKENDS[backend] = JaxBackend()
+        elif backend == "numpy":
+            _BACKENDS[backend] = NumPyBackend()
+        elif backend == "numba":
+            try:
+                from innovate.backends.numba_backend import NumbaBackend
+            except ImportError as error:
+                raise ImportError(
+                    "Numba backend is not available. Install numba to use it."
+                ) from error
+            _BACKENDS[backend] = NumbaBackend()
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
+    return _BACKENDS[backend]
+
+
+def get_backend():
+    """Returns the backend active in the current context."""
+    active = _ACTIVE_BACKEND.get()
+    return _default_backend if active is None else active
 
 
 def use_backend(backend: str):
-    global current_backend
-    if backend == "jax":
-        if JaxBackend is None:
-            raise ImportError(
-                "JAX backend is not available. Install jax and diffrax to use it."
-            )
-        current_backend = JaxBackend()
-    elif backend == "numpy":
-        current_backend = NumPyBackend()
-    else:
-        raise ValueError(f"Unknown backend: {backend}")
+    """Sets the process-wide default backend (``"numpy"``, ``"jax"`` or ``"numba"``)."""
+    global _default_backend
+    _default_backend = _create_backend(backend)
+
+
+@contextmanager
+def using(backend: str):
+    """
+    Activates a backend for the current context until the block exits.
+
+    Other threads and asyncio tasks keep their own backend. Threads started
+    inside the block do not inherit it unless they run in a copy of the
+    context (see :func:`contextvars.copy_context`).
+    """
+    token = _ACTIVE_BACKEND.set(_create_backend(backend))
+    try:
+        yield get_backend()
+    finally:
+        _ACTIVE_BACKEND.reset(token)
+
+
+class _BackendProxy:
+    """Forwards attribute access to the backend active at call time."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        return getattr(get_backend(), name)
+
+    def __repr__(self) -> str:
+        return f"<current backend: {type(get_backend()).__name__}>"
+
+
+current_backend = _BackendProxy()
+
+
+def __getattr__(name):
+    # ``JaxBackend`` used to be imported eagerly into this module; resolve it
+    # on first access instead so that importing innovate does not load JAX
+    if name == "JaxBackend":
+        try:
+            from innovate.backends.jax_backend import JaxBackend
+        except ImportError:  # pragma: no cover - optional dependency may be missing
+            return None
+        return JaxBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Initialize with the NumPy backend by default
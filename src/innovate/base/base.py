@@ -1,6 +1,9 @@
+import copy
 from abc import ABC, abstractmethod
 from typing import Dict, Sequence, TypeVar, Any
 
+import numpy as np
+
 # Define a type variable for the class itself, for type hinting Self
 Self = TypeVar("Self")
 
@@ -29,6 +32,145 @@ class DiffusionModel(ABC):
         """Predicts adoption levels for given time points."""
         pass
 
+    def evaluate(
+        self,
+        params: Sequence[float],
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+    ) -> Sequence[float]:
+        """
+        Predicts adoption levels for explicit parameter values without side effects.
+
+        Args:
+            params: Parameter values in ``param_names`` order.
+            t: Time points at which to predict.
+            covariates: Optional covariate time series, forwarded to ``predict``.
+
+        Returns:
+            The predictions ``predict`` would return with these parameters.
+
+        Unlike setting ``params_`` and calling ``predict``, this never mutates
+        the model, so one instance can serve as a template for concurrent
+        fits. This default predicts on a shallow copy; models override it to
+        evaluate directly from the positional parameters.
+        """
+        model = copy.copy(self)
+        model.params_ = dict(zip(self.param_names, params))
+        if covariates:
+            return model.predict(t, covariates)
+        return model.predict(t)
+
+    def predict_many(
+        self, t: Sequence[float], params_matrix: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Predicts adoption levels for many parameter vectors on one time grid.
+
+        Args:
+            t: Time points shared by every parameter vector.
+            params_matrix: Array of shape (K, P) whose columns follow ``param_names``.
+
+        Returns:
+            An array of shape (K, len(t)) with one prediction per row of ``params_matrix``.
+
+        This default calls :meth:`evaluate` once per row. Models with
+        closed-form solutions override it with a vectorized implementation.
+        """
+        params_matrix = self._check_params_matrix(params_matrix)
+        predictions = [
+            np.asarray(self.evaluate(row, t), dtype=float).ravel()
+            for row in params_matrix
+        ]
+        return np.stack(predictions) if predictions else np.empty((0, len(t)))
+
+    @property
+    def supports_batch(self) -> bool:
+        """
+        Whether :meth:`evaluate` accepts parameters with leading batch dimensions.
+
+        Models whose ``evaluate`` is written purely in broadcasting array
+        operations return True, so :meth:`evaluate_batch` runs a whole batch
+        in one call and ``NumPyBackend.vmap`` need not loop over it.
+        """
+        return False
+
+    def evaluate_batch(self, params, t) -> np.ndarray:
+        """
+        Predicts for a batch of parameter vectors, each on its own time grid.
+
+        Args:
+            params: Array of shape (..., P) whose last axis follows ``param_names``.
+            t: Time points of shape (..., T), or (T,) shared by every vector.
+
+        Returns:
+            An array of shape (..., T).
+
+        If :attr:`supports_batch` is true, :meth:`evaluate` is called once
+        with (..., 1) parameter columns that broadcast against ``t``;
+        otherwise it is called once per parameter vector.
+        """
+        if not hasattr(params, "shape"):
+            params = np.asarray(params, dtype=float)
+        if self.supports_batch:
+            columns = [params[..., i : i + 1] for i in range(params.shape[-1])]
+            return self.evaluate(columns, t)
+
+        t = np.asarray(t, dtype=float)
+        batch_shape = params.shape[:-1]
+        t_rows = np.broadcast_to(t, batch_shape + t.shape[-1:]).reshape(-1, t.shape[-1])
+        predictions = [
+            np.asarray(self.evaluate(row, t_row), dtype=float).ravel()
+            for row, t_row in zip(params.reshape(-1, params.shape[-1]), t_rows)
+        ]
+        return np.reshape(predictions, batch_shape + t.shape[-1:])
+
+    def jacobian_many(
+        self, t: Sequence[float], params_matrix: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Returns the Jacobian of :meth:`predict_many` for many parameter vectors.
+
+        Args:
+            t: Time points shared by every parameter vector.
+            params_matrix: Array of shape (K, P) whose columns follow ``param_names``.
+
+        Returns:
+            An array of shape (K, len(t), P) with one ``jacobian`` per row.
+
+        This default calls the model's ``jacobian`` once per row. Models
+        with closed-form solutions override it with a vectorized
+        implementation.
+        """
+        jacobian = getattr(self, "jacobian", None)
+        if not callable(jacobian):
+            raise NotImplementedError(
+                f"{type(self).__name__} does not provide an analytic Jacobian."
+            )
+        params_matrix = self._check_params_matrix(params_matrix)
+        jacobians = [
+            np.asarray(jacobian(t, params=row), dtype=float) for row in params_matrix
+        ]
+        if not jacobians:
+            return np.empty((0, len(t), len(self.param_names)))
+        return np.stack(jacobians)
+
+    def _check_params_matrix(self, params_matrix) -> np.ndarray:
+        """Validates a (K, P) parameter matrix against ``param_names``."""
+        params_matrix = np.atleast_2d(np.asarray(params_matrix, dtype=float))
+        if params_matrix.ndim != 2 or params_matrix.shape[1] != len(self.param_names):
+            raise ValueError(
+                f"params_matrix must have shape (K, {len(self.param_names)}), "
+                f"got {params_matrix.shape}."
+            )
+        return params_matrix
+
+    def _params_columns(self, params_matrix) -> Dict[str, np.ndarray]:
+        """Maps each parameter name to a (K, 1) column of ``params_matrix``."""
+        params_matrix = self._check_params_matrix(params_matrix)
+        return {
+            name: params_matrix[:, i : i + 1] for i, name in enumerate(self.param_names)
+        }
+
     @abstractmethod
     def score(self, t: Sequence[float], y: Sequence[float]) -> float:
         """Returns the R^2 score of the model fit."""
@@ -1,10 +1,31 @@
 from innovate.base.base import DiffusionModel, Self
 from innovate.backend import current_backend as B
+from innovate.fitters.diagnostics import record_ode_solve
 from typing import Sequence, Dict, List, Union
 import pandas as pd
 import numpy as np
 
 
+def _multi_product_kernel(y, t, params):
+    """
+    Right-hand side over the flat (p, Q row-major, m) parameters, in the
+    NumPy subset that the Numba backend compiles.
+    """
+    n = y.shape[0]
+    share = np.zeros(n)
+    for j in range(n):
+        m_j = params[n + n * n + j]
+        if m_j != 0:
+            share[j] = min(y[j] / m_j, 1.0)
+    dydt = np.empty(n)
+    for i in range(n):
+        force = params[i]
+        for j in range(n):
+            force += params[n + i * n + j] * share[j]
+        dydt[i] = force * max(params[n + n * n + i] - y[i], 0.0)
+    return dydt
+
+
 class MultiProductDiffusionModel(DiffusionModel):
     """Generic framework for multi-product/policy diffusion with competition and substitution."""
 
@@ -16,6 +37,9 @@ class MultiProductDiffusionModel(DiffusionModel):
         ],  # N x N matrix: interaction matrix (within- and cross-imitation)
         m: Sequence[float],  # length N: ultimate market potentials
         names: Sequence[str] = None,
+        interaction_mask: Sequence[
+            Sequence[bool]
+        ] = None,  # N x N: entries of Q that are fitted, see free_params
     ):
         self.p = B.array(p)
         self.Q = B.array(Q)
@@ -32,6 +56,14 @@ class MultiProductDiffusionModel(DiffusionModel):
         if names and len(names) != self.N:
             raise ValueError("Length of names must match the number of products (N).")
 
+        if interaction_mask is None:
+            interaction_mask = np.ones((self.N, self.N), dtype=bool)
+        interaction_mask = np.asarray(interaction_mask, dtype=bool)
+        if interaction_mask.shape != (self.N, self.N):
+            raise ValueError("interaction_mask must be an N x N matrix.")
+        # Each product always interacts with itself
+        self.interaction_mask = interaction_mask | np.eye(self.N, dtype=bool)
+
         self._params: Dict[str, float] = {}
 
     def _rhs(self, y: Sequence[float], t: float) -> Sequence[float]:
@@ -74,6 +106,12 @@ class MultiProductDiffusionModel(DiffusionModel):
         # Initial conditions: start with 0 adoptions for all products
         y0 = B.zeros((self.N,))
 
+        solve_ode_kernel = getattr(B, "solve_ode_kernel", None)
+        if solve_ode_kernel is not None:
+            params = self.pack_params(current_p, current_Q, current_m)
+            sol = solve_ode_kernel(_multi_product_kernel, y0, t, params)
+            return pd.DataFrame(sol, index=t, columns=self.names)
+
         # Solve the ODE system
         # The _rhs function expects (y, t) for scipy.integrate.odeint
         # We need to pass the current parameters (p, Q, m) to the _rhs function
@@ -87,10 +125,10 @@ class MultiProductDiffusionModel(DiffusionModel):
         self._current_ode_params = (current_p, current_Q, current_m)
 
         def ode_func(y, t_val):
-            # This wrapper allows _rhs to access self.p, self.Q, self.m
+            # This wrapper passes the current parameters, which may differ
+            # from self.p, self.Q, self.m when params_ was set directly,
             # and matches the (y, t) signature expected by odeint
-            # Note: self._rhs expects (y, t) as per the backend protocol
-            return self._rhs(y, t_val)
+            return self.differential_equation(y, t_val, self._current_ode_params)
 
         sol = B.solve_ode(ode_func, y0, t)
 
@@ -112,6 +150,89 @@ class MultiProductDiffusionModel(DiffusionModel):
         remaining_potential = B.where(m - y_arr < 0, 0, m - y_arr)
         return force * remaining_potential
 
+    def pack_params(self, p, Q, m) -> np.ndarray:
+        """Flattens (p, Q, m) into the vector fitted by :class:`ScipyFitter`.
+
+        The layout is fixed by N alone (see :attr:`param_names`): ``p``, all
+        N * N entries of ``Q`` in row-major order, then ``m``.
+        """
+        return np.concatenate(
+            [
+                np.ravel(np.asarray(p, dtype=float)),
+                np.ravel(np.asarray(Q, dtype=float)),
+                np.ravel(np.asarray(m, dtype=float)),
+            ]
+        )
+
+    @property
+    def free_params(self) -> np.ndarray:
+        """
+        Boolean mask over the :meth:`pack_params` layout of the fitted entries.
+
+        ``p`` and ``m`` are always fitted, and ``Q`` where ``interaction_mask``
+        is true. The other entries of ``Q`` stay in the vector but keep their
+        initial values, which is zero for a structural non-interaction.
+        """
+        ones = np.ones(self.N, dtype=bool)
+        return np.concatenate([ones, self.interaction_mask.ravel(), ones])
+
+    def unpack_params(self, params):
+        """Inverse of :meth:`pack_params`, returning (p, Q, m) arrays."""
+        params = np.asarray(params, dtype=float)
+        n, q_end = self.N, self.N + self.N * self.N
+        return params[:n], params[n:q_end].reshape(n, n), params[q_end:]
+
+    def evaluate(self, params, t, covariates=None, **kwargs) -> np.ndarray:
+        """
+        Cumulative adoptions of shape (len(t), N) for a :meth:`pack_params` vector.
+
+        Integrates the matrix-form :meth:`differential_equation` from zero
+        adoptions at ``t[0]`` without modifying the model. ``kwargs`` are
+        passed to ``scipy.integrate.odeint``.
+        """
+        from scipy.integrate import odeint
+
+        p, Q, m = self.unpack_params(params)
+        sol, info = odeint(
+            self.differential_equation,
+            np.zeros(self.N),
+            np.asarray(t, dtype=float),
+            args=((p, Q, m),),
+            full_output=True,
+            **kwargs,
+        )
+        record_ode_solve(info["nfe"][-1] if len(info["nfe"]) else 0)
+        return sol
+
+    def jac_sparsity(self, n_times: int):
+        """
+        Sparsity pattern of the Jacobian of the (len(t) * N) residuals.
+
+        Product i's trajectory depends on the parameters of every product it
+        can reach through interactions, so the pattern is the transitive
+        closure of ``interaction_mask``, repeated for every time point. Rows
+        follow ``y.ravel()`` for ``y`` of shape (n_times, N); columns follow
+        :meth:`pack_params`.
+
+        Entries of ``Q`` outside the mask are not fitted (see
+        :attr:`free_params`), so their columns are empty. The default mask
+        lets every product interact, which gives a dense pattern.
+        """
+        from scipy.sparse import csr_matrix
+
+        mask = self.interaction_mask
+        reach = mask.copy()
+        while True:
+            expanded = reach | ((reach.astype(int) @ mask.astype(int)) > 0)
+            if (expanded == reach).all():
+                break
+            reach = expanded
+        # Each product owns p_i, its row of Q and m_i
+        products = np.arange(self.N)
+        owner = np.concatenate([products, np.repeat(products, self.N), products])
+        pattern = reach[:, owner] & self.free_params
+        return csr_matrix(np.tile(pattern, (n_times, 1)))
+
     def fit(self, t: Sequence[float], y: Sequence[Sequence[float]], **kwargs) -> Self:
         """Fit model parameters by minimizing squared prediction error."""
         from scipy.optimize import minimize
@@ -207,6 +328,13 @@ class MultiProductDiffusionModel(DiffusionModel):
 
     @property
     def param_names(self) -> Sequence[str]:
+        """
+        Names of the parameter blocks.
+
+        The flat vector taken by :meth:`evaluate` holds the N entries of
+        ``p``, the N * N entries of ``Q`` in row-major order and the N
+        entries of ``m``, in that order (see :meth:`pack_params`).
+        """
         return ["p", "Q", "m"]
 
     def initial_guesses(
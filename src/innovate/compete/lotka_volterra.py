@@ -2,6 +2,9 @@
 
 from innovate.base.base import DiffusionModel
 from innovate.backend import current_backend as B
+from innovate.utils.covariates import prepare_covariates
+from innovate.utils.sensitivity import sse_and_gradient
+from functools import partial
 from typing import Sequence, Dict
 import numpy as np
 
@@ -14,9 +17,14 @@ class LotkaVolterraModel(DiffusionModel):
     products, where the adoption of each is influenced by the other.
     """
 
-    def __init__(self, covariates: Sequence[str] = None):
+    def __init__(
+        self,
+        covariates: Sequence[str] = None,
+        covariate_interpolation: str = "linear",
+    ):
         self._params: Dict[str, float] = {}
         self.covariates = covariates if covariates else []
+        self.covariate_interpolation = covariate_interpolation
 
     @property
     def param_names(self) -> Sequence[str]:
@@ -111,33 +119,57 @@ class LotkaVolterraModel(DiffusionModel):
             bounds[f"beta_beta2_{cov}"] = (-np.inf, np.inf)
         return bounds
 
+    def _effective_params(self, t, params, covariates, t_eval):
+        """Returns (alpha1, beta1, alpha2, beta2) at time t and the covariate values."""
+        covariates = prepare_covariates(
+            covariates, t_eval, self.covariate_interpolation
+        )
+        if not covariates:
+            return params[:4], None
+        cov_val_t = covariates(t)
+        betas = np.reshape(params[4 : 4 + 4 * len(cov_val_t)], (-1, 4))
+        return np.asarray(params[:4]) + cov_val_t @ betas, cov_val_t
+
     def differential_equation(self, y, t, params, covariates, t_eval):
         y1, y2 = y
-
-        alpha1_base = params[0]
-        beta1_base = params[1]
-        alpha2_base = params[2]
-        beta2_base = params[3]
-
-        alpha1_t = alpha1_base
-        beta1_t = beta1_base
-        alpha2_t = alpha2_base
-        beta2_t = beta2_base
-
-        if covariates:
-            param_idx = 4
-            for cov_name, cov_values in covariates.items():
-                cov_val_t = np.interp(t, t_eval, cov_values)
-                alpha1_t += params[param_idx] * cov_val_t
-                beta1_t += params[param_idx + 1] * cov_val_t
-                alpha2_t += params[param_idx + 2] * cov_val_t
-                beta2_t += params[param_idx + 3] * cov_val_t
-                param_idx += 4
+        (alpha1_t, beta1_t, alpha2_t, beta2_t), _ = self._effective_params(
+            t, params, covariates, t_eval
+        )
 
         dy1_dt = alpha1_t * y1 * (1 - y1) - beta1_t * y1 * y2
         dy2_dt = alpha2_t * y2 * (1 - y2) - beta2_t * y1 * y2
         return [dy1_dt, dy2_dt]
 
+    def ode_jacobians(self, y, t, params, covariates=None, t_eval=None):
+        """
+        Jacobians of the right-hand side for the forward sensitivity equations.
+
+        Returns:
+            A tuple with the derivatives with respect to (y1, y2), of shape
+            (2, 2), and with respect to ``param_names``, of shape (2, P).
+        """
+        y1, y2 = y
+        (alpha1_t, beta1_t, alpha2_t, beta2_t), cov_val_t = self._effective_params(
+            t, params, covariates, t_eval
+        )
+        d_state = np.array(
+            [
+                [alpha1_t * (1 - 2 * y1) - beta1_t * y2, -beta1_t * y1],
+                [-beta2_t * y2, alpha2_t * (1 - 2 * y2) - beta2_t * y1],
+            ]
+        )
+        # Derivatives with respect to the effective (alpha1, beta1, alpha2, beta2)
+        d_base = np.array(
+            [
+                [y1 * (1 - y1), -y1 * y2, 0.0, 0.0],
+                [0.0, 0.0, y2 * (1 - y2), -y1 * y2],
+            ]
+        )
+        if cov_val_t is None:
+            return d_state, d_base
+        # Each covariate coefficient scales its base parameter's derivative
+        return d_state, np.hstack([d_base] + [d_base * value for value in cov_val_t])
+
     def predict(
         self,
         t: Sequence[float],
@@ -163,7 +195,8 @@ class LotkaVolterraModel(DiffusionModel):
 
         from scipy.integrate import odeint
 
-        params = [self._params[name] for name in self.param_names]
+        params = np.array([self._params[name] for name in self.param_names])
+        covariates = prepare_covariates(covariates, t, self.covariate_interpolation)
         solution = odeint(
             self.differential_equation,
             y0,
@@ -172,6 +205,58 @@ class LotkaVolterraModel(DiffusionModel):
         )
         return solution
 
+    @staticmethod
+    def batch_rhs(y, t, params):
+        """
+        Right-hand side for K systems at once, as used by ``solve_ode_batch``.
+
+        Args:
+            y: States of shape (K, 2).
+            t: Times of shape (K,); the equations are autonomous.
+            params: Parameters of shape (K, P) in ``param_names`` order.
+                Covariate coefficients are ignored.
+
+        Returns:
+            Derivatives of shape (K, 2).
+        """
+        y1, y2 = y[:, 0], y[:, 1]
+        alpha1, beta1, alpha2, beta2 = (params[:, i] for i in range(4))
+        dy1_dt = alpha1 * y1 * (1 - y1) - beta1 * y1 * y2
+        dy2_dt = alpha2 * y2 * (1 - y2) - beta2 * y1 * y2
+        return B.stack([dy1_dt, dy2_dt]).T
+
+    def simulate_many(
+        self,
+        t: Sequence[float],
+        params_matrix: Sequence[Sequence[float]],
+        y0: Sequence[float],
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Simulates the market shares for K parameter vectors in one batched solve.
+
+        Unlike ``predict_many`` on single-curve models, every trajectory needs
+        initial shares and has two columns, hence the separate name.
+
+        All trajectories are integrated together by the active backend's
+        ``solve_ode_batch``, which suits parameter sweeps, bootstraps and
+        Monte Carlo runs. As in :meth:`predict` without covariates, only
+        the base parameters are used.
+
+        Args:
+            t: A sequence of time points shared by every trajectory.
+            params_matrix: Array of shape (K, P) in ``param_names`` order.
+            y0: Initial market shares, of shape (2,) for all trajectories or
+                (K, 2) for one per trajectory.
+            kwargs: Passed to ``solve_ode_batch`` (``method``, ``rtol``, ...).
+
+        Returns:
+            An array of shape (K, len(t), 2).
+        """
+        params_matrix = self._check_params_matrix(params_matrix)
+        y0 = np.broadcast_to(np.asarray(y0, dtype=float), (len(params_matrix), 2))
+        return B.solve_ode_batch(self.batch_rhs, y0, t, params_matrix, **kwargs)
+
     def fit(
         self,
         t: Sequence[float],
@@ -183,7 +268,9 @@ class LotkaVolterraModel(DiffusionModel):
         Fits the Lotka-Volterra model to the data.
 
         This implementation uses `scipy.optimize.minimize` to find the best
-        parameters by minimizing the sum of squared errors.
+        parameters by minimizing the sum of squared errors. The gradient of
+        the objective comes from the forward sensitivity equations, so each
+        optimizer step costs one ODE solve.
 
         Args:
             t: A sequence of time points.
@@ -200,10 +287,17 @@ class LotkaVolterraModel(DiffusionModel):
 
         y0 = y[0, :]
 
+        prepared = prepare_covariates(covariates, t, self.covariate_interpolation)
+
         def objective(params, t, y, covariates):
-            self.params_ = dict(zip(self.param_names, params))
-            y_pred = self.predict(t, y0, covariates)
-            return B.sum((y - y_pred) ** 2)
+            return sse_and_gradient(
+                partial(self.differential_equation, covariates=prepared, t_eval=t),
+                partial(self.ode_jacobians, covariates=prepared, t_eval=t),
+                y0,
+                t,
+                params,
+                y,
+            )
 
         initial_params = list(self.initial_guesses(t, y).values())
         param_bounds = list(self.bounds(t, y).values())
@@ -214,6 +308,7 @@ class LotkaVolterraModel(DiffusionModel):
             args=(t, y, covariates),
             bounds=param_bounds,
             method="L-BFGS-B",
+            jac=True,
             options={"maxiter": 10000},
             **kwargs,
         )
@@ -1,6 +1,7 @@
 from innovate.backend import current_backend as B
 import numpy as np
 from ..base import DiffusionModel
+from innovate.utils.covariates import prepare_covariates
 from typing import Sequence, Dict
 
 
@@ -17,12 +18,14 @@ class MultiProductDiffusionModel(DiffusionModel):
         m: Sequence[float] = None,
         names: Sequence[str] = None,
         covariates: Sequence[str] = None,
+        covariate_interpolation: str = "linear",
     ):
         if n_products < 1:
             raise ValueError("Number of products must be at least 1.")
         self.n_products = n_products
         self._params: Dict[str, float] = {}
         self.covariates = covariates if covariates else []
+        self.covariate_interpolation = covariate_interpolation
 
         self.p = B.array(p) if p is not None else None
         self.Q = B.array(Q) if Q is not None else None
@@ -182,6 +185,11 @@ class MultiProductDiffusionModel(DiffusionModel):
                 "Model parameters (p, Q, m) are not set, and model has not been fitted yet. Call .fit() or set parameters directly."
             )
 
+        params_for_ode = np.asarray(params_for_ode, dtype=float)
+        covariates = prepare_covariates(
+            covariates, t_arr, self.covariate_interpolation, names=self.covariates
+        )
+
         def ode_func(t_val, y_val):
             return self.differential_equation(
                 t_val, y_val, params_for_ode, covariates, t_arr
@@ -200,8 +208,9 @@ class MultiProductDiffusionModel(DiffusionModel):
         # Unpack the params_tuple
         all_params_flat = params
         n_products = self.n_products
-        covariates_dict = covariates
-        covariate_names = self.covariates
+        covariates = prepare_covariates(
+            covariates, t_eval, self.covariate_interpolation, names=self.covariates
+        )
 
         # Calculate the number of alpha parameters (off-diagonal elements in Q)
         num_alpha_params = n_products * (n_products - 1)
@@ -222,60 +231,35 @@ class MultiProductDiffusionModel(DiffusionModel):
         alpha_t_flat = np.copy(alpha_base_flat)
 
         # Apply covariate effects
-        if covariates_dict:
+        if covariates:
             # The offset for beta coefficients starts after all base p, q, m, and alpha parameters
             param_idx_offset = 3 * n_products + num_alpha_params
-
-            for cov_name in covariate_names:
-                cov_values = covariates_dict[cov_name]
-                cov_val_t = np.interp(t, t_eval, cov_values)
-
-                # Add covariate effects to p, q, m
-                for i in range(n_products):
-                    p_t[i] += all_params_flat[param_idx_offset + i * 3] * cov_val_t
-                    q_t[i] += all_params_flat[param_idx_offset + i * 3 + 1] * cov_val_t
-                    m_t[i] += all_params_flat[param_idx_offset + i * 3 + 2] * cov_val_t
-
-                # Add covariate effects to alpha
-                # The alpha betas follow the m betas for each product
-                alpha_beta_start_idx_for_cov = param_idx_offset + n_products * 3
-                current_alpha_beta_idx = 0
-                for i in range(n_products):
-                    for j in range(n_products):
-                        if i != j:
-                            alpha_t_flat[current_alpha_beta_idx] += (
-                                all_params_flat[
-                                    alpha_beta_start_idx_for_cov
-                                    + current_alpha_beta_idx
-                                ]
-                                * cov_val_t
-                            )
-                            current_alpha_beta_idx += 1
-                param_idx_offset = (
-                    alpha_beta_start_idx_for_cov + num_alpha_params
-                )  # Update offset for next covariate
-
-        # Reshape alpha_t_flat back to matrix
-        alpha_t = B.zeros((n_products, n_products))
-        alpha_idx = 0
-        for i in range(n_products):
-            for j in range(n_products):
-                if i != j:
-                    alpha_t[i, j] = alpha_t_flat[alpha_idx]
-                    alpha_idx += 1
-
-        dydt = B.zeros_like(y)
-        for i in range(n_products):
-            interaction_term = sum(
-                alpha_t[i, j] * y[j] for j in range(n_products) if i != j
-            )
-            dydt[i] = (
-                (p_t[i] + q_t[i] * y[i] / m_t[i]) * (m_t[i] - y[i] - interaction_term)
-                if m_t[i] > 0
-                else 0
+            # Each covariate contributes a (p, q, m) triple per product followed
+            # by one coefficient per alpha.
+            block = 3 * n_products + num_alpha_params
+            cov_val_t = covariates(t)
+            betas = np.reshape(
+                all_params_flat[
+                    param_idx_offset : param_idx_offset + block * len(cov_val_t)
+                ],
+                (-1, block),
             )
-
-        return dydt
+            effects = cov_val_t @ betas
+            pqm_effects = effects[: 3 * n_products].reshape(n_products, 3)
+            p_t = p_t + pqm_effects[:, 0]
+            q_t = q_t + pqm_effects[:, 1]
+            m_t = m_t + pqm_effects[:, 2]
+            alpha_t_flat = alpha_t_flat + effects[3 * n_products :]
+
+        # Off-diagonal entries in row-major order, as in ``param_names``.
+        alpha_t = np.zeros((n_products, n_products))
+        alpha_t[~np.eye(n_products, dtype=bool)] = alpha_t_flat
+        y = np.asarray(y, dtype=float)
+        interaction = alpha_t @ y
+
+        m_safe = np.where(m_t > 0, m_t, 1.0)
+        dydt = (p_t + q_t * y / m_safe) * (m_t - y - interaction)
+        return np.where(m_t > 0, dydt, 0.0)
 
     def score(
         self,
@@ -301,15 +285,54 @@ class MultiProductDiffusionModel(DiffusionModel):
             raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
 
         y_pred = self.predict(t, covariates)
-        params = [self._params[name] for name in self.param_names]
+        return self._trajectory_rate(t, y_pred, covariates)
+
+    def _trajectory_rate(
+        self,
+        t: Sequence[float],
+        y_pred: np.ndarray,
+        covariates: Dict[str, Sequence[float]] = None,
+    ) -> np.ndarray:
+        """
+        Adoption rates along a whole trajectory in one vectorized pass.
+
+        Equivalent to calling :meth:`differential_equation` at every row of
+        ``y_pred`` (shape ``(len(t), n_products)``).
+        """
+        n = self.n_products
+        num_alpha_params = n * (n - 1)
+        params = np.array([self._params[name] for name in self.param_names])
+        y = np.asarray(y_pred, dtype=float).reshape(len(t), n)
+        p_t = np.broadcast_to(params[:n], y.shape)
+        q_t = np.broadcast_to(params[n : 2 * n], y.shape)
+        m_t = np.broadcast_to(params[2 * n : 3 * n], y.shape)
+        alpha_t_flat = np.broadcast_to(
+            params[3 * n : 3 * n + num_alpha_params], (len(t), num_alpha_params)
+        )
 
-        rates = B.array(
-            [
-                self.differential_equation(ti, yi, params, covariates, t)
-                for ti, yi in zip(t, y_pred)
-            ]
+        covariates = prepare_covariates(
+            covariates, t, self.covariate_interpolation, names=self.covariates
         )
-        return rates
+        if covariates:
+            offset = 3 * n + num_alpha_params
+            block = 3 * n + num_alpha_params
+            betas = params[offset : offset + block * len(covariates)].reshape(-1, block)
+            effects = covariates.values(t) @ betas
+            pqm_effects = effects[:, : 3 * n].reshape(len(t), n, 3)
+            p_t = p_t + pqm_effects[..., 0]
+            q_t = q_t + pqm_effects[..., 1]
+            m_t = m_t + pqm_effects[..., 2]
+            alpha_t_flat = alpha_t_flat + effects[:, 3 * n :]
+
+        # Off-diagonal entries in row-major order, as in ``param_names``.
+        rows, cols = np.nonzero(~np.eye(n, dtype=bool))
+        alpha_t = np.zeros((len(t), n, n))
+        alpha_t[:, rows, cols] = alpha_t_flat
+        interaction = np.einsum("tij,tj->ti", alpha_t, y)
+
+        m_safe = np.where(m_t > 0, m_t, 1.0)
+        rates = (p_t + q_t * y / m_safe) * (m_t - y - interaction)
+        return B.array(np.where(m_t > 0, rates, 0.0))
 
     @property
     def params_(self) -> Dict[str, float]:
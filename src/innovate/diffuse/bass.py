@@ -1,9 +1,81 @@
 from innovate.base.base import DiffusionModel
 from innovate import backend
 from innovate.dynamics.growth.dual_influence import DualInfluenceGrowth
+from innovate.utils.covariates import prepare_covariates
+from innovate.fitters.diagnostics import record_ode_solve
+import sys
 from typing import Sequence, Dict
 import numpy as np
 
+# Initial cumulative adoption at the first requested time point.
+_BASS_Y0 = 1e-6
+
+
+def _bass_cumulative(t, t0, y0, p, q, m):
+    """
+    Closed-form solution of dy/dt = (p + q * y/m) * (m - y) with y(t0) = y0.
+
+    Written in terms of exp(-(p + q) * (t - t0)) so that it stays finite for
+    long horizons. For y0 = 0 and t0 = 0 it reduces to the textbook
+    m * (1 - e) / (1 + (q/p) * e).
+    """
+    B = backend.current_backend
+    m_safe = B.where(m > 0, m, 1.0)
+    f0 = y0 / m_safe
+    decay = B.exp(-(p + q) * (t - t0))
+    f = 1 - (p + q) * (1 - f0) * decay / (q * (1 - f0) * decay + p + q * f0)
+    # A non-positive market potential freezes the state, as in the ODE.
+    return B.where(m > 0, m_safe * f, y0 + 0 * f)
+
+
+def _bass_cumulative_partials(t, t0, y0, p, q, m):
+    """
+    Partial derivatives of :func:`_bass_cumulative` with respect to p, q, m and y0.
+
+    Returns a tuple ``(y, dy_dp, dy_dq, dy_dm, dy_dy0)`` of arrays shaped like
+    ``t``. Writing f = 1 - N / D with N = s * (1 - f0) * e and
+    D = q * (1 - f0) * e + p + q * f0, every partial follows from the
+    quotient rule on N and D.
+    """
+    B = backend.current_backend
+    valid = m > 0
+    m_safe = B.where(valid, m, 1.0)
+    s = p + q
+    tau = t - t0
+    f0 = y0 / m_safe
+    A = 1 - f0
+    e = B.exp(-s * tau)
+    N = s * A * e
+    D = q * A * e + p + q * f0
+    f = 1 - N / D
+
+    def df(dN, dD):
+        return -(dN * D - N * dD) / D**2
+
+    # d/dp and d/dq share the dependence through s = p + q.
+    dN_ds = A * e * (1 - s * tau)
+    df_dp = df(dN_ds, 1 - q * A * tau * e)
+    df_dq = df(dN_ds, A * e * (1 - q * tau) + f0)
+    # f0 = y0 / m, so d/dm enters through f0 and the leading factor m.
+    df_df0 = df(-s * e, q * (1 - e))
+    df_dm = df_df0 * (-y0 / m_safe**2)
+
+    zero = 0 * f
+    return (
+        B.where(valid, m_safe * f, y0 + zero),
+        B.where(valid, m_safe * df_dp, zero),
+        B.where(valid, m_safe * df_dq, zero),
+        B.where(valid, f + m_safe * df_dm, zero),
+        B.where(valid, df_df0, 1 + zero),
+    )
+
+
+def _bass_rate(y, p, q, m):
+    """Vectorized Bass adoption rate (p + q * y/m) * (m - y)."""
+    B = backend.current_backend
+    m_safe = B.where(m > 0, m, 1.0)
+    return B.where(m > 0, (p + q * (y / m_safe)) * (m_safe - y), 0.0 * y)
+
 
 class BassModel(DiffusionModel):
     """
@@ -11,17 +83,24 @@ class BassModel(DiffusionModel):
     This is a wrapper around the DualInfluenceGrowth dynamics model.
     """
 
-    def __init__(self, covariates: Sequence[str] = None, t_event: float = None):
+    def __init__(
+        self,
+        covariates: Sequence[str] = None,
+        t_event: float = None,
+        covariate_interpolation: str = "linear",
+    ):
         """
         Initialize the BassModel with optional covariates, a time event, and a DualInfluenceGrowth dynamics model.
 
         Parameters:
             covariates (Sequence[str], optional): List of covariate names to include in the model. Defaults to an empty list if not provided.
             t_event (float, optional): The time of a structural break or event. If provided, the model will fit separate parameters for the periods before and after this time.
+            covariate_interpolation (str, optional): How covariates are interpolated between time points during integration, either "linear" or "cubic".
         """
         self._params: Dict[str, float] = {}
         self.covariates = covariates if covariates else []
         self.t_event = t_event
+        self.covariate_interpolation = covariate_interpolation
         self.growth_model = DualInfluenceGrowth()
 
     @property
@@ -97,6 +176,10 @@ class BassModel(DiffusionModel):
         """
         Predicts cumulative adoption over time using the Bass diffusion model.
 
+        Without covariates the analytic Bass solution is evaluated directly,
+        piecewise around ``t_event`` when a structural break is set; with
+        covariates the differential equation is integrated numerically.
+
         Parameters:
             t (Sequence[float]): Sequence of time points at which to predict cumulative adoption.
             covariates (Dict[str, Sequence[float]], optional): Optional time series of covariate values affecting model parameters.
@@ -110,28 +193,290 @@ class BassModel(DiffusionModel):
         if not self._params:
             raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
 
-        y0 = 1e-6
+        params = [self._params[name] for name in self.param_names]
+        return self.evaluate(params, t, covariates)
+
+    def evaluate(
+        self,
+        params: Sequence[float],
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+    ) -> Sequence[float]:
+        """
+        Predicts cumulative adoption for explicit parameter values without touching ``params_``.
+
+        Parameters:
+            params (Sequence[float]): Parameter values in ``param_names`` order.
+            t (Sequence[float]): Time points at which to predict cumulative adoption.
+            covariates (Dict[str, Sequence[float]], optional): Optional time series of covariate values affecting model parameters.
+
+        Returns:
+            Sequence[float]: Predicted cumulative adoption at each time point in `t`.
+        """
+        values = dict(zip(self.param_names, params))
+        if self._use_closed_form(covariates):
+            return self._predict_closed_form(t, values)
+        return self._predict_ode(t, covariates, values)
+
+    @property
+    def supports_batch(self) -> bool:
+        """The closed-form solution broadcasts over batches of parameters."""
+        return self._use_closed_form()
+
+    def _use_closed_form(self, covariates=None) -> bool:
+        """Whether ``predict`` can use the analytic Bass solution."""
+        return not self.covariates and not covariates
+
+    def predict_many(
+        self, t: Sequence[float], params_matrix: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Predicts cumulative adoption for K parameter vectors at once.
+
+        Parameters:
+            t (Sequence[float]): Time points shared by every parameter vector.
+            params_matrix (Sequence[Sequence[float]]): Array of shape (K, P) with columns in ``param_names`` order.
+
+        Returns:
+            np.ndarray: Array of shape (K, len(t)). Without covariates the analytic
+            solution is broadcast over all rows in one pass; otherwise each row is
+            integrated separately.
+        """
+        if not self._use_closed_form():
+            return super().predict_many(t, params_matrix)
+        columns = self._params_columns(params_matrix)
+        return np.asarray(self._predict_closed_form(t, columns))
+
+    def _predict_closed_form(self, t: Sequence[float], params=None) -> Sequence[float]:
+        """
+        Evaluates the analytic solution of the Bass equation.
+
+        The trajectory starts from the same initial state as the ODE path
+        (``y0`` at the earliest time point). The solution is evaluated
+        elementwise, so ``t`` need not be sorted. With a structural break the pre-event solution
+        is evaluated at ``t_event`` and that state seeds the post-event
+        solution, which is equivalent to integrating across the switch.
+        ``params`` defaults to ``params_``; passing (K, 1) columns instead
+        broadcasts the evaluation to shape (K, len(t)). The result agrees with a tightly toleranced ``solve_ivp`` solution to
+        within 1e-6 relative error; the default LSODA path used by
+        :meth:`_predict_ode` is itself only accurate to about 1e-3.
+        """
+        B = backend.current_backend
+        params = self._params if params is None else params
+        t_arr = B.array(t)
+        t0 = t_arr.min(axis=-1, keepdims=True)
+        p, q, m = (params[name] for name in ("p", "q", "m"))
+        y_pre = _bass_cumulative(t_arr, t0, _BASS_Y0, p, q, m)
+        if self.t_event is None:
+            return y_pre
+
+        t_switch = B.where(self.t_event > t0, self.t_event, t0)
+        y_switch = _bass_cumulative(t_switch, t0, _BASS_Y0, p, q, m)
+        p_post, q_post, m_post = (
+            params[name] for name in ("p_post", "q_post", "m_post")
+        )
+        y_post = _bass_cumulative(t_arr, t_switch, y_switch, p_post, q_post, m_post)
+        return B.where(t_arr < self.t_event, y_pre, y_post)
+
+    def _trajectory_rate(
+        self,
+        t: Sequence[float],
+        y_pred,
+        covariates: Dict[str, Sequence[float]] = None,
+    ) -> Sequence[float]:
+        """
+        Adoption rate along a whole trajectory in one vectorized pass.
+
+        Equivalent to calling :meth:`differential_equation` at every point of
+        ``(t, y_pred)``, honouring ``t_event`` and covariate effects.
+        """
+        B = backend.current_backend
+        t_arr = B.array(t)
+        p, q, m = (self._params[name] for name in ("p", "q", "m"))
+        if self.t_event is not None:
+            pre = t_arr < self.t_event
+            p = B.where(pre, p, self._params["p_post"])
+            q = B.where(pre, q, self._params["q_post"])
+            m = B.where(pre, m, self._params["m_post"])
 
+        covariates = prepare_covariates(covariates, t, self.covariate_interpolation)
+        if covariates:
+            params = np.array([self._params[name] for name in self.param_names])
+            offset = self._covariate_offset
+            betas = params[offset : offset + 3 * len(covariates)].reshape(-1, 3)
+            effects = covariates.values(t) @ betas
+            p = p + effects[:, 0]
+            q = q + effects[:, 1]
+            m = m + effects[:, 2]
+        return _bass_rate(y_pred, p, q, m)
+
+    def _predict_ode(
+        self,
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+        params=None,
+    ) -> Sequence[float]:
+        """Integrates the Bass equation numerically (required for covariates)."""
         # This is a simplification. The predict method should use the growth model's
         # predict_cumulative method, which will require some refactoring of how parameters
         # are handled. For now, we will leave the old implementation.
         from scipy.integrate import solve_ivp
 
-        params = [self._params[name] for name in self.param_names]
+        values = self._params if params is None else params
+        params = np.array([values[name] for name in self.param_names])
+        covariates = prepare_covariates(covariates, t, self.covariate_interpolation)
 
-        def ode_func(t, y):
-            return self.differential_equation(t, y, params, covariates, t)
+        def ode_func(t_i, y):
+            return self.differential_equation(t_i, y, params, covariates, t)
 
         sol = solve_ivp(
             ode_func,
             (t[0], t[-1]),
-            [y0],
+            [_BASS_Y0],
             t_eval=t,
             method="LSODA",
             dense_output=True,
         )
+        record_ode_solve(sol.nfev)
         return sol.sol(t).flatten()
 
+    @property
+    def _covariate_offset(self) -> int:
+        """Index of the first ``beta_*`` coefficient in ``param_names``."""
+        return 6 if self.t_event is not None else 3
+
+    def jacobian(
+        self,
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+        params: Sequence[float] = None,
+    ) -> np.ndarray:
+        """
+        Returns the analytic Jacobian of :meth:`predict` with respect to the parameters.
+
+        Parameters:
+            t (Sequence[float]): Time points at which predictions are made.
+            covariates (Dict[str, Sequence[float]], optional): Covariate time series, as passed to :meth:`predict`.
+            params (Sequence[float], optional): Parameter values in ``param_names`` order. Defaults to ``params_``.
+
+        Returns:
+            np.ndarray: Array of shape ``(len(t), len(param_names))`` whose columns follow ``param_names``.
+        """
+        if params is None:
+            if not self._params:
+                raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
+            params = [self._params[name] for name in self.param_names]
+        values = dict(zip(self.param_names, params))
+        if self._use_closed_form(covariates):
+            return self._jacobian_closed_form(t, values)
+        return self._jacobian_ode(t, covariates, values)
+
+    def _jacobian_closed_form(self, t: Sequence[float], params) -> np.ndarray:
+        """
+        Differentiates the (piecewise) analytic solution.
+
+        Scalar ``params`` give shape (len(t), P); (K, 1) columns give
+        (K, len(t), P).
+        """
+        t_arr = np.asarray(t, dtype=float)
+        t0 = t_arr.min()
+        p, q, m = (params[name] for name in ("p", "q", "m"))
+        shape = np.shape(p)[:-1] + t_arr.shape
+        jac = np.zeros(shape + (len(self.param_names),))
+        _, *d_pre = _bass_cumulative_partials(t_arr, t0, _BASS_Y0, p, q, m)
+        jac[..., 0:3] = np.stack([np.broadcast_to(d, shape) for d in d_pre[:3]], -1)
+        if self.t_event is None:
+            return jac
+
+        # After the break the pre-event parameters act only through the
+        # state at the switch, y(t_switch).
+        t_switch = max(self.t_event, t0)
+        y_switch, *d_switch = _bass_cumulative_partials(t_switch, t0, _BASS_Y0, p, q, m)
+        p_post, q_post, m_post = (
+            params[name] for name in ("p_post", "q_post", "m_post")
+        )
+        _, *d_post = _bass_cumulative_partials(
+            t_arr, t_switch, y_switch, p_post, q_post, m_post
+        )
+        post = t_arr >= self.t_event
+        d_switch = np.stack(np.broadcast_arrays(*d_switch[:3]), axis=-1)
+        dy_switch = np.broadcast_to(d_post[3], shape)[..., post, None]
+        jac[..., post, 0:3] = dy_switch * d_switch
+        d_post = np.stack([np.broadcast_to(d, shape) for d in d_post[:3]], -1)
+        jac[..., post, 3:6] = d_post[..., post, :]
+        return jac
+
+    def jacobian_many(
+        self, t: Sequence[float], params_matrix: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Returns the analytic Jacobian for K parameter vectors at once.
+
+        Parameters:
+            t (Sequence[float]): Time points shared by every parameter vector.
+            params_matrix (Sequence[Sequence[float]]): Array of shape (K, P) with columns in ``param_names`` order.
+
+        Returns:
+            np.ndarray: Array of shape (K, len(t), P), matching :meth:`jacobian` row by row.
+        """
+        if not self._use_closed_form():
+            return super().jacobian_many(t, params_matrix)
+        return self._jacobian_closed_form(t, self._params_columns(params_matrix))
+
+    def _jacobian_ode(
+        self, t: Sequence[float], covariates: Dict[str, Sequence[float]], params
+    ) -> np.ndarray:
+        """
+        Integrates the forward sensitivity equations dS/dt = df/dy * S + df/dtheta.
+
+        One augmented solve yields the Jacobian for all parameters, instead of
+        one extra solve per parameter with finite differences.
+        """
+        from scipy.integrate import solve_ivp
+
+        params = np.array([params[name] for name in self.param_names])
+        n_params = len(params)
+        offset = self._covariate_offset
+        covariates = prepare_covariates(covariates, t, self.covariate_interpolation)
+
+        def augmented(t_i, z):
+            y = z[0]
+            post = self.t_event is not None and t_i >= self.t_event
+            base = 3 if post else 0
+            # d(p_t, q_t, m_t) / d(theta)
+            dbase = np.zeros((3, n_params))
+            dbase[:, base : base + 3] = np.eye(3)
+            p_t, q_t, m_t = params[base : base + 3]
+            if covariates:
+                for i, cov_val_t in enumerate(covariates(t_i)):
+                    idx = offset + 3 * i
+                    p_t += params[idx] * cov_val_t
+                    q_t += params[idx + 1] * cov_val_t
+                    m_t += params[idx + 2] * cov_val_t
+                    dbase[:, idx : idx + 3] = np.eye(3) * cov_val_t
+            if m_t <= 0:
+                return np.zeros_like(z)
+            rate = (p_t + q_t * (y / m_t)) * (m_t - y)
+            df_dy = q_t - p_t - 2 * q_t * y / m_t
+            df_dbase = np.array(
+                [m_t - y, (y / m_t) * (m_t - y), p_t + q_t * y**2 / m_t**2]
+            )
+            sens = df_dy * z[1:] + df_dbase @ dbase
+            return np.concatenate(([rate], sens))
+
+        z0 = np.zeros(1 + n_params)
+        z0[0] = _BASS_Y0
+        sol = solve_ivp(
+            augmented,
+            (t[0], t[-1]),
+            z0,
+            t_eval=t,
+            method="LSODA",
+            dense_output=True,
+        )
+        record_ode_solve(sol.nfev)
+        return sol.sol(t)[1:].T
+
     def differential_equation(self, t, y, params, covariates, t_eval):
         """
         Defines the Bass model's differential equation, incorporating covariate effects if provided.
@@ -142,7 +487,7 @@ class BassModel(DiffusionModel):
             t: Current time point.
             y: Current cumulative adoption value.
             params: Sequence of model parameters, including base and covariate coefficients.
-            covariates: Optional dictionary mapping covariate names to their time series values.
+            covariates: Optional dictionary mapping covariate names to their time series values, or a prepared ``CovariateInterpolant``.
             t_eval: Sequence of time points for covariate interpolation.
 
         Returns:
@@ -152,37 +497,32 @@ class BassModel(DiffusionModel):
             p_base = params[3]
             q_base = params[4]
             m_base = params[5]
-            param_idx_offset = 3
         else:
             p_base = params[0]
             q_base = params[1]
             m_base = params[2]
-            param_idx_offset = 0
 
         p_t = p_base
         q_t = q_base
         m_t = m_base
 
+        covariates = prepare_covariates(
+            covariates, t_eval, self.covariate_interpolation
+        )
         if covariates:
-            param_idx = 3 + param_idx_offset
-            for cov_name, cov_values in covariates.items():
-                cov_val_t = backend.current_backend.interp(t, t_eval, cov_values)
-
-                p_t += params[param_idx] * cov_val_t
-                q_t += params[param_idx + 1] * cov_val_t
-                m_t += params[param_idx + 2] * cov_val_t
-                param_idx += 3
+            cov_val_t = covariates(t)
+            offset = self._covariate_offset
+            betas = np.reshape(params[offset : offset + 3 * len(cov_val_t)], (-1, 3))
+            p_t, q_t, m_t = np.array([p_base, q_base, m_base]) + cov_val_t @ betas
 
         rate = (p_t + q_t * (y / m_t)) * (m_t - y)
-        try:
-            import pytensor.tensor as pt  # type: ignore
-
-            if isinstance(
-                m_t, pt.TensorVariable
-            ):  # pragma: no cover - depends on pytensor
-                return pt.switch(m_t > 0, rate, 0.0)
-        except Exception:
-            pass
+        # Symbolic parameters can only come from an already imported pytensor,
+        # so look it up instead of attempting the import on every evaluation
+        pt = sys.modules.get("pytensor.tensor")
+        if pt is not None and isinstance(
+            m_t, pt.TensorVariable
+        ):  # pragma: no cover - depends on pytensor
+            return pt.switch(m_t > 0, rate, 0.0)
         return backend.current_backend.where(m_t > 0, rate, 0.0)
 
     def score(
@@ -226,15 +566,7 @@ class BassModel(DiffusionModel):
             raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
 
         y_pred = self.predict(t, covariates)
-        params = [self._params[name] for name in self.param_names]
-
-        rates = np.array(
-            [
-                self.differential_equation(ti, yi, params, covariates, t)
-                for ti, yi in zip(t, y_pred)
-            ]
-        )
-        return rates
+        return self._trajectory_rate(t, y_pred, covariates)
 
     def cumulative_adoption(self, t: Sequence[float], *params) -> Sequence[float]:
         self.params_ = dict(zip(self.param_names, params))
@@ -1,9 +1,73 @@
 from innovate.base.base import DiffusionModel
 from innovate.backend import current_backend as B
 from innovate.dynamics.growth.skewed import SkewedGrowth
+from innovate.utils.covariates import prepare_covariates
+from innovate.fitters.diagnostics import record_ode_solve
+from innovate.utils.initializers import gompertz_initial_params
 from typing import Sequence, Dict
 import numpy as np
 
+# Initial cumulative adoption at the first requested time point.
+_GOMPERTZ_Y0 = 1e-6
+
+
+def _gompertz_cumulative(t, t0, y0, a, c):
+    """
+    Closed-form solution of dy/dt = c * y * (log(a) - log(y)) with y(t0) = y0.
+
+    log(y / a) decays exponentially at rate c, so
+    y(t) = a * exp(log(y0 / a) * exp(-c * (t - t0))).
+    """
+    a_safe = B.where(a > 0, a, 1.0)
+    y = a_safe * B.exp(B.log(y0 / a_safe) * B.exp(-c * (t - t0)))
+    # A non-positive ceiling freezes the state, as in SkewedGrowth.
+    return B.where(a > 0, y, y0 + 0 * y)
+
+
+def _gompertz_cumulative_partials(t, t0, y0, a, c):
+    """
+    Partial derivatives of :func:`_gompertz_cumulative` with respect to a, c and y0.
+
+    Returns a tuple ``(y, dy_da, dy_dc, dy_dy0)`` of arrays shaped like ``t``.
+    With g = exp(-c * (t - t0)) and log(y) = log(a) + log(y0 / a) * g the
+    partials are y * (1 - g) / a, -y * log(y0 / a) * g * (t - t0) and
+    y * g / y0.
+    """
+    valid = a > 0
+    a_safe = B.where(valid, a, 1.0)
+    tau = t - t0
+    g = B.exp(-c * tau)
+    log_ratio = B.log(y0 / a_safe)
+    y = a_safe * B.exp(log_ratio * g)
+    zero = 0 * y
+    return (
+        B.where(valid, y, y0 + zero),
+        B.where(valid, y * (1 - g) / a_safe, zero),
+        B.where(valid, -y * log_ratio * g * tau, zero),
+        B.where(valid, y * g / y0, 1 + zero),
+    )
+
+
+def _gompertz_rate(y, a, c):
+    """Vectorized Gompertz adoption rate c * y * (log(a) - log(y))."""
+    valid = (a > 0) & (y > 0)
+    a_safe = B.where(a > 0, a, 1.0)
+    y_safe = B.where(y > 0, y, 1.0)
+    return B.where(valid, c * y_safe * (B.log(a_safe) - B.log(y_safe)), 0.0 * y)
+
+
+def _running_max(y, t):
+    """Running maximum of ``y`` along its last axis, taken in time order of ``t``."""
+    y = np.asarray(y)
+    t = np.broadcast_to(np.asarray(t), y.shape)
+    if np.all(t[..., 1:] >= t[..., :-1]):
+        return np.maximum.accumulate(y, axis=-1)
+    order = np.argsort(t, axis=-1, kind="stable")
+    running = np.maximum.accumulate(np.take_along_axis(y, order, axis=-1), axis=-1)
+    out = np.empty_like(running)
+    np.put_along_axis(out, order, running, axis=-1)
+    return out
+
 
 class GompertzModel(DiffusionModel):
     """
@@ -11,15 +75,21 @@ class GompertzModel(DiffusionModel):
     This is a wrapper around the SkewedGrowth dynamics model.
     """
 
-    def __init__(self, covariates: Sequence[str] = None, t_event: float = None):
+    def __init__(
+        self,
+        covariates: Sequence[str] = None,
+        t_event: float = None,
+        covariate_interpolation: str = "linear",
+    ):
         """
         Initialize a Gompertz diffusion model with optional covariates.
 
-        Creates an empty parameter dictionary, stores the provided covariate names, and instantiates a SkewedGrowth dynamics model for growth rate computation.
+        Creates an empty parameter dictionary, stores the provided covariate names, and instantiates a SkewedGrowth dynamics model for growth rate computation. ``covariate_interpolation`` selects "linear" or "cubic" interpolation of covariates during integration.
         """
         self._params: Dict[str, float] = {}
         self.covariates = covariates if covariates else []
         self.t_event = t_event
+        self.covariate_interpolation = covariate_interpolation
         self.growth_model = SkewedGrowth()
 
     @property
@@ -40,17 +110,30 @@ class GompertzModel(DiffusionModel):
     def initial_guesses(
         self, t: Sequence[float], y: Sequence[float]
     ) -> Dict[str, float]:
-        guesses = {
-            "a": np.max(y) * 1.1,
-            "b": 1.0,
-            "c": 0.1,
-        }
+        """
+        Return data-driven starting values from the log-log linearisation of the data.
+
+        The ceiling ``a`` and rate ``c`` are estimated by
+        :func:`innovate.utils.initializers.gompertz_initial_params`, falling back to
+        fixed heuristics when the data admit no increasing linear fit.
+
+        Parameters:
+            t (Sequence[float]): Time points of the observed data.
+            y (Sequence[float]): Observed cumulative adoption values.
+
+        Returns:
+            Dict[str, float]: Dictionary mapping parameter names to initial values.
+        """
+        a, c = (float(v[0]) for v in gompertz_initial_params(t, y))
+        if not np.isfinite(c):
+            a, c = np.max(y) * 1.1, 0.1
+        guesses = {"a": a, "b": 1.0, "c": max(c, 1e-6)}
         if self.t_event is not None:
             guesses.update(
                 {
-                    "a_post": np.max(y) * 1.1,
+                    "a_post": guesses["a"],
                     "b_post": 1.0,
-                    "c_post": 0.1,
+                    "c_post": guesses["c"],
                 }
             )
         for cov in self.covariates:
@@ -97,6 +180,10 @@ class GompertzModel(DiffusionModel):
         """
         Predicts cumulative adoption values at specified times using the fitted Gompertz diffusion model.
 
+        Without covariates the analytic solution is evaluated directly, piecewise
+        around ``t_event`` when a structural break is set; with covariates the
+        differential equation is integrated numerically.
+
         Parameters:
             t (Sequence[float]): Time points at which to predict cumulative adoption.
             covariates (Dict[str, Sequence[float]], optional): Time series of covariate values affecting the model parameters.
@@ -110,17 +197,135 @@ class GompertzModel(DiffusionModel):
         if not self._params:
             raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
 
+        params = [self._params[name] for name in self.param_names]
+        return self.evaluate(params, t, covariates)
+
+    def evaluate(
+        self,
+        params: Sequence[float],
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+    ) -> Sequence[float]:
+        """
+        Predicts cumulative adoption for explicit parameter values without touching ``params_``.
+
+        Parameters:
+            params (Sequence[float]): Parameter values in ``param_names`` order.
+            t (Sequence[float]): Time points at which to predict cumulative adoption.
+            covariates (Dict[str, Sequence[float]], optional): Time series of covariate values affecting the model parameters.
+
+        Returns:
+            Sequence[float]: Predicted cumulative adoption values at each time point.
+        """
+        values = dict(zip(self.param_names, params))
+        if self._use_closed_form(covariates):
+            y_pred = self._predict_closed_form(t, values)
+        else:
+            y_pred = self._predict_ode(t, covariates, values)
+        return _running_max(y_pred, t)
+
+    @property
+    def supports_batch(self) -> bool:
+        """The closed-form solution broadcasts over batches of parameters."""
+        return self._use_closed_form()
+
+    def _use_closed_form(self, covariates=None) -> bool:
+        """Whether ``predict`` can use the analytic Gompertz solution."""
+        return not self.covariates and not covariates
+
+    def predict_many(
+        self, t: Sequence[float], params_matrix: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Predicts cumulative adoption for K parameter vectors at once.
+
+        Parameters:
+            t (Sequence[float]): Time points shared by every parameter vector.
+            params_matrix (Sequence[Sequence[float]]): Array of shape (K, P) with columns in ``param_names`` order.
+
+        Returns:
+            np.ndarray: Array of shape (K, len(t)). Without covariates the analytic
+            solution is broadcast over all rows in one pass; otherwise each row is
+            integrated separately.
+        """
+        if not self._use_closed_form():
+            return super().predict_many(t, params_matrix)
+        columns = self._params_columns(params_matrix)
+        return _running_max(self._predict_closed_form(t, columns), t)
+
+    def _predict_closed_form(self, t: Sequence[float], params=None) -> Sequence[float]:
+        """
+        Evaluates the analytic solution of the Gompertz equation.
+
+        The trajectory starts from ``y0`` at the earliest time point like the
+        ODE path, and is evaluated elementwise, so ``t`` need not be sorted. With a
+        structural break the pre-event state at ``t_event`` seeds the
+        post-event solution, so no integration across the switch is needed.
+        ``params`` defaults to ``params_``; passing (K, 1) columns instead
+        broadcasts the evaluation to shape (K, len(t)).
+        """
+        params = self._params if params is None else params
+        t_arr = B.array(t)
+        t0 = t_arr.min(axis=-1, keepdims=True)
+        a, c = params["a"], params["c"]
+        y_pre = _gompertz_cumulative(t_arr, t0, _GOMPERTZ_Y0, a, c)
+        if self.t_event is None:
+            return y_pre
+
+        t_switch = B.where(self.t_event > t0, self.t_event, t0)
+        y_switch = _gompertz_cumulative(t_switch, t0, _GOMPERTZ_Y0, a, c)
+        a_post, c_post = params["a_post"], params["c_post"]
+        y_post = _gompertz_cumulative(t_arr, t_switch, y_switch, a_post, c_post)
+        return B.where(t_arr < self.t_event, y_pre, y_post)
+
+    def _trajectory_rate(
+        self,
+        t: Sequence[float],
+        y_pred,
+        covariates: Dict[str, Sequence[float]] = None,
+    ) -> Sequence[float]:
+        """
+        Adoption rate along a whole trajectory in one vectorized pass.
+
+        Equivalent to calling :meth:`differential_equation` at every point of
+        ``(t, y_pred)``, honouring ``t_event`` and covariate effects.
+        """
+        a, c = self._params["a"], self._params["c"]
+        if self.t_event is not None:
+            pre = B.array(t) < self.t_event
+            a = B.where(pre, a, self._params["a_post"])
+            c = B.where(pre, c, self._params["c_post"])
+
+        covariates = prepare_covariates(covariates, t, self.covariate_interpolation)
+        if covariates:
+            params = np.array([self._params[name] for name in self.param_names])
+            offset = self._covariate_offset
+            betas = params[offset : offset + 3 * len(covariates)].reshape(-1, 3)
+            effects = covariates.values(t) @ betas
+            a = a + effects[:, 0]
+            c = c + effects[:, 2]
+        return _gompertz_rate(y_pred, a, c)
+
+    def _predict_ode(
+        self,
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+        params=None,
+    ) -> Sequence[float]:
+        """Integrates the Gompertz equation numerically (required for covariates)."""
         # This is a simplification. The predict method should use the growth model's
         # predict_cumulative method, which will require some refactoring of how parameters
         # are handled. For now, we will leave the old implementation.
         from scipy.integrate import solve_ivp
 
-        params = [self._params[name] for name in self.param_names]
+        values = self._params if params is None else params
+        params = np.array([values[name] for name in self.param_names])
+        covariates = prepare_covariates(covariates, t, self.covariate_interpolation)
 
-        def ode_func(t, y):
-            return self.differential_equation(t, y, params, covariates, t)
+        def ode_func(t_i, y):
+            return self.differential_equation(t_i, y, params, covariates, t)
 
-        y0 = [1e-6]
+        y0 = [_GOMPERTZ_Y0]
         sol = solve_ivp(
             ode_func,
             (t[0], t[-1]),
@@ -129,8 +334,144 @@ class GompertzModel(DiffusionModel):
             method="LSODA",
             dense_output=True,
         )
-        y_pred = sol.sol(t).flatten()
-        return np.maximum.accumulate(y_pred)
+        record_ode_solve(sol.nfev)
+        return sol.sol(t).flatten()
+
+    @property
+    def _covariate_offset(self) -> int:
+        """Index of the first ``beta_*`` coefficient in ``param_names``."""
+        return 6 if self.t_event is not None else 3
+
+    def jacobian(
+        self,
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+        params: Sequence[float] = None,
+    ) -> np.ndarray:
+        """
+        Returns the analytic Jacobian of :meth:`predict` with respect to the parameters.
+
+        Parameters:
+            t (Sequence[float]): Time points at which predictions are made.
+            covariates (Dict[str, Sequence[float]], optional): Covariate time series, as passed to :meth:`predict`.
+            params (Sequence[float], optional): Parameter values in ``param_names`` order. Defaults to ``params_``.
+
+        Returns:
+            np.ndarray: Array of shape ``(len(t), len(param_names))`` whose columns follow ``param_names``.
+            The ``b`` columns are zero because ``b`` does not enter the differential equation.
+        """
+        if params is None:
+            if not self._params:
+                raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
+            params = [self._params[name] for name in self.param_names]
+        values = dict(zip(self.param_names, params))
+        if self._use_closed_form(covariates):
+            return self._jacobian_closed_form(t, values)
+        return self._jacobian_ode(t, covariates, values)
+
+    def _jacobian_closed_form(self, t: Sequence[float], params) -> np.ndarray:
+        """
+        Differentiates the (piecewise) analytic solution.
+
+        Scalar ``params`` give shape (len(t), P); (K, 1) columns give
+        (K, len(t), P).
+        """
+        t_arr = np.asarray(t, dtype=float)
+        t0 = t_arr.min()
+        a, c = params["a"], params["c"]
+        batch = np.shape(a)[:-1]
+        jac = np.zeros(batch + (len(t_arr), len(self.param_names)))
+        _, da, dc, _ = _gompertz_cumulative_partials(t_arr, t0, _GOMPERTZ_Y0, a, c)
+        jac[..., 0] = da
+        jac[..., 2] = dc
+        if self.t_event is None:
+            return jac
+
+        # After the break the pre-event parameters act only through the
+        # state at the switch, y(t_switch).
+        t_switch = max(self.t_event, t0)
+        y_switch, da_switch, dc_switch, _ = _gompertz_cumulative_partials(
+            t_switch, t0, _GOMPERTZ_Y0, a, c
+        )
+        _, da_post, dc_post, dy_switch = _gompertz_cumulative_partials(
+            t_arr, t_switch, y_switch, params["a_post"], params["c_post"]
+        )
+        post = t_arr >= self.t_event
+        dy_switch = np.broadcast_to(dy_switch, jac.shape[:-1])
+        jac[..., post, 0] = dy_switch[..., post] * da_switch
+        jac[..., post, 2] = dy_switch[..., post] * dc_switch
+        jac[..., post, 3] = np.broadcast_to(da_post, jac.shape[:-1])[..., post]
+        jac[..., post, 5] = np.broadcast_to(dc_post, jac.shape[:-1])[..., post]
+        return jac
+
+    def jacobian_many(
+        self, t: Sequence[float], params_matrix: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Returns the analytic Jacobian for K parameter vectors at once.
+
+        Parameters:
+            t (Sequence[float]): Time points shared by every parameter vector.
+            params_matrix (Sequence[Sequence[float]]): Array of shape (K, P) with columns in ``param_names`` order.
+
+        Returns:
+            np.ndarray: Array of shape (K, len(t), P), matching :meth:`jacobian` row by row.
+        """
+        if not self._use_closed_form():
+            return super().jacobian_many(t, params_matrix)
+        return self._jacobian_closed_form(t, self._params_columns(params_matrix))
+
+    def _jacobian_ode(
+        self, t: Sequence[float], covariates: Dict[str, Sequence[float]], params
+    ) -> np.ndarray:
+        """
+        Integrates the forward sensitivity equations dS/dt = df/dy * S + df/dtheta.
+
+        One augmented solve yields the Jacobian for all parameters, instead of
+        one extra solve per parameter with finite differences.
+        """
+        from scipy.integrate import solve_ivp
+
+        params = np.array([params[name] for name in self.param_names])
+        n_params = len(params)
+        offset = self._covariate_offset
+        covariates = prepare_covariates(covariates, t, self.covariate_interpolation)
+
+        def augmented(t_i, z):
+            y = z[0]
+            post = self.t_event is not None and t_i >= self.t_event
+            base = 3 if post else 0
+            # d(a_t, b_t, c_t) / d(theta)
+            dbase = np.zeros((3, n_params))
+            dbase[:, base : base + 3] = np.eye(3)
+            a_t, _, c_t = params[base : base + 3]
+            if covariates:
+                for i, cov_val_t in enumerate(covariates(t_i)):
+                    idx = offset + 3 * i
+                    a_t += params[idx] * cov_val_t
+                    c_t += params[idx + 2] * cov_val_t
+                    dbase[:, idx : idx + 3] = np.eye(3) * cov_val_t
+            if a_t <= 0 or y <= 0:
+                return np.zeros_like(z)
+            log_gap = np.log(a_t) - np.log(y)
+            rate = c_t * y * log_gap
+            df_dy = c_t * (log_gap - 1)
+            df_dbase = np.array([c_t * y / a_t, 0.0, y * log_gap])
+            sens = df_dy * z[1:] + df_dbase @ dbase
+            return np.concatenate(([rate], sens))
+
+        z0 = np.zeros(1 + n_params)
+        z0[0] = _GOMPERTZ_Y0
+        sol = solve_ivp(
+            augmented,
+            (t[0], t[-1]),
+            z0,
+            t_eval=t,
+            method="LSODA",
+            dense_output=True,
+        )
+        record_ode_solve(sol.nfev)
+        return sol.sol(t)[1:].T
 
     def differential_equation(self, t, y, params, covariates, t_eval):
         """
@@ -140,7 +481,7 @@ class GompertzModel(DiffusionModel):
             t (float): Current time point.
             y (float): Current cumulative adoption value.
             params (Sequence[float]): Model parameters, including base and covariate coefficients.
-            covariates (dict or None): Optional mapping of covariate names to their time series values.
+            covariates (dict or None): Optional mapping of covariate names to their time series values, or a prepared ``CovariateInterpolant``.
             t_eval (Sequence[float]): Time points corresponding to covariate values.
 
         Returns:
@@ -150,26 +491,23 @@ class GompertzModel(DiffusionModel):
             a_base = params[3]
             b_base = params[4]
             c_base = params[5]
-            param_idx_offset = 3
         else:
             a_base = params[0]
             b_base = params[1]
             c_base = params[2]
-            param_idx_offset = 0
 
         a_t = a_base
         b_t = b_base
         c_t = c_base
 
+        covariates = prepare_covariates(
+            covariates, t_eval, self.covariate_interpolation
+        )
         if covariates:
-            param_idx = 3 + param_idx_offset
-            for cov_name, cov_values in covariates.items():
-                cov_val_t = np.interp(t, t_eval, cov_values)
-
-                a_t += params[param_idx] * cov_val_t
-                b_t += params[param_idx + 1] * cov_val_t
-                c_t += params[param_idx + 2] * cov_val_t
-                param_idx += 3
+            cov_val_t = covariates(t)
+            offset = self._covariate_offset
+            betas = np.reshape(params[offset : offset + 3 * len(cov_val_t)], (-1, 3))
+            a_t, b_t, c_t = np.array([a_base, b_base, c_base]) + cov_val_t @ betas
 
         return self.growth_model.compute_growth_rate(
             y, a_t, t=t, shape_b=b_t, shape_c=c_t
@@ -217,15 +555,7 @@ class GompertzModel(DiffusionModel):
             raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
 
         y_pred = self.predict(t, covariates)
-        params = [self._params[name] for name in self.param_names]
-
-        rates = np.array(
-            [
-                self.differential_equation(ti, yi, params, covariates, t)
-                for ti, yi in zip(t, y_pred)
-            ]
-        )
-        return rates
+        return self._trajectory_rate(t, y_pred, covariates)
 
     def cumulative_adoption(self, t: Sequence[float], *params) -> Sequence[float]:
         self.params_ = dict(zip(self.param_names, params))
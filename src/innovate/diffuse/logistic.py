@@ -1,10 +1,18 @@
 from innovate.base.base import DiffusionModel
 from innovate import backend
 from innovate.dynamics.growth.symmetric import SymmetricGrowth
+from innovate.utils.initializers import logistic_initial_params
 from typing import Sequence, Dict
 import numpy as np
 
 
+def _logistic_partials(t, L, k, x0):
+    """Partial derivatives of L / (1 + exp(-k * (t - x0))) with respect to L, k and x0."""
+    sigma = 1 / (1 + np.exp(-k * (t - x0)))
+    slope = L * sigma * (1 - sigma)
+    return sigma, slope * (t - x0), -slope * k
+
+
 class LogisticModel(DiffusionModel):
     """
     Implementation of the Logistic Diffusion Model.
@@ -42,17 +50,28 @@ class LogisticModel(DiffusionModel):
     def initial_guesses(
         self, t: Sequence[float], y: Sequence[float]
     ) -> Dict[str, float]:
-        guesses = {
-            "L": np.max(y) * 1.1,
-            "k": 0.1,
-            "x0": np.median(t),
-        }
+        """
+        Return data-driven starting values from the logit linearisation of the data.
+
+        Falls back to fixed heuristics when the data admit no increasing linear fit.
+
+        Parameters:
+            t (Sequence[float]): Time points of the observations.
+            y (Sequence[float]): Observed values corresponding to each time point.
+
+        Returns:
+            Dict[str, float]: Dictionary mapping parameter names to initial values.
+        """
+        L, k, x0 = (float(v[0]) for v in logistic_initial_params(t, y))
+        if not np.isfinite(k):
+            L, k, x0 = np.max(y) * 1.1, 0.1, np.median(t)
+        guesses = {"L": L, "k": max(k, 1e-6), "x0": x0}
         if self.t_event is not None:
             guesses.update(
                 {
-                    "L_post": np.max(y) * 1.1,
-                    "k_post": 0.1,
-                    "x0_post": np.median(t),
+                    "L_post": guesses["L"],
+                    "k_post": guesses["k"],
+                    "x0_post": guesses["x0"],
                 }
             )
         for cov in self.covariates:
@@ -110,46 +129,177 @@ class LogisticModel(DiffusionModel):
         if not self._params:
             raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
 
-        t_arr = backend.current_backend.array(t)
+        params = [self._params[name] for name in self.param_names]
+        return self.evaluate(params, t, covariates)
 
-        if self.t_event is not None:
-            pre_event_mask = t_arr < self.t_event
-            post_event_mask = ~pre_event_mask
+    def evaluate(
+        self,
+        params: Sequence[float],
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+    ) -> Sequence[float]:
+        """
+        Predicts cumulative values for explicit parameter values without touching ``params_``.
 
-            y_pred = backend.current_backend.zeros_like(t_arr)
+        Parameters:
+            params (Sequence[float]): Parameter values in ``param_names`` order.
+            t (Sequence[float]): Time points at which to compute predictions.
+            covariates (Dict[str, Sequence[float]], optional): Covariate values for each time point.
 
-            if backend.current_backend.any(pre_event_mask):
-                L = self._params["L"]
-                k = self._params["k"]
-                x0 = self._params["x0"]
-                y_pred[pre_event_mask] = L / (
-                    1 + backend.current_backend.exp(-k * (t_arr[pre_event_mask] - x0))
-                )
+        Returns:
+            Sequence[float]: Predicted cumulative values of the logistic model at each time point.
+        """
+        values = dict(zip(self.param_names, params))
+        t_arr = backend.current_backend.array(t)
 
-            if backend.current_backend.any(post_event_mask):
-                L = self._params["L_post"]
-                k = self._params["k_post"]
-                x0 = self._params["x0_post"]
-                y_pred[post_event_mask] = L / (
-                    1 + backend.current_backend.exp(-k * (t_arr[post_event_mask] - x0))
+        if self.t_event is not None:
+            y_pre = values["L"] / (
+                1 + backend.current_backend.exp(-values["k"] * (t_arr - values["x0"]))
+            )
+            y_post = values["L_post"] / (
+                1
+                + backend.current_backend.exp(
+                    -values["k_post"] * (t_arr - values["x0_post"])
                 )
+            )
+            return backend.current_backend.where(t_arr < self.t_event, y_pre, y_post)
 
-            return y_pred
-
-        L = self._params["L"]
-        k = self._params["k"]
-        x0 = self._params["x0"]
+        L = values["L"]
+        k = values["k"]
+        x0 = values["x0"]
 
         if covariates:
             for cov_name, cov_values in covariates.items():
                 cov_val_t = backend.current_backend.interp(t, t, cov_values)
 
-                L += self._params[f"beta_L_{cov_name}"] * cov_val_t
-                k += self._params[f"beta_k_{cov_name}"] * cov_val_t
-                x0 += self._params[f"beta_x0_{cov_name}"] * cov_val_t
+                L += values[f"beta_L_{cov_name}"] * cov_val_t
+                k += values[f"beta_k_{cov_name}"] * cov_val_t
+                x0 += values[f"beta_x0_{cov_name}"] * cov_val_t
 
         return L / (1 + backend.current_backend.exp(-k * (t_arr - x0)))
 
+    @property
+    def supports_batch(self) -> bool:
+        """The closed-form solution broadcasts over batches of parameters."""
+        return self._use_closed_form()
+
+    def _use_closed_form(self, covariates=None) -> bool:
+        """Whether :meth:`evaluate` reduces to the plain logistic curve."""
+        return not self.covariates and not covariates
+
+    def predict_many(
+        self, t: Sequence[float], params_matrix: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Predicts cumulative values for K parameter vectors at once.
+
+        Parameters:
+            t (Sequence[float]): Time points shared by every parameter vector.
+            params_matrix (Sequence[Sequence[float]]): Array of shape (K, P) with columns in ``param_names`` order.
+
+        Returns:
+            np.ndarray: Array of shape (K, len(t)), matching :meth:`predict` without covariates row by row.
+        """
+        params = self._params_columns(params_matrix)
+        t_arr = np.asarray(t, dtype=float)
+        y_pred = params["L"] / (1 + np.exp(-params["k"] * (t_arr - params["x0"])))
+        if self.t_event is None:
+            return y_pred
+        y_post = params["L_post"] / (
+            1 + np.exp(-params["k_post"] * (t_arr - params["x0_post"]))
+        )
+        return np.where(t_arr < self.t_event, y_pred, y_post)
+
+    def jacobian_many(
+        self, t: Sequence[float], params_matrix: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Returns the analytic Jacobian of :meth:`predict_many` for K parameter vectors at once.
+
+        Parameters:
+            t (Sequence[float]): Time points shared by every parameter vector.
+            params_matrix (Sequence[Sequence[float]]): Array of shape (K, P) with columns in ``param_names`` order.
+
+        Returns:
+            np.ndarray: Array of shape (K, len(t), P), matching :meth:`jacobian` without covariates row by row.
+        """
+        params = self._params_columns(params_matrix)
+        t_arr = np.asarray(t, dtype=float)
+        names = list(self.param_names)
+        shape = (len(params["L"]), len(t_arr))
+        jac = np.zeros(shape + (len(names),))
+        post = (
+            t_arr >= self.t_event
+            if self.t_event is not None
+            else np.zeros(t_arr.shape, dtype=bool)
+        )
+        suffixes = [(~post, "")] + (
+            [(post, "_post")] if self.t_event is not None else []
+        )
+        for rows, suffix in suffixes:
+            L, k, x0 = (params[f"{name}{suffix}"] for name in ("L", "k", "x0"))
+            cols = [names.index(f"{name}{suffix}") for name in ("L", "k", "x0")]
+            partials = _logistic_partials(t_arr, L, k, x0)
+            for col, partial in zip(cols, partials):
+                jac[:, rows, col] = np.broadcast_to(partial, shape)[:, rows]
+        return jac
+
+    def jacobian(
+        self,
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+        params: Sequence[float] = None,
+    ) -> np.ndarray:
+        """
+        Returns the analytic Jacobian of :meth:`predict` with respect to the parameters.
+
+        Parameters:
+            t (Sequence[float]): Time points at which predictions are made.
+            covariates (Dict[str, Sequence[float]], optional): Covariate values for each time point.
+            params (Sequence[float], optional): Parameter values in ``param_names`` order. Defaults to ``params_``.
+
+        Returns:
+            np.ndarray: Array of shape ``(len(t), len(param_names))`` whose columns follow ``param_names``.
+        """
+        if params is None:
+            if not self._params:
+                raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
+            params = [self._params[name] for name in self.param_names]
+        values = dict(zip(self.param_names, params))
+
+        t_arr = np.asarray(t, dtype=float)
+        names = list(self.param_names)
+        jac = np.zeros((len(t_arr), len(names)))
+
+        if self.t_event is not None:
+            post = t_arr >= self.t_event
+            for rows, suffix in ((~post, ""), (post, "_post")):
+                L, k, x0 = (values[f"{name}{suffix}"] for name in ("L", "k", "x0"))
+                cols = [names.index(f"{name}{suffix}") for name in ("L", "k", "x0")]
+                partials = _logistic_partials(t_arr[rows], L, k, x0)
+                jac[np.ix_(rows, cols)] = np.stack(partials, axis=-1)
+            return jac
+
+        L, k, x0 = values["L"], values["k"], values["x0"]
+        if covariates:
+            for cov_name, cov_values in covariates.items():
+                cov_values = np.asarray(cov_values, dtype=float)
+                L = L + values[f"beta_L_{cov_name}"] * cov_values
+                k = k + values[f"beta_k_{cov_name}"] * cov_values
+                x0 = x0 + values[f"beta_x0_{cov_name}"] * cov_values
+
+        partials = np.stack(
+            np.broadcast_arrays(*_logistic_partials(t_arr, L, k, x0)), axis=-1
+        )
+        jac[:, 0:3] = partials
+        if covariates:
+            for cov_name, cov_values in covariates.items():
+                cols = [
+                    names.index(f"beta_{name}_{cov_name}") for name in ("L", "k", "x0")
+                ]
+                jac[:, cols] = partials * np.asarray(cov_values, dtype=float)[:, None]
+        return jac
+
     def score(
         self,
         t: Sequence[float],
@@ -218,18 +368,21 @@ class LogisticModel(DiffusionModel):
             self.params_ = dict(zip(self.param_names, params))
         return self.predict(t)
 
+    @property
+    def _covariate_offset(self) -> int:
+        """Index of the first ``beta_*`` coefficient in ``param_names``."""
+        return 6 if self.t_event is not None else 3
+
     def differential_equation(self, t, y, params, covariates, t_eval):
         """Differential equation for the logistic model."""
         if self.t_event is not None and t >= self.t_event:
             L, k, x0 = params[3], params[4], params[5]
-            param_idx_offset = 3
         else:
             L, k, x0 = params[0], params[1], params[2]
-            param_idx_offset = 0
 
         if covariates:
-            param_idx = 3 + param_idx_offset
-            for cov_name, cov_values in covariates.items():
+            param_idx = self._covariate_offset
+            for cov_values in covariates.values():
                 cov_val_t = backend.current_backend.interp(t, t_eval, cov_values)
                 L += params[param_idx] * cov_val_t
                 k += params[param_idx + 1] * cov_val_t
@@ -3,6 +3,7 @@
 import numpy as np
 from typing import Sequence, Dict
 from innovate.base.base import DiffusionModel
+from innovate.utils.sensitivity import sse_and_gradient
 
 
 class ComplementaryGoodsModel(DiffusionModel):
@@ -24,18 +25,39 @@ class ComplementaryGoodsModel(DiffusionModel):
             "c2",  # Influence of good 1 on good 2
         ]
 
-    def differential_equation(self, y, t):
+    def differential_equation(self, y, t, params=None):
         y1, y2 = y
-        k1, k2, c1, c2 = (
-            self._params["k1"],
-            self._params["k2"],
-            self._params["c1"],
-            self._params["c2"],
-        )
+        if params is None:
+            params = [self._params[name] for name in self.param_names]
+        k1, k2, c1, c2 = params
         dy1_dt = k1 * y1 * (1 - y1) + c1 * y1 * y2
         dy2_dt = k2 * y2 * (1 - y2) + c2 * y1 * y2
         return [dy1_dt, dy2_dt]
 
+    def ode_jacobians(self, y, t, params):
+        """
+        Jacobians of the right-hand side for the forward sensitivity equations.
+
+        Returns:
+            A tuple with the derivatives with respect to (y1, y2), of shape
+            (2, 2), and with respect to (k1, k2, c1, c2), of shape (2, 4).
+        """
+        y1, y2 = y
+        k1, k2, c1, c2 = params
+        d_state = np.array(
+            [
+                [k1 * (1 - 2 * y1) + c1 * y2, c1 * y1],
+                [c2 * y2, k2 * (1 - 2 * y2) + c2 * y1],
+            ]
+        )
+        d_params = np.array(
+            [
+                [y1 * (1 - y1), 0.0, y1 * y2, 0.0],
+                [0.0, y2 * (1 - y2), 0.0, y1 * y2],
+            ]
+        )
+        return d_state, d_params
+
     def predict(self, t: Sequence[float], y0: Sequence[float]) -> np.ndarray:
         """
         Predicts the adoption of both goods over time.
@@ -51,6 +73,9 @@ class ComplementaryGoodsModel(DiffusionModel):
     def fit(self, t: Sequence[float], y: np.ndarray, **kwargs):
         """
         Fits the model to the data.
+
+        The gradient of the squared-error objective comes from the forward
+        sensitivity equations, so each optimizer step costs one ODE solve.
         """
         from scipy.optimize import minimize
 
@@ -61,9 +86,14 @@ class ComplementaryGoodsModel(DiffusionModel):
         y0 = y[0, :]
 
         def objective(params, t, y):
-            self.params_ = dict(zip(self.param_names, params))
-            y_pred = self.predict(t, y0)
-            return np.sum((y - y_pred) ** 2)
+            return sse_and_gradient(
+                self.differential_equation,
+                self.ode_jacobians,
+                y0,
+                t,
+                params,
+                y,
+            )
 
         initial_params = list(self.initial_guesses(t, y).values())
         param_bounds = list(self.bounds(t, y).values())
@@ -74,6 +104,7 @@ class ComplementaryGoodsModel(DiffusionModel):
             args=(t, y),
             bounds=param_bounds,
             method="L-BFGS-B",
+            jac=True,
             **kwargs,
         )
 
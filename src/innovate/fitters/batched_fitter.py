@@ -1,15 +1,142 @@
-from typing import Sequence
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence
+import numpy as np
 from innovate.base.base import DiffusionModel
 from innovate.backend import current_backend as B
+from innovate.fitters.diagnostics import FitDiagnostics
+from innovate.fitters.mom_fitter import bass_mom_initial_guesses
+
+# Per-process state installed by ``_init_worker`` so that tasks only need to
+# carry series indices.
+_WORKER_STATE = {}
+
+
+def _fit_series(model: DiffusionModel, fitter, t, y, p0=None):
+    """Fits a fresh instance of ``type(model)`` to one series.
+
+    Returns the fitted parameters and the fit's diagnostics record, if the
+    fitter produced one.
+    """
+    model_instance = type(model)()
+    if p0 is None:
+        p0 = list(model_instance.initial_guesses(t, y).values())
+    else:
+        p0 = list(p0)
+    bounds = list(zip(*model_instance.bounds(t, y).values()))
+    fitter.fit(model_instance, t, y, p0=p0, bounds=bounds)
+    diagnostics = getattr(model_instance, "diagnostics_", None)
+    return list(model_instance.params_.values()), diagnostics
+
+
+def _attach_shared(spec):
+    name, shape, dtype = spec
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers with the resource tracker. Pool
+        # workers share the parent's tracker under every start method, so
+        # the duplicate registration is a no-op; unregistering here would
+        # drop the parent's own entry before it unlinks the block.
+        shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _is_rectangular(batch) -> bool:
+    if isinstance(batch, np.ndarray):
+        return batch.ndim == 2
+    lengths = {len(series) for series in batch}
+    return len(lengths) == 1
+
+
+def _to_shared(batch):
+    """Copies a rectangular batch into a new shared memory block."""
+    array = np.ascontiguousarray(batch, dtype=float)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return (shm.name, array.shape, array.dtype.str), shm
+
+
+def _init_worker(model, fitter, t_data, y_data, shared, starts):
+    """Installs the model, fitter and data once per worker process."""
+    _WORKER_STATE.update(model=model, fitter=fitter, starts=starts, handles=[])
+    if shared:
+        for key, spec in (("t", t_data), ("y", y_data)):
+            shm, array = _attach_shared(spec)
+            _WORKER_STATE["handles"].append(shm)
+            _WORKER_STATE[key] = array
+    else:
+        _WORKER_STATE["t"] = t_data
+        _WORKER_STATE["y"] = y_data
+
+
+def _fit_chunk(indices: Sequence[int]):
+    """Fits the series at ``indices``, returning ``(params, error, diagnostics)``."""
+    state = _WORKER_STATE
+    results = []
+    for i in indices:
+        try:
+            params, diagnostics = _fit_series(
+                state["model"],
+                state["fitter"],
+                state["t"][i],
+                state["y"][i],
+                state["starts"][i],
+            )
+            results.append((params, None, diagnostics))
+        except Exception as e:
+            results.append((None, e, None))
+    return results
 
 
 class BatchedFitter:
-    """A fitter class for fitting a model to multiple datasets in a batch."""
+    """A fitter class for fitting a model to multiple datasets in a batch.
+
+    Args:
+        model: The model whose type is fitted to every dataset.
+        fitter: The fitter used for each individual dataset.
+        n_workers: Number of worker processes. ``None`` or ``1`` fits the
+            datasets serially in the current process.
+        chunksize: Number of datasets sent to a worker per task.
+        errors: ``"raise"`` to propagate the first failure, or ``"capture"``
+            to record it in ``fit_errors`` and fill that row of
+            ``fitted_params`` with NaN.
+        mp_context: Start method for the worker processes (e.g. ``"spawn"``),
+            or ``None`` for the platform default.
+        warm_start: If True and the model is a BassModel, every series starts
+            from its Method of Moments estimate, computed for the whole batch
+            at once, wherever that estimate is valid.
 
-    def __init__(self, model: DiffusionModel, fitter):
+    After :meth:`fit`, ``diagnostics`` holds the per-series
+    :class:`~innovate.fitters.diagnostics.FitDiagnostics` recorded by
+    ``fitter`` (None for failed series or fitters without diagnostics).
+    """
+
+    def __init__(
+        self,
+        model: DiffusionModel,
+        fitter,
+        n_workers: Optional[int] = None,
+        chunksize: int = 1,
+        errors: str = "raise",
+        mp_context: Optional[str] = None,
+        warm_start: bool = True,
+    ):
+        if errors not in ("raise", "capture"):
+            raise ValueError("`errors` must be either 'raise' or 'capture'.")
+        if chunksize < 1:
+            raise ValueError("`chunksize` must be at least 1.")
         self.model = model
         self.fitter = fitter
+        self.n_workers = n_workers
+        self.chunksize = chunksize
+        self.errors = errors
+        self.mp_context = mp_context
+        self.warm_start = warm_start
         self.fitted_params = None
+        self.fit_errors: List[Optional[Exception]] = []
+        self.diagnostics: List[Optional[FitDiagnostics]] = []
 
     def fit(
         self, t_batched: Sequence[Sequence[float]], y_batched: Sequence[Sequence[float]]
@@ -17,6 +144,10 @@ class BatchedFitter:
         """
         Fits the model to a batch of datasets.
 
+        Results are returned in input order whatever order the workers finish
+        in. With worker processes, rectangular ``(K, T)`` inputs are placed in
+        shared memory once instead of being pickled series by series.
+
         Args:
             t_batched: A sequence of time sequences.
             y_batched: A sequence of adoption sequences.
@@ -26,33 +157,128 @@ class BatchedFitter:
                 "The number of time sequences and adoption sequences must be the same."
             )
 
-        params_list = []
-        for t, y in zip(t_batched, y_batched):
-            model_instance = type(self.model)()
-            p0 = list(model_instance.initial_guesses(t, y).values())
-            bounds = list(zip(*model_instance.bounds(t, y).values()))
-            self.fitter.fit(model_instance, t, y, p0=p0, bounds=bounds)
-            params_list.append(list(model_instance.params_.values()))
+        starts = self._initial_params(t_batched, y_batched)
+        if self.n_workers is None or self.n_workers <= 1:
+            results = self._fit_serial(t_batched, y_batched, starts)
+        else:
+            results = self._fit_parallel(t_batched, y_batched, starts)
 
+        self.fit_errors = [error for _, error, _ in results]
+        self.diagnostics = [diagnostics for _, _, diagnostics in results]
+        n_params = next(
+            (len(params) for params, _, _ in results if params is not None),
+            len(self.model.param_names),
+        )
+        params_list = [
+            params if params is not None else [np.nan] * n_params
+            for params, _, _ in results
+        ]
         self.fitted_params = B.array(params_list)
         return self.fitted_params
 
+    def _initial_params(self, t_batched, y_batched) -> List[Optional[np.ndarray]]:
+        """Per-series warm starts, or None where the model's guesses apply."""
+        starts = [None] * len(y_batched)
+        if not self.warm_start:
+            return starts
+        template = type(self.model)()
+        if _is_rectangular(t_batched) and _is_rectangular(y_batched):
+            t_arr = np.asarray(t_batched, dtype=float)
+            if np.allclose(t_arr, t_arr[:1]):
+                guesses = bass_mom_initial_guesses(template, t_arr[0], y_batched)
+                return starts if guesses is None else list(guesses)
+        for i, (t, y) in enumerate(zip(t_batched, y_batched)):
+            guesses = bass_mom_initial_guesses(template, t, [y])
+            if guesses is not None:
+                starts[i] = guesses[0]
+        return starts
+
+    def _fit_serial(self, t_batched, y_batched, starts):
+        results = []
+        for t, y, p0 in zip(t_batched, y_batched, starts):
+            try:
+                params, diagnostics = _fit_series(self.model, self.fitter, t, y, p0)
+                results.append((params, None, diagnostics))
+            except Exception as e:
+                if self.errors == "raise":
+                    raise
+                results.append((None, e, None))
+        return results
+
+    def _fit_parallel(self, t_batched, y_batched, starts):
+        n_series = len(t_batched)
+        chunks = [
+            range(start, min(start + self.chunksize, n_series))
+            for start in range(0, n_series, self.chunksize)
+        ]
+
+        handles = []
+        try:
+            t_data, y_data = t_batched, y_batched
+            shared = _is_rectangular(t_batched) and _is_rectangular(y_batched)
+            if shared:
+                t_data, t_shm = _to_shared(t_batched)
+                handles.append(t_shm)
+                y_data, y_shm = _to_shared(y_batched)
+                handles.append(y_shm)
+
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                mp_context=(
+                    multiprocessing.get_context(self.mp_context)
+                    if self.mp_context
+                    else None
+                ),
+                initializer=_init_worker,
+                initargs=(self.model, self.fitter, t_data, y_data, shared, starts),
+            ) as executor:
+                futures = [executor.submit(_fit_chunk, chunk) for chunk in chunks]
+                results = []
+                for future in futures:
+                    for result in future.result():
+                        error = result[1]
+                        if error is not None and self.errors == "raise":
+                            # Future.cancel rather than shutdown(cancel_futures=...),
+                            # which needs Python 3.9
+                            for pending in futures:
+                                pending.cancel()
+                            raise error
+                        results.append(result)
+        finally:
+            for shm in handles:
+                shm.close()
+                shm.unlink()
+        return results
+
     def predict(self, t_batched: Sequence[Sequence[float]]):
         """
         Makes predictions for a batch of datasets.
 
+        Models that declare ``supports_batch`` are evaluated for the whole
+        batch in one vectorized call, which ``B.vmap`` passes through on the
+        NumPy backend instead of looping over the series.
+
         Args:
             t_batched: A sequence of time sequences.
         """
         if self.fitted_params is None:
             raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
 
-        def predict_single(params, t):
-            model_instance = type(self.model)()
-            param_dict = dict(zip(model_instance.param_names, params))
-            model_instance.params_ = param_dict
-            return model_instance.predict(t)
+        template = type(self.model)()
+        if getattr(template, "supports_batch", False):
+
+            def predict(params, t):
+                return template.evaluate_batch(params, t)
+
+            predict.supports_batch = True
+        else:
+
+            def predict(params, t):
+                model_instance = type(self.model)()
+                param_dict = dict(zip(model_instance.param_names, params))
+                model_instance.params_ = param_dict
+                return model_instance.predict(t)
 
-        vmap_predict = B.vmap(predict_single)
+        vmap_predict = B.vmap(predict)
         predictions = vmap_predict(self.fitted_params, B.array(t_batched))
         return predictions.reshape(predictions.shape[0], -1)
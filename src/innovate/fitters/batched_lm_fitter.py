@@ -0,0 +1,207 @@
+from typing import Sequence
+import numpy as np
+from innovate.base.base import DiffusionModel
+
+
+class BatchedLMFitter:
+    """A Levenberg-Marquardt fitter that fits many series in lockstep.
+
+    All K series share one time grid and are advanced together as stacked
+    NumPy arrays: the model's ``predict_many`` and ``jacobian_many`` evaluate
+    every active series at once, and the K small damped normal equations are
+    solved in a single batched ``np.linalg.solve``. Each series keeps its own
+    damping factor and drops out of the computation once it has converged.
+    This avoids the per-fit Python overhead of ``curve_fit``, which dominates
+    for short series. Bounds are enforced by projecting each step back into
+    the feasible box.
+
+    Args:
+        model: The model fitted to every series. It must provide
+            ``predict_many`` and ``jacobian_many``.
+        max_iter: Maximum number of iterations per series.
+        ftol: Relative reduction in the sum of squares below which an
+            accepted step counts as converged.
+        xtol: Relative step size below which a series counts as converged.
+        gtol: Gradient norm (max-abs) below which a series counts as converged.
+        damping: Initial damping factor for every series, relative to the
+            largest diagonal entry of ``J^T J``.
+    """
+
+    def __init__(
+        self,
+        model: DiffusionModel,
+        max_iter: int = 200,
+        ftol: float = 1e-10,
+        xtol: float = 1e-10,
+        gtol: float = 1e-12,
+        damping: float = 1e-3,
+    ):
+        self.model = model
+        self.max_iter = max_iter
+        self.ftol = ftol
+        self.xtol = xtol
+        self.gtol = gtol
+        self.damping = damping
+        self.fitted_params = None
+        self.converged = None
+        self.n_iter = None
+        self.sse = None
+
+    def fit(
+        self,
+        t: Sequence[float],
+        y_batched: Sequence[Sequence[float]],
+        p0: Sequence[float] = None,
+        bounds: tuple = None,
+        weights: Sequence[float] = None,
+    ) -> np.ndarray:
+        """
+        Fits the model to K series observed on a shared time grid.
+
+        Args:
+            t: Time points shared by every series.
+            y_batched: Observed data of shape (K, len(t)).
+            p0: Initial parameters, either one vector of length P or a (K, P)
+                matrix. If None, ``model.initial_guesses`` is used per series.
+            bounds: A ``(lower, upper)`` pair, each of length P or shape
+                (K, P). If None, ``model.bounds`` is used per series.
+            weights: Weights for the observations, of shape (len(t),) or
+                (K, len(t)), as in :class:`ScipyFitter`.
+
+        Returns:
+            The fitted parameters as a (K, P) array whose columns follow
+            ``model.param_names``. ``converged``, ``n_iter`` and ``sse`` hold
+            the per-series outcome.
+        """
+        t_arr = np.asarray(t, dtype=float)
+        y_arr = np.atleast_2d(np.asarray(y_batched, dtype=float))
+        if y_arr.ndim != 2 or y_arr.shape[1] != len(t_arr):
+            raise ValueError("`y_batched` must have shape (K, len(t)).")
+        n_series = len(y_arr)
+        n_params = len(self.model.param_names)
+
+        theta = self._initial_params(t_arr, y_arr, p0)
+        lower, upper = self._bounds(t_arr, y_arr, bounds)
+        theta = np.clip(theta, lower, upper)
+        sqrt_w = np.ones_like(y_arr)
+        if weights is not None:
+            sqrt_w = np.broadcast_to(
+                np.sqrt(np.asarray(weights, dtype=float)), y_arr.shape
+            )
+
+        sse = self._sse(t_arr, theta, y_arr, sqrt_w)
+        lam = np.full(n_series, float(self.damping))
+        nu = np.full(n_series, 2.0)
+        converged = np.zeros(n_series, dtype=bool)
+        active = np.isfinite(sse)
+        n_iter = np.zeros(n_series, dtype=int)
+        diag_idx = np.arange(n_params)
+
+        for _ in range(self.max_iter):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+            current = theta[idx]
+            w = sqrt_w[idx]
+            residuals = (y_arr[idx] - self.model.predict_many(t_arr, current)) * w
+            jac = self.model.jacobian_many(t_arr, current) * w[..., None]
+
+            # Block-diagonal normal equations, one P x P block per series.
+            normal = np.einsum("ktp,ktq->kpq", jac, jac)
+            gradient = np.einsum("ktp,kt->kp", jac, residuals)
+            # Damping proportional to the largest curvature keeps every block
+            # non-singular, even for parameters without influence. Unlike
+            # Marquardt's diag(J^T J) scaling it does not trap poorly scaled
+            # parameters (Bass p vs m) against their bounds.
+            scale = normal[:, diag_idx, diag_idx].max(axis=1)
+            scale = np.where(scale > 0, scale, 1.0)
+            damped = normal.copy()
+            damped[:, diag_idx, diag_idx] += (lam[idx] * scale)[:, None]
+            step = np.linalg.solve(damped, gradient[..., None])[..., 0]
+
+            # Parameters sitting on a bound that the step pushes against are
+            # held fixed and the step is re-solved over the free ones.
+            blocked = ((current <= lower[idx]) & (step < 0)) | (
+                (current >= upper[idx]) & (step > 0)
+            )
+            if blocked.any():
+                free = ~blocked
+                damped = np.where(free[:, :, None] & free[:, None, :], damped, 0.0)
+                damped[:, diag_idx, diag_idx] += blocked
+                gradient = np.where(free, gradient, 0.0)
+                step = np.linalg.solve(damped, gradient[..., None])[..., 0]
+
+            candidate = np.clip(current + step, lower[idx], upper[idx])
+            candidate_sse = self._sse(t_arr, candidate, y_arr[idx], w)
+            improved = candidate_sse < sse[idx]
+            reduction = (sse[idx] - candidate_sse) / np.maximum(sse[idx], 1e-300)
+            step = candidate - current
+            predicted = 2 * np.einsum("kp,kp->k", step, gradient) - np.einsum(
+                "kp,kpq,kq->k", step, normal, step
+            )
+            rho = (sse[idx] - candidate_sse) / np.where(
+                predicted > 0, predicted, np.inf
+            )
+            small_step = np.all(
+                np.abs(step) <= self.xtol * (np.abs(current) + self.xtol), axis=1
+            )
+            small_gradient = np.max(np.abs(gradient), axis=1) <= self.gtol
+
+            theta[idx[improved]] = candidate[improved]
+            sse[idx[improved]] = candidate_sse[improved]
+            # Nielsen's update: shrink the damping by how well the quadratic
+            # model predicted the reduction, grow it geometrically on failure.
+            shrink = np.maximum(1 / 3, 1 - (2 * rho - 1) ** 3)
+            lam[idx] = np.where(improved, lam[idx] * shrink, lam[idx] * nu[idx])
+            nu[idx] = np.where(improved, 2.0, nu[idx] * 2)
+            n_iter[idx] += 1
+
+            done = small_gradient | small_step | (improved & (reduction <= self.ftol))
+            converged[idx[done]] = True
+            stalled = lam[idx] > 1e16
+            active[idx[done | stalled]] = False
+
+        self.fitted_params = theta
+        self.converged = converged
+        self.n_iter = n_iter
+        self.sse = sse
+        return self.fitted_params
+
+    def predict(self, t: Sequence[float]) -> np.ndarray:
+        """
+        Predicts every fitted series on a shared time grid.
+
+        Args:
+            t: Time points at which to predict.
+
+        Returns:
+            An array of shape (K, len(t)).
+        """
+        if self.fitted_params is None:
+            raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
+        return self.model.predict_many(t, self.fitted_params)
+
+    def _sse(self, t, params, y, sqrt_w) -> np.ndarray:
+        with np.errstate(over="ignore", invalid="ignore"):
+            residuals = (y - self.model.predict_many(t, params)) * sqrt_w
+            sse = np.sum(residuals**2, axis=1)
+        return np.where(np.isfinite(sse), sse, np.inf)
+
+    def _initial_params(self, t, y, p0) -> np.ndarray:
+        shape = (len(y), len(self.model.param_names))
+        if p0 is not None:
+            return np.array(np.broadcast_to(np.asarray(p0, dtype=float), shape))
+        guesses = [list(self.model.initial_guesses(t, series).values()) for series in y]
+        return np.asarray(guesses, dtype=float).reshape(shape)
+
+    def _bounds(self, t, y, bounds):
+        shape = (len(y), len(self.model.param_names))
+        if bounds is None:
+            per_series = [list(self.model.bounds(t, series).values()) for series in y]
+            limits = np.asarray(per_series, dtype=float).reshape(shape + (2,))
+            return limits[..., 0], limits[..., 1]
+        lower, upper = bounds
+        return (
+            np.broadcast_to(np.asarray(lower, dtype=float), shape),
+            np.broadcast_to(np.asarray(upper, dtype=float), shape),
+        )
@@ -1,73 +1,324 @@
-from typing import Sequence, Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import copy
+import multiprocessing
+import time
+import warnings
+from typing import Sequence, Dict, List, Any, Optional
 import numpy as np
 from innovate.base.base import DiffusionModel
 
+# Per-process state installed by ``_init_worker`` so that tasks only need to
+# carry replicate indices and their seeds.
+_WORKER_STATE = {}
+
+
+def _unfitted_copy(model: DiffusionModel) -> DiffusionModel:
+    """Copies ``model`` with its configuration but without its fitted state.
+
+    The copy is deep so that composite models (mixtures, hierarchies) do not
+    share their component models with the original.
+    """
+    clone = copy.deepcopy(model)
+    clone.params_ = {}
+    vars(clone).pop("diagnostics_", None)
+    return clone
+
+
+def _fit_replicate(model: DiffusionModel, fitter, t, y, seed, p0, kwargs):
+    """Fits an unfitted copy of ``model`` to one bootstrap resample.
+
+    Returns the fitted parameter vector, or ``None`` if the fit failed.
+    """
+    rng = np.random.default_rng(seed)
+    # The closed-form models anchor their initial state at the earliest time
+    # point, so every resample keeps the earliest observation as the origin
+    # and stays in time order; otherwise replicates fit shifted curves.
+    indices = np.append(np.argmin(t), rng.integers(0, len(t), size=len(t) - 1))
+    indices = indices[np.argsort(t[indices], kind="stable")]
+    t_resampled = t[indices]
+    y_resampled = y[indices]
+
+    # A new model instance per replicate avoids parameter contamination
+    boot_model = _unfitted_copy(model)
+    try:
+        if p0 is None:
+            boot_model.fit(fitter, t_resampled, y_resampled, **kwargs)
+        else:
+            bounds = list(zip(*boot_model.bounds(t_resampled, y_resampled).values()))
+            start = np.clip(p0, *bounds)
+            fitter.fit(
+                boot_model,
+                t_resampled,
+                y_resampled,
+                p0=list(start),
+                bounds=bounds,
+                **kwargs,
+            )
+    except RuntimeError:
+        # Failed resamples are counted and reported by BootstrapFitter.fit
+        return None
+    return [boot_model.params_[name] for name in boot_model.param_names]
+
+
+def _init_worker(model, fitter, t, y, p0, kwargs):
+    """Installs the model, fitter and data once per worker process."""
+    _WORKER_STATE.update(model=model, fitter=fitter, t=t, y=y, p0=p0, kwargs=kwargs)
+
+
+def _fit_chunk(tasks):
+    """Fits the ``(index, seed)`` replicates of one chunk."""
+    state = _WORKER_STATE
+    return [
+        (
+            i,
+            _fit_replicate(
+                state["model"],
+                state["fitter"],
+                state["t"],
+                state["y"],
+                seed,
+                state["p0"],
+                state["kwargs"],
+            ),
+        )
+        for i, seed in tasks
+    ]
+
 
 class BootstrapFitter:
-    """A fitter class that uses bootstrapping to estimate parameter uncertainty."""
+    """A fitter class that uses bootstrapping to estimate parameter uncertainty.
 
-    def __init__(self, fitter: Any, n_bootstraps: int = 100):
+    Every replicate draws its resample from its own child of a single
+    ``np.random.SeedSequence``, so results are reproducible for a given
+    ``random_state`` regardless of the number of workers or the order in
+    which they finish. Replicates are stored in a preallocated
+    ``(n_bootstraps, P)`` array, ``replicates``, with NaN rows for failed fits,
+    which are counted in ``n_failed`` and reported with a ``RuntimeWarning``.
+    Every replicate fits an unfitted copy of the model, so configuration such
+    as covariates and structural breaks carries over.
+
+    Args:
+        fitter: The fitter used for each replicate.
+        n_bootstraps: Number of bootstrap replicates.
+        n_workers: Number of worker processes. ``None`` or ``1`` fits the
+            replicates serially in the current process.
+        warm_start: If True, the model is first fitted to the full data and
+            every replicate starts from that point estimate instead of
+            ``model.initial_guesses``.
+        random_state: Seed (or ``np.random.SeedSequence``) for the resampling.
+            ``None`` draws fresh entropy.
+        chunksize: Number of replicates sent to a worker per task.
+        mp_context: Start method for the worker processes (e.g. ``"spawn"``),
+            or ``None`` for the platform default.
+        adaptive: If True, stop sampling once the confidence intervals have
+            stabilised; ``n_bootstraps`` is then the replicate budget.
+        batch_size: Number of replicates run between stability checks in
+            adaptive mode.
+        ci_tol: Largest endpoint change, relative to the interval width,
+            that counts as stable.
+        alpha: Significance level of the intervals monitored in adaptive mode.
+        max_time: Optional wall-clock budget in seconds for adaptive mode.
+    """
+
+    def __init__(
+        self,
+        fitter: Any,
+        n_bootstraps: int = 100,
+        n_workers: Optional[int] = None,
+        warm_start: bool = False,
+        random_state=None,
+        chunksize: int = 1,
+        mp_context: Optional[str] = None,
+        adaptive: bool = False,
+        batch_size: int = 50,
+        ci_tol: float = 0.01,
+        alpha: float = 0.05,
+        max_time: Optional[float] = None,
+    ):
+        if chunksize < 1:
+            raise ValueError("`chunksize` must be at least 1.")
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1.")
         self.fitter = fitter
         self.n_bootstraps = n_bootstraps
-        self.bootstrapped_params: List[Dict[str, float]] = []
+        self.n_workers = n_workers
+        self.warm_start = warm_start
+        self.random_state = random_state
+        self.chunksize = chunksize
+        self.mp_context = mp_context
+        self.adaptive = adaptive
+        self.batch_size = batch_size
+        self.ci_tol = ci_tol
+        self.alpha = alpha
+        self.max_time = max_time
+        self.param_names: List[str] = []
+        self.point_estimate: Optional[np.ndarray] = None
+        self.replicates = np.empty((0, 0))
+        self.n_replicates_used = 0
+        self.n_failed = 0
+        self.stop_reason: Optional[str] = None
+
+    @property
+    def bootstrapped_params(self) -> List[Dict[str, float]]:
+        """The successful replicates as a list of parameter dictionaries."""
+        return [dict(zip(self.param_names, row)) for row in self._valid_replicates()]
 
     def fit(
         self, model: DiffusionModel, t: Sequence[float], y: Sequence[float], **kwargs
     ) -> None:
+        """
+        Fits the bootstrap replicates for one series.
+
+        In adaptive mode replicates are run in batches of ``batch_size`` and
+        the running ``alpha`` percentile interval of every parameter is
+        recomputed after each batch. Sampling stops once no endpoint moved by
+        more than ``ci_tol`` times its interval width, or when
+        ``n_bootstraps`` replicates or ``max_time`` seconds are used up.
+        ``n_replicates_used`` and ``stop_reason`` record the outcome, and
+        ``replicates`` is truncated to the replicates that were run. Since
+        the replicates draw from the same seed sequence in order, an adaptive
+        run reproduces a prefix of the fixed-size run.
+
+        Args:
+            model: The model whose unfitted copies are fitted to every resample.
+            t: Time points.
+            y: Observed data.
+            **kwargs: Forwarded to the underlying fitter.
+        """
+        start_time = time.perf_counter()
         t_arr = np.array(t)
         y_arr = np.array(y)
-        n_samples = len(t_arr)
-
-        for _ in range(self.n_bootstraps):
-            # Resample data with replacement
-            indices = np.random.choice(n_samples, n_samples, replace=True)
-            t_resampled = t_arr[indices]
-            y_resampled = y_arr[indices]
-
-            # Create a new model instance for each bootstrap iteration
-            # This is important to avoid parameter contamination between iterations
-            boot_model = type(model)()
-
-            try:
-                boot_model.fit(self.fitter, t_resampled, y_resampled, **kwargs)
-                self.bootstrapped_params.append(boot_model.params_)
-            except RuntimeError as e:
-                # Handle cases where fitting might fail for a resampled dataset
-                print(f"Warning: Fitting failed for a bootstrap sample: {e}")
-                continue
+        self.param_names = list(model.param_names)
+
+        p0 = None
+        self.point_estimate = None
+        if self.warm_start:
+            point_model = _unfitted_copy(model)
+            point_model.fit(self.fitter, t_arr, y_arr, **kwargs)
+            p0 = np.array([point_model.params_[name] for name in self.param_names])
+            self.point_estimate = p0
+
+        seed_sequence = self.random_state
+        if not isinstance(seed_sequence, np.random.SeedSequence):
+            seed_sequence = np.random.SeedSequence(seed_sequence)
+        tasks = list(enumerate(seed_sequence.spawn(self.n_bootstraps)))
+        batch_size = self.batch_size if self.adaptive else max(len(tasks), 1)
+
+        self.replicates = np.full((self.n_bootstraps, len(self.param_names)), np.nan)
+        self.n_replicates_used = 0
+        self.n_failed = 0
+        self.stop_reason = "max_replicates"
+        previous_ci = None
+        with self._executor(model, t_arr, y_arr, p0, kwargs) as executor:
+            for start in range(0, len(tasks), batch_size):
+                batch = tasks[start : start + batch_size]
+                if executor is None:
+                    results = [
+                        (
+                            i,
+                            _fit_replicate(
+                                model, self.fitter, t_arr, y_arr, seed, p0, kwargs
+                            ),
+                        )
+                        for i, seed in batch
+                    ]
+                else:
+                    results = self._map_chunks(executor, batch)
+                for i, params in results:
+                    if params is None:
+                        self.n_failed += 1
+                    else:
+                        self.replicates[i] = params
+                self.n_replicates_used = start + len(batch)
+
+                if not self.adaptive or self.n_replicates_used == len(tasks):
+                    continue
+                ci = self._percentile_interval(self.alpha)
+                if previous_ci is not None and ci is not None:
+                    width = ci[1] - ci[0]
+                    if np.all(np.abs(ci - previous_ci) <= self.ci_tol * width):
+                        self.stop_reason = "converged"
+                        break
+                previous_ci = ci
+                if (
+                    self.max_time is not None
+                    and time.perf_counter() - start_time >= self.max_time
+                ):
+                    self.stop_reason = "max_time"
+                    break
+        self.replicates = self.replicates[: self.n_replicates_used]
+        if self.n_failed:
+            warnings.warn(
+                f"{self.n_failed} of {self.n_replicates_used} bootstrap fits "
+                "failed; their replicates are NaN.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    @contextmanager
+    def _executor(self, model, t_arr, y_arr, p0, kwargs):
+        """Yields a worker pool shared by all batches, or None when serial."""
+        if self.n_workers is None or self.n_workers <= 1:
+            yield None
+            return
+        with ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=(
+                multiprocessing.get_context(self.mp_context)
+                if self.mp_context
+                else None
+            ),
+            initializer=_init_worker,
+            initargs=(model, self.fitter, t_arr, y_arr, p0, kwargs),
+        ) as executor:
+            yield executor
+
+    def _map_chunks(self, executor, tasks):
+        chunks = [
+            tasks[start : start + self.chunksize]
+            for start in range(0, len(tasks), self.chunksize)
+        ]
+        return [
+            result
+            for chunk_results in executor.map(_fit_chunk, chunks)
+            for result in chunk_results
+        ]
+
+    def _percentile_interval(self, alpha: float) -> Optional[np.ndarray]:
+        """Returns the ``(2, P)`` percentile interval, or None without replicates."""
+        valid = self._valid_replicates()
+        if not len(valid):
+            return None
+        return np.percentile(valid, [(alpha / 2) * 100, (1 - alpha / 2) * 100], axis=0)
+
+    def _valid_replicates(self) -> np.ndarray:
+        return self.replicates[~np.isnan(self.replicates).any(axis=1)]
 
     def get_parameter_estimates(self) -> Dict[str, List[float]]:
         """Returns a dictionary of parameter names to lists of bootstrapped values."""
-        if not self.bootstrapped_params:
+        valid = self._valid_replicates()
+        if not len(valid):
             return {}
-
-        # Assuming all models have the same parameter names
-        param_names = self.bootstrapped_params[0].keys()
-        estimates = {name: [] for name in param_names}
-
-        for params_dict in self.bootstrapped_params:
-            for name, value in params_dict.items():
-                estimates[name].append(value)
-        return estimates
+        return {name: valid[:, j].tolist() for j, name in enumerate(self.param_names)}
 
     def get_confidence_intervals(
         self, alpha: float = 0.05
     ) -> Dict[str, Dict[str, float]]:
         """Returns confidence intervals for each parameter."""
-        estimates = self.get_parameter_estimates()
-        cis = {}
-        for name, values in estimates.items():
-            if values:
-                lower = np.percentile(values, (alpha / 2) * 100)
-                upper = np.percentile(values, (1 - alpha / 2) * 100)
-                cis[name] = {"lower": float(lower), "upper": float(upper)}
-        return cis
+        ci = self._percentile_interval(alpha)
+        if ci is None:
+            return {}
+        lower, upper = ci
+        return {
+            name: {"lower": float(lower[j]), "upper": float(upper[j])}
+            for j, name in enumerate(self.param_names)
+        }
 
     def get_standard_errors(self) -> Dict[str, float]:
         """Returns standard errors for each parameter."""
-        estimates = self.get_parameter_estimates()
-        ses = {}
-        for name, values in estimates.items():
-            if values:
-                ses[name] = float(np.std(values))
-        return ses
+        valid = self._valid_replicates()
+        if not len(valid):
+            return {}
+        ses = np.std(valid, axis=0)
+        return {name: float(ses[j]) for j, name in enumerate(self.param_names)}
@@ -0,0 +1,248 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional, Sequence
+import numpy as np
+from innovate.base.base import DiffusionModel
+from innovate.fitters.diagnostics import FitDiagnostics
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def _update_digest(digest, value: Any) -> None:
+    """Feeds a canonical encoding of ``value`` into ``digest``.
+
+    Arrays contribute their dtype, shape and bytes; containers are walked
+    recursively with dictionary keys sorted. Other objects contribute only
+    their type, so memory addresses never leak into the key.
+    """
+    if isinstance(value, _PRIMITIVES):
+        digest.update(repr(value).encode())
+    elif isinstance(value, dict):
+        digest.update(b"{")
+        for key in sorted(value, key=str):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[")
+        for item in value:
+            _update_digest(digest, item)
+        digest.update(b"]")
+    elif isinstance(value, np.generic) or hasattr(value, "__array__"):
+        array = np.ascontiguousarray(np.asarray(value))
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+    else:
+        digest.update(f"<{type(value).__module__}.{type(value).__qualname__}>".encode())
+
+
+def _settings(obj) -> Dict[str, Any]:
+    """Public configuration attributes of a model or fitter.
+
+    Fitted state (names ending in an underscore) and the diagnostics of the
+    last fit are left out, so refitting does not change the key.
+    """
+    return {
+        name: value
+        for name, value in vars(obj).items()
+        if not name.startswith("_") and not name.endswith("_") and name != "diagnostics"
+    }
+
+
+class FitCache:
+    """A persistent, content-addressed store of fitted parameters.
+
+    Entries are JSON files named by their key under ``directory``. They are
+    written to a temporary file and atomically renamed, so concurrent worker
+    processes never observe partial entries, and a lost race simply leaves
+    one of two identical results. Each hit refreshes the entry's
+    modification time; once the directory exceeds ``max_bytes`` the least
+    recently used entries are deleted.
+
+    Args:
+        directory: Cache directory, created if missing.
+        max_bytes: Size limit of the cache directory in bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 64 * 2**20):
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(
+        self,
+        model: DiffusionModel,
+        t: Sequence[float],
+        y: Sequence[float],
+        fitter: Any = None,
+        fit_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Hashes everything that determines a fit's result.
+
+        Args:
+            model: The model, contributing its class, ``param_names`` and
+                public configuration.
+            t: Time points.
+            y: Observed data.
+            fitter: The fitter, contributing its class and public settings.
+            fit_kwargs: Keyword arguments of the fit, such as ``p0``,
+                ``bounds``, ``weights`` and ``covariates``.
+
+        Returns:
+            A hexadecimal SHA-256 digest.
+        """
+        digest = hashlib.sha256()
+        model_type = type(model)
+        _update_digest(digest, f"{model_type.__module__}.{model_type.__qualname__}")
+        _update_digest(digest, list(model.param_names))
+        _update_digest(digest, _settings(model))
+        _update_digest(digest, np.asarray(t, dtype=float))
+        _update_digest(digest, np.asarray(y, dtype=float))
+        if fitter is not None:
+            fitter_type = type(fitter)
+            _update_digest(
+                digest, f"{fitter_type.__module__}.{fitter_type.__qualname__}"
+            )
+            _update_digest(digest, _settings(fitter))
+        _update_digest(digest, fit_kwargs or {})
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the entry stored under ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # Mark as recently used
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Stores ``entry`` under ``key`` and evicts old entries if needed."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # Removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+class CachedFitter:
+    """A fitter wrapper that reuses results from a :class:`FitCache`.
+
+    On a hit the stored parameters are written to ``model.params_``, the
+    stored :class:`FitDiagnostics` (or None) to ``model.diagnostics_``, and
+    the wrapped fitter is not called at all. On a miss the wrapped fitter runs
+    and its result, with a small diagnostics record that includes the
+    wrapped fit's :class:`FitDiagnostics` where available, is stored. The
+    wrapper accepts the same arguments as the wrapped fitter, so it can be
+    passed to ``model.fit``, :class:`BatchedFitter` or
+    :class:`BootstrapFitter`.
+
+    Args:
+        fitter: The fitter whose results are cached.
+        cache: The cache to use.
+    """
+
+    def __init__(self, fitter: Any, cache: FitCache):
+        self.fitter = fitter
+        self.cache = cache
+        self.last_hit: Optional[bool] = None
+        self.diagnostics: Optional[Dict[str, Any]] = None
+
+    def fit(
+        self, model: DiffusionModel, t: Sequence[float], y: Sequence[float], **kwargs
+    ) -> "CachedFitter":
+        """
+        Fits ``model``, or restores its parameters from the cache.
+
+        Args:
+            model: The model to fit.
+            t: Time points.
+            y: Observed data.
+            kwargs: Forwarded to the wrapped fitter and part of the cache key.
+
+        Returns:
+            The fitter instance.
+        """
+        key = self.cache.key(model, t, y, self.fitter, kwargs)
+        entry = self.cache.get(key)
+        self.last_hit = entry is not None
+        if entry is None:
+            start = time.perf_counter()
+            self.fitter.fit(model, t, y, **kwargs)
+            diagnostics = {
+                "fitter": type(self.fitter).__name__,
+                "fit_time": time.perf_counter() - start,
+                "created": time.time(),
+            }
+            fit_diagnostics = getattr(model, "diagnostics_", None)
+            if fit_diagnostics is not None:
+                diagnostics["fit"] = fit_diagnostics.as_dict()
+            # tolist() keeps scalars as floats and array parameters as
+            # nested lists of the same shape
+            entry = {
+                "params": [
+                    np.asarray(model.params_[name], dtype=float).tolist()
+                    for name in model.param_names
+                ],
+                "diagnostics": diagnostics,
+            }
+            self.cache.put(key, entry)
+        else:
+            model.params_ = dict(zip(model.param_names, entry["params"]))
+            fit_diagnostics = entry["diagnostics"].get("fit")
+            model.diagnostics_ = (
+                FitDiagnostics.from_dict(fit_diagnostics)
+                if fit_diagnostics is not None
+                else None
+            )
+        self.diagnostics = entry["diagnostics"]
+        return self
@@ -3,15 +3,18 @@
 import numpy as np
 from scipy.optimize import curve_fit
 from innovate.base.base import DiffusionModel
+from innovate.fitters.diagnostics import FitDiagnostics
 
 
 class CurveFitter:
     """
     A fitter that uses scipy.optimize.curve_fit to estimate model parameters.
+    The work done by the last fit is recorded in ``diagnostics``.
     """
 
     def __init__(self, model: DiffusionModel):
         self.model = model
+        self.diagnostics = None
 
     def fit(
         self,
@@ -25,20 +28,26 @@ class CurveFitter:
         """
         Fits the model to the data using curve_fit.
         """
+        diagnostics = FitDiagnostics(type(self).__name__)
 
         def func(t, *params):
-            # The model's differential_equation is not directly used by curve_fit.
-            # Instead, we need a function that returns the predicted y values.
-            # We'll use a simplified version of the predict method for this.
-
-            # Create a temporary model to set the parameters for prediction
-            temp_model = self.model.__class__()
-            temp_model.params_ = dict(zip(self.model.param_names, params))
-            return temp_model.predict(t)
+            # evaluate() predicts from positional parameters without mutating
+            # the model, so no temporary instance is needed per call.
+            diagnostics.nfev += 1
+            return self.model.evaluate(params, t)
 
         # Use the model's initial guesses and bounds
-        popt, _ = curve_fit(func, t, y, p0=p0, bounds=bounds)
+        with diagnostics.phase("optimization"):
+            popt, _, _, mesg, ier = curve_fit(
+                func, t, y, p0=p0, bounds=bounds, full_output=True
+            )
+        diagnostics.message = mesg
+        diagnostics.status = "converged" if ier > 0 else "max_iter"
 
         # Set the model parameters to the optimal values
         self.model.params_ = dict(zip(self.model.param_names, popt))
+        with diagnostics.phase("predict"):
+            residuals = np.ravel(y) - np.ravel(self.model.evaluate(popt, t))
+            diagnostics.cost = float(np.sum(residuals**2))
+        self.model.diagnostics_ = self.diagnostics = diagnostics
         return self
@@ -0,0 +1,109 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+from typing import Any, Dict, Optional
+
+# ODE work done by model evaluations, collected while a fit is being timed.
+# Outside of a fit this is None and recording an integration is a no-op.
+_ODE_COUNTS: ContextVar[Optional[Dict[str, int]]] = ContextVar(
+    "innovate_ode_counts", default=None
+)
+
+PHASES = ("initial_guesses", "optimization", "predict")
+
+
+def record_ode_solve(n_rhs: int) -> None:
+    """Adds one ODE integration with ``n_rhs`` right-hand-side calls to the active fit."""
+    counts = _ODE_COUNTS.get()
+    if counts is not None:
+        counts["n_rhs"] += int(n_rhs)
+        counts["n_ode_solves"] += 1
+
+
+class FitDiagnostics:
+    """A record of the work done by one fit.
+
+    Every fitter attaches one to the fitted model as ``model.diagnostics_``
+    and keeps the latest one as ``fitter.diagnostics``. Counters that a
+    fitter cannot observe stay at zero. Recording costs a few clock reads
+    and integer increments per fit, so it is always on.
+
+    Attributes:
+        fitter: Name of the fitter class.
+        nfev: Objective (model) evaluations, including finite differences.
+        njev: Analytic Jacobian or gradient evaluations.
+        n_iter: Optimizer iterations, where the optimizer reports them.
+        n_rhs: ODE right-hand-side calls made by the model during the fit.
+        n_ode_solves: Number of ODE integrations.
+        phase_times: Wall time in seconds of the ``"initial_guesses"``,
+            ``"optimization"`` and ``"predict"`` phases, plus any
+            fitter-specific ones such as JAX ``"compile"``.
+        status: ``"converged"``, ``"max_iter"`` or ``"failed"``.
+        message: The optimizer's own status message, if any.
+        cost: Sum of squared residuals of the final prediction.
+    """
+
+    def __init__(self, fitter: str):
+        self.fitter = fitter
+        self.nfev = 0
+        self.njev = 0
+        self.n_iter = 0
+        self.n_rhs = 0
+        self.n_ode_solves = 0
+        self.phase_times = {phase: 0.0 for phase in PHASES}
+        self.status = "converged"
+        self.message = ""
+        self.cost = float("nan")
+
+    @property
+    def wall_time(self) -> float:
+        """Total wall time of all phases."""
+        return sum(self.phase_times.values())
+
+    @contextmanager
+    def phase(self, name: str):
+        """Times a phase and collects the ODE work done inside it."""
+        counts = {"n_rhs": 0, "n_ode_solves": 0}
+        token = _ODE_COUNTS.set(counts)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + elapsed
+            _ODE_COUNTS.reset(token)
+            self.n_rhs += counts["n_rhs"]
+            self.n_ode_solves += counts["n_ode_solves"]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the record as a plain, JSON-serialisable dictionary."""
+        return {
+            "fitter": self.fitter,
+            "nfev": self.nfev,
+            "njev": self.njev,
+            "n_iter": self.n_iter,
+            "n_rhs": self.n_rhs,
+            "n_ode_solves": self.n_ode_solves,
+            "phase_times": dict(self.phase_times),
+            "wall_time": self.wall_time,
+            "status": self.status,
+            "message": self.message,
+            "cost": self.cost,
+        }
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "FitDiagnostics":
+        """Rebuilds a record from the output of :meth:`as_dict`."""
+        diagnostics = cls(record["fitter"])
+        for name, value in record.items():
+            if name not in ("fitter", "wall_time"):
+                setattr(diagnostics, name, value)
+        diagnostics.phase_times = dict(diagnostics.phase_times)
+        return diagnostics
+
+    def __repr__(self) -> str:
+        return (
+            f"FitDiagnostics(fitter={self.fitter!r}, status={self.status!r}, "
+            f"nfev={self.nfev}, njev={self.njev}, n_rhs={self.n_rhs}, "
+            f"wall_time={self.wall_time:.4g})"
+        )
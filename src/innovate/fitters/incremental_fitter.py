@@ -0,0 +1,199 @@
+from typing import Any, Optional, Sequence
+import numpy as np
+from scipy.optimize import least_squares
+from innovate.base.base import DiffusionModel
+from innovate.fitters.scipy_fitter import ScipyFitter
+
+METHODS = ("refine", "ekf")
+
+
+class IncrementalFitter:
+    """A fitter that updates a fitted model as new observations arrive.
+
+    After a cold :meth:`fit` (or :meth:`attach` of a model fitted elsewhere),
+    each :meth:`update` appends the new points to the stored history and
+    moves the parameters from their previous values instead of starting
+    over:
+
+    - ``"refine"`` runs a bounded number of least-squares iterations on the
+      full history, warm-started from the previous parameters.
+    - ``"ekf"`` treats the parameters as a static state and applies an
+      extended Kalman filter measurement update for the new points only,
+      using the model's analytic ``jacobian``. Models without one are
+      refined instead.
+
+    When a new residual exceeds ``residual_threshold`` times the residual
+    standard deviation of the previous fit, the model is refitted from
+    scratch with the cold ``fitter``.
+
+    Args:
+        fitter: Fitter for cold and fallback fits. Defaults to
+            :class:`ScipyFitter`.
+        method: ``"refine"`` or ``"ekf"``.
+        max_nfev: Maximum number of function evaluations per refinement.
+        residual_threshold: Residual size, in standard deviations, that
+            triggers a full refit. ``None`` disables the fallback.
+        process_noise: Variance added to the parameter covariance diagonal
+            before each Kalman update, allowing the parameters to drift.
+    """
+
+    def __init__(
+        self,
+        fitter: Any = None,
+        method: str = "refine",
+        max_nfev: int = 20,
+        residual_threshold: Optional[float] = 4.0,
+        process_noise: float = 0.0,
+    ):
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}'. Expected one of {METHODS}.")
+        self.fitter = fitter if fitter is not None else ScipyFitter()
+        self.method = method
+        self.max_nfev = max_nfev
+        self.residual_threshold = residual_threshold
+        self.process_noise = process_noise
+        self.t_: Optional[np.ndarray] = None
+        self.y_: Optional[np.ndarray] = None
+        self.covariance_: Optional[np.ndarray] = None
+        self.sigma2_: Optional[float] = None
+        self.last_update: Optional[str] = None
+        self.n_full_refits = 0
+
+    def fit(
+        self, model: DiffusionModel, t: Sequence[float], y: Sequence[float], **kwargs
+    ) -> "IncrementalFitter":
+        """
+        Fits ``model`` from scratch and records the data for later updates.
+
+        Args:
+            model: The model to fit.
+            t: Time points.
+            y: Observed data.
+            kwargs: Forwarded to the cold fitter.
+
+        Returns:
+            The fitter instance.
+        """
+        model.fit(self.fitter, t, y, **kwargs)
+        return self.attach(model, t, y)
+
+    def attach(
+        self, model: DiffusionModel, t: Sequence[float], y: Sequence[float]
+    ) -> "IncrementalFitter":
+        """
+        Records an already fitted model and the data it was fitted to.
+
+        Args:
+            model: A fitted model.
+            t: Time points of the fit.
+            y: Observed data of the fit.
+
+        Returns:
+            The fitter instance.
+        """
+        if not model.params_:
+            raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
+        self.t_ = np.asarray(t, dtype=float)
+        self.y_ = np.asarray(y, dtype=float)
+        self._refresh_statistics(model)
+        self.last_update = "full"
+        return self
+
+    def update(
+        self, model: DiffusionModel, t_new: Sequence[float], y_new: Sequence[float]
+    ) -> "IncrementalFitter":
+        """
+        Appends new observations and updates the model's parameters.
+
+        Args:
+            model: The model previously passed to :meth:`fit` or :meth:`attach`.
+            t_new: New time points.
+            y_new: New observations.
+
+        Returns:
+            The fitter instance. ``last_update`` records whether the update
+            was a ``"refine"``, ``"ekf"`` or ``"full"`` refit.
+        """
+        if self.t_ is None:
+            raise RuntimeError("No fitted history. Call .fit() or .attach() first.")
+        t_new = np.atleast_1d(np.asarray(t_new, dtype=float))
+        y_new = np.atleast_1d(np.asarray(y_new, dtype=float))
+        theta = self._params(model)
+        self.t_ = np.concatenate([self.t_, t_new])
+        self.y_ = np.concatenate([self.y_, y_new])
+        lower, upper = self._bounds(model)
+        # Predict on the whole history: some models anchor their solution at
+        # the first time point, so the new points cannot be evaluated alone.
+        n_new = len(t_new)
+        residuals = y_new - self._evaluate(model, theta, self.t_)[-n_new:]
+
+        sigma = np.sqrt(self.sigma2_) if self.sigma2_ else 0.0
+        if (
+            self.residual_threshold is not None
+            and sigma > 0
+            and np.max(np.abs(residuals)) > self.residual_threshold * sigma
+        ):
+            model.fit(self.fitter, self.t_, self.y_)
+            self.n_full_refits += 1
+            self.last_update = "full"
+        elif self.method == "ekf" and callable(getattr(model, "jacobian", None)):
+            theta = self._kalman_update(model, theta, n_new, residuals)
+            model.params_ = dict(zip(model.param_names, np.clip(theta, lower, upper)))
+            self.last_update = "ekf"
+        else:
+            theta = np.clip(theta, lower, upper)
+            result = least_squares(
+                lambda p: self._evaluate(model, p, self.t_) - self.y_,
+                theta,
+                jac=self._jacobian_function(model),
+                bounds=(lower, upper),
+                max_nfev=self.max_nfev,
+            )
+            model.params_ = dict(zip(model.param_names, result.x))
+            self.last_update = "refine"
+
+        self._refresh_statistics(model, keep_covariance=self.last_update == "ekf")
+        return self
+
+    def _kalman_update(self, model, theta, n_new, residuals) -> np.ndarray:
+        H = np.asarray(model.jacobian(self.t_, params=theta), dtype=float)[-n_new:]
+        P = self.covariance_ + self.process_noise * np.eye(len(theta))
+        S = H @ P @ H.T + self.sigma2_ * np.eye(n_new)
+        gain = np.linalg.solve(S, H @ P).T
+        self.covariance_ = (np.eye(len(theta)) - gain @ H) @ P
+        return theta + gain @ residuals
+
+    def _refresh_statistics(self, model, keep_covariance: bool = False) -> None:
+        """Re-estimates the residual variance and parameter covariance."""
+        theta = self._params(model)
+        residuals = self.y_ - self._evaluate(model, theta, self.t_)
+        dof = max(len(self.y_) - len(theta), 1)
+        self.sigma2_ = float(np.sum(residuals**2) / dof)
+        if keep_covariance:
+            return
+        jacobian = getattr(model, "jacobian", None)
+        if callable(jacobian):
+            J = np.asarray(jacobian(self.t_, params=theta), dtype=float)
+            self.covariance_ = max(self.sigma2_, 1e-300) * np.linalg.pinv(J.T @ J)
+        else:
+            self.covariance_ = None
+
+    def _jacobian_function(self, model):
+        jacobian = getattr(model, "jacobian", None)
+        if not callable(jacobian):
+            return "2-point"
+        return lambda p: np.asarray(jacobian(self.t_, params=p), dtype=float)
+
+    @staticmethod
+    def _evaluate(model, theta, t) -> np.ndarray:
+        return np.asarray(model.evaluate(theta, t), dtype=float).ravel()
+
+    @staticmethod
+    def _params(model) -> np.ndarray:
+        return np.array(
+            [model.params_[name] for name in model.param_names], dtype=float
+        )
+
+    def _bounds(self, model):
+        limits = np.array(list(model.bounds(self.t_, self.y_).values()), dtype=float)
+        return limits[:, 0], limits[:, 1]
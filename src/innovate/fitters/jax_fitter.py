@@ -1,38 +1,215 @@
+from collections import OrderedDict
+import copy
+import hashlib
 import jax
 import jax.numpy as jnp
 from jaxopt import LBFGS
-from typing import Sequence, Dict
+from typing import Dict, Optional, Sequence
+import numpy as np
 from innovate.base.base import DiffusionModel
-from innovate.backend import use_backend, current_backend
+from innovate import backend
+from innovate.fitters.cached_fitter import _settings, _update_digest
+from innovate.fitters.diagnostics import FitDiagnostics
+
+# Compiled LBFGS solves keyed by model class and configuration, parameter
+# layout, series shape and solver settings, shared by every JaxFitter so
+# repeated fits skip tracing. The least recently used solve is evicted once
+# more than _MAX_COMPILED_SOLVERS are held.
+_COMPILED_SOLVERS = OrderedDict()
+_MAX_COMPILED_SOLVERS = 32
+
+
+def _solver_key(model: DiffusionModel, t_arr, n_series, maxiter, tol):
+    # The public configuration (covariates, t_event, ...) changes what
+    # evaluate() traces, so it is part of the key like in FitCache
+    digest = hashlib.sha256()
+    _update_digest(digest, _settings(model))
+    return (
+        type(model),
+        tuple(model.param_names),
+        digest.hexdigest(),
+        t_arr.shape[-1],
+        str(t_arr.dtype),
+        n_series,
+        maxiter,
+        tol,
+    )
+
+
+def _build_solver(model: DiffusionModel, maxiter: int, tol: float):
+    def loss_fn(params_array, t_arr, y_arr):
+        # evaluate() is side-effect free, so tracing never touches model.params_
+        predictions = model.evaluate(params_array, t_arr)
+        return jnp.sum((y_arr - predictions) ** 2)
+
+    opt = LBFGS(fun=loss_fn, maxiter=maxiter, tol=tol)
+
+    def solve(init_params, t_arr, y_arr):
+        sol = opt.run(init_params, t_arr, y_arr)
+        state = sol.state
+        stats = (state.iter_num, state.num_fun_eval, state.num_grad_eval, state.error)
+        return sol.params, stats
+
+    return solve
+
+
+def _compiled_solver(
+    model, init_params, t_arr, y_arr, maxiter, tol, batched, diagnostics
+):
+    """Returns the compiled solve for these shapes, compiling it on first use."""
+    n_series = len(y_arr) if batched else None
+    key = _solver_key(model, t_arr, n_series, maxiter, tol)
+    compiled = _COMPILED_SOLVERS.get(key)
+    if compiled is not None:
+        _COMPILED_SOLVERS.move_to_end(key)
+    else:
+        # Trace a snapshot so the cache never keeps the caller's instance
+        # (and its fitted state) alive
+        solve = _build_solver(copy.deepcopy(model), maxiter, tol)
+        if batched:
+            solve = jax.vmap(solve)
+        # Lowering traces model.evaluate once; the compiled executable no
+        # longer depends on which backend is active.
+        with backend.using("jax"), diagnostics.phase("compile"):
+            compiled = jax.jit(solve).lower(init_params, t_arr, y_arr).compile()
+        _COMPILED_SOLVERS[key] = compiled
+        if len(_COMPILED_SOLVERS) > _MAX_COMPILED_SOLVERS:
+            _COMPILED_SOLVERS.popitem(last=False)
+    return compiled
 
 
 class JaxFitter:
-    """A fitter class that will use JAX for model estimation (Phase 2)."""
+    """A fitter class that uses JAX and LBFGS for model estimation.
+
+    The loss and solver are traced and compiled once per model class,
+    parameter layout and series length, and reused by every later fit of the
+    same shape, so fitting thousands of series pays for a single compilation.
+    ``fit_batch`` additionally ``jax.vmap``s the solve over many series.
+    Each fit records a :class:`FitDiagnostics` in ``diagnostics``, with any
+    compilation timed as a separate ``"compile"`` phase.
+
+    Args:
+        maxiter: Maximum number of LBFGS iterations.
+        tol: Tolerance of the LBFGS stopping criterion.
+    """
+
+    def __init__(self, maxiter: int = 500, tol: float = 1e-3):
+        self.maxiter = maxiter
+        self.tol = tol
+        self.n_iter = None
+        self.diagnostics: Optional[FitDiagnostics] = None
 
     def fit(
         self, model: DiffusionModel, t: Sequence[float], y: Sequence[float], **kwargs
     ) -> Dict[str, float]:
-        t_arr = jnp.asarray(t)
-        y_arr = jnp.asarray(y)
+        """
+        Fits the model to one series.
 
-        original_backend = current_backend
-        use_backend("jax")
+        Args:
+            model: The model to fit. Its ``params_`` are set on success.
+            t: Time points.
+            y: Observed data.
+            **kwargs: ``p0`` overrides ``model.initial_guesses``; other keyword
+                arguments are accepted for compatibility and ignored.
 
-        @jax.jit
-        def loss_fn(params_array):
-            # Temporarily set model parameters for prediction within the loss function
-            predictions = model.cumulative_adoption(t_arr, *params_array)
-            return jnp.sum((y_arr - predictions) ** 2)
+        Returns:
+            The fitted parameters.
+        """
+        diagnostics = FitDiagnostics(type(self).__name__)
+        t_arr = jnp.asarray(t, dtype=float)
+        y_arr = jnp.asarray(y, dtype=float)
+        with diagnostics.phase("initial_guesses"):
+            p0 = kwargs.get("p0")
+            if p0 is None:
+                p0 = list(model.initial_guesses(t, y).values())
+            initial_params = jnp.asarray(p0, dtype=t_arr.dtype)
 
-        initial_params = jnp.array(list(model.initial_guesses(t, y).values()))
+        solve = _compiled_solver(
+            model,
+            initial_params,
+            t_arr,
+            y_arr,
+            self.maxiter,
+            self.tol,
+            False,
+            diagnostics,
+        )
+        with diagnostics.phase("optimization"):
+            params, stats = jax.block_until_ready(solve(initial_params, t_arr, y_arr))
+        self._record(diagnostics, stats)
+        self.n_iter = int(stats[0])
 
-        opt = LBFGS(fun=loss_fn)
-        sol = opt.run(init_params=initial_params)
+        model.params_ = dict(zip(model.param_names, params))
+        with diagnostics.phase("predict"):
+            residuals = np.asarray(y_arr) - np.ravel(model.evaluate(params, t_arr))
+            diagnostics.cost = float(np.sum(residuals**2))
+        model.diagnostics_ = self.diagnostics = diagnostics
+        return model.params_
 
-        model.params_ = dict(zip(model.param_names, sol.params))
+    def fit_batch(
+        self,
+        model: DiffusionModel,
+        t: Sequence[float],
+        y_batched: Sequence[Sequence[float]],
+        p0: Sequence[float] = None,
+    ) -> np.ndarray:
+        """
+        Fits the model to K series with a single vmapped LBFGS solve.
 
-        use_backend(
-            original_backend.__class__.__name__.lower().replace("backend", "")
-        )  # Restore original backend
+        ``model`` is only used as a template and is left unchanged.
 
-        return model.params_
+        Args:
+            model: The model fitted to every series.
+            t: Time points, either shared of shape (T,) or per series (K, T).
+            y_batched: Observed data of shape (K, T).
+            p0: Initial parameters, either one vector of length P or a (K, P)
+                matrix. If None, ``model.initial_guesses`` is used per series.
+
+        Returns:
+            The fitted parameters as a (K, P) array whose columns follow
+            ``model.param_names``. ``n_iter`` holds the per-series iteration
+            counts.
+        """
+        diagnostics = FitDiagnostics(type(self).__name__)
+        y_arr = jnp.atleast_2d(jnp.asarray(y_batched, dtype=float))
+        t_arr = jnp.broadcast_to(jnp.asarray(t, dtype=float), y_arr.shape)
+        shape = (len(y_arr), len(model.param_names))
+        with diagnostics.phase("initial_guesses"):
+            if p0 is None:
+                t_np, y_np = np.asarray(t_arr), np.asarray(y_arr)
+                p0 = [
+                    list(model.initial_guesses(t_np[k], y_np[k]).values())
+                    for k in range(len(y_np))
+                ]
+            initial_params = jnp.broadcast_to(jnp.asarray(p0, dtype=t_arr.dtype), shape)
+
+        solve = _compiled_solver(
+            model,
+            initial_params,
+            t_arr,
+            y_arr,
+            self.maxiter,
+            self.tol,
+            True,
+            diagnostics,
+        )
+        with diagnostics.phase("optimization"):
+            params, stats = jax.block_until_ready(solve(initial_params, t_arr, y_arr))
+        self._record(diagnostics, stats)
+        self.n_iter = np.asarray(stats[0])
+        self.diagnostics = diagnostics
+        return np.asarray(params)
+
+    def _record(self, diagnostics: FitDiagnostics, stats) -> None:
+        """Copies LBFGS counters into ``diagnostics``, summed over a batch."""
+        n_iter, n_fun, n_grad, error = (np.asarray(value) for value in stats)
+        diagnostics.n_iter = int(n_iter.max())
+        diagnostics.nfev = int(n_fun.sum())
+        diagnostics.njev = int(n_grad.sum())
+        if np.all(error <= self.tol):
+            diagnostics.status = "converged"
+        elif np.any(n_iter >= self.maxiter):
+            diagnostics.status = "max_iter"
+        else:
+            diagnostics.status = "failed"
+        diagnostics.message = f"max gradient error {float(np.max(error)):.3g}"
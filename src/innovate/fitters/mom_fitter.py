@@ -1,7 +1,8 @@
 import numpy as np
 import pandas as pd
-from typing import Sequence, Tuple, Dict
+from typing import Optional, Sequence, Tuple, Dict
 from innovate.base.base import DiffusionModel
+from innovate.fitters.diagnostics import FitDiagnostics
 
 
 def estimate_bass_mom(
@@ -110,14 +111,115 @@ def estimate_bass_mom(
     return p, q, m
 
 
+def estimate_bass_mom_batch(
+    t: Sequence[float], y_batched: Sequence[Sequence[float]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Estimates Bass parameters for K series at once using the Method of Moments.
+
+    Fits the same quadratic regression of incremental on lagged cumulative
+    adoptions as :func:`estimate_bass_mom`, but for all series with a single
+    stacked least-squares solve. Each series is scaled by its maximum first,
+    which keeps the regressions well conditioned. Instead of raising, series
+    without a valid solution are flagged in the returned mask.
+
+    Args:
+        t: Evenly spaced time points shared by every series. The rates p and
+            q are expressed per unit of ``t``.
+        y_batched: Cumulative adoptions of shape (K, len(t)).
+
+    Returns:
+        A tuple (p, q, m, valid) of arrays of length K. Entries where
+        ``valid`` is False are NaN.
+    """
+    t_arr = np.asarray(t, dtype=float)
+    y_arr = np.atleast_2d(np.asarray(y_batched, dtype=float))
+    if y_arr.shape[1] != len(t_arr) or len(t_arr) < 4:
+        raise ValueError(
+            "y_batched must have shape (K, len(t)) with at least 4 data points."
+        )
+
+    scale = np.max(np.abs(y_arr), axis=1)
+    scale = np.where(scale > 0, scale, 1.0)
+    y_scaled = y_arr / scale[:, None]
+    incremental = np.diff(y_scaled, axis=1)
+    lagged = y_scaled[:, :-1]
+    X = np.stack([np.ones_like(lagged), lagged, lagged**2], axis=-1)
+    # Minimum-norm least squares for every series in one batched pseudo-inverse
+    a, b, c = np.moveaxis(np.linalg.pinv(X) @ incremental[..., None], 1, 0)[..., 0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root = np.sqrt(b**2 - 4 * a * c)
+        m_candidates = np.stack([(-b + root) / (2 * c), (-b - root) / (2 * c)])
+        admissible = np.isfinite(m_candidates) & (m_candidates >= 1.0)
+        # In scaled units the maximum observed adoption is 1; prefer the larger m
+        m_scaled = np.max(np.where(admissible, m_candidates, -np.inf), axis=0)
+        p = a / m_scaled
+        q = -c * m_scaled
+
+    dt = np.median(np.diff(t_arr))
+    p, q, m = p / dt, q / dt, m_scaled * scale
+    valid = np.isfinite(m_scaled) & np.isfinite(p) & (p > 0) & np.isfinite(q) & (q > 0)
+    return (
+        np.where(valid, p, np.nan),
+        np.where(valid, q, np.nan),
+        np.where(valid, m, np.nan),
+        valid,
+    )
+
+
+def bass_mom_initial_guesses(
+    model: DiffusionModel, t: Sequence[float], y_batched: Sequence[Sequence[float]]
+) -> Optional[np.ndarray]:
+    """
+    Builds per-series initial guesses seeded with batch Method of Moments estimates.
+
+    Args:
+        model: The model about to be fitted.
+        t: Time points shared by every series.
+        y_batched: Cumulative adoptions of shape (K, len(t)).
+
+    Returns:
+        A (K, P) array of initial guesses in ``model.param_names`` order,
+        where p, q and m come from :func:`estimate_bass_mom_batch` wherever
+        that estimate is valid and from ``model.initial_guesses`` elsewhere,
+        clipped to ``model.bounds``.
+        None if ``model`` is not a single-regime BassModel or the series are
+        too short.
+    """
+    from innovate.diffuse.bass import BassModel
+
+    if not isinstance(model, BassModel) or model.t_event is not None:
+        return None
+    y_arr = np.atleast_2d(np.asarray(y_batched, dtype=float))
+    if len(np.asarray(t)) < 4:
+        return None
+
+    guesses = np.array(
+        [list(model.initial_guesses(t, series).values()) for series in y_arr],
+        dtype=float,
+    )
+    limits = np.array(
+        [list(model.bounds(t, series).values()) for series in y_arr], dtype=float
+    )
+    p, q, m, valid = estimate_bass_mom_batch(t, y_arr)
+    for name, values in (("p", p), ("q", q), ("m", m)):
+        j = model.param_names.index(name)
+        guesses[valid, j] = values[valid]
+    return np.clip(guesses, limits[..., 0], limits[..., 1])
+
+
 class MoMFitter:
     """
     Fitter for the Bass Diffusion Model using the Method of Moments (MoM).
     This fitter is specifically designed for the BassModel.
+    The work done by the last fit is recorded in ``diagnostics``; the
+    closed-form estimate needs no objective evaluations.
     """
 
     def __init__(self):
         self._params: Dict[str, float] = {}
+        self.diagnostics: Optional[FitDiagnostics] = None
 
     def fit(
         self, model: DiffusionModel, t: Sequence[float], y: Sequence[float]
@@ -141,8 +243,19 @@ class MoMFitter:
         if not isinstance(model, BassModel):
             raise TypeError("MoMFitter can only fit BassModel instances.")
 
-        p, q, m = estimate_bass_mom(t, y)
+        diagnostics = FitDiagnostics(type(self).__name__)
+        with diagnostics.phase("optimization"):
+            try:
+                p, q, m = estimate_bass_mom(t, y)
+            except (ValueError, RuntimeError) as e:
+                diagnostics.status, diagnostics.message = "failed", str(e)
+                self.diagnostics = diagnostics
+                raise
         model.params_ = {"p": p, "q": q, "m": m}
+        with diagnostics.phase("predict"):
+            residuals = np.ravel(y) - np.ravel(model.predict(t))
+            diagnostics.cost = float(np.sum(residuals**2))
+        model.diagnostics_ = self.diagnostics = diagnostics
         self._params = model.params_  # Store fitted parameters internally
         return model
 
@@ -0,0 +1,222 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import multiprocessing
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from scipy.stats import qmc
+from innovate.base.base import DiffusionModel
+from innovate.fitters.scipy_fitter import ScipyFitter
+
+SAMPLERS = ("lhs", "sobol")
+
+
+def _sse(model: DiffusionModel, params, t, y, weights, covariates) -> float:
+    with np.errstate(over="ignore", invalid="ignore"):
+        residuals = y - np.asarray(model.evaluate(params, t, covariates)).ravel()
+        sse = float(np.sum(weights * residuals**2))
+    return sse if np.isfinite(sse) else np.inf
+
+
+def _refine(model, fitter, t, y, p0, bounds, weights, covariates, kwargs):
+    """Runs one local fit from ``p0``, returning ``(params, sse)``."""
+    try:
+        params = fitter.estimate(
+            model,
+            t,
+            y,
+            p0=list(p0),
+            bounds=bounds,
+            weights=weights,
+            covariates=covariates,
+            **kwargs,
+        )
+    except RuntimeError:
+        return None, np.inf
+    w = 1.0 if weights is None else np.asarray(weights, dtype=float)
+    return np.asarray(params, dtype=float), _sse(model, params, t, y, w, covariates)
+
+
+class MultiStartFitter:
+    """A global fitter that runs local fits from many quasi-random starts.
+
+    Starts are drawn from the box given by ``model.bounds`` with a Latin
+    hypercube or scrambled Sobol sequence; infinite bounds are replaced by a
+    window around ``model.initial_guesses``, which is always included as the
+    first start. All starts are screened with one ``model.predict_many``
+    call, and only the ``n_refine`` lowest-SSE starts are refined with the
+    local ``fitter``. Refinements run in SSE order, optionally in a process
+    pool, and outstanding ones are cancelled as soon as ``n_agree`` of them
+    have reached the same optimum, i.e. an SSE within ``rtol`` of the best.
+
+    Args:
+        fitter: Local optimizer with a side-effect-free ``estimate`` method,
+            such as :class:`ScipyFitter` (the default).
+        n_starts: Number of sampled starts to screen.
+        n_refine: Maximum number of starts refined by the local fitter.
+        sampler: ``"lhs"`` for Latin hypercube or ``"sobol"`` for a
+            scrambled Sobol sequence.
+        n_agree: Number of refinements that must agree on the best optimum
+            before the remaining ones are cancelled.
+        rtol: Relative SSE tolerance within which two optima agree.
+        n_workers: Number of worker processes. ``None`` or ``1`` refines
+            serially in the current process.
+        random_state: Seed for the start sampler.
+        mp_context: Start method for the worker processes (e.g. ``"spawn"``),
+            or ``None`` for the platform default.
+    """
+
+    def __init__(
+        self,
+        fitter=None,
+        n_starts: int = 64,
+        n_refine: int = 8,
+        sampler: str = "lhs",
+        n_agree: int = 3,
+        rtol: float = 1e-6,
+        n_workers: Optional[int] = None,
+        random_state=None,
+        mp_context: Optional[str] = None,
+    ):
+        if sampler not in SAMPLERS:
+            raise ValueError(
+                f"Unknown sampler '{sampler}'. Expected one of {SAMPLERS}."
+            )
+        if n_refine < 1 or n_agree < 1:
+            raise ValueError("`n_refine` and `n_agree` must be at least 1.")
+        self.fitter = fitter if fitter is not None else ScipyFitter()
+        self.n_starts = n_starts
+        self.n_refine = n_refine
+        self.sampler = sampler
+        self.n_agree = n_agree
+        self.rtol = rtol
+        self.n_workers = n_workers
+        self.random_state = random_state
+        self.mp_context = mp_context
+        self.starts: Optional[np.ndarray] = None
+        self.start_sse: Optional[np.ndarray] = None
+        self.refined: List[Tuple[np.ndarray, float]] = []
+        self.best_sse: Optional[float] = None
+
+    def fit(
+        self,
+        model: DiffusionModel,
+        t: Sequence[float],
+        y: Sequence[float],
+        p0: Sequence[float] = None,
+        bounds: tuple = None,
+        weights: Sequence[float] = None,
+        covariates: Dict[str, Sequence[float]] = None,
+        **kwargs,
+    ) -> "MultiStartFitter":
+        """
+        Fits the model from many starts and keeps the best local optimum.
+
+        Args:
+            model: The model to fit. Its ``params_`` are set to the best optimum.
+            t: Time points.
+            y: Observed data.
+            p0: Optional extra start, screened alongside the sampled ones.
+            bounds: A ``(lower, upper)`` pair. If None, ``model.bounds`` is used.
+            weights: Weights for the observed data points.
+            covariates: Optional covariate time series, forwarded to the model.
+            kwargs: Additional keyword arguments for the local fitter.
+
+        Returns:
+            The fitter instance.
+
+        Raises:
+            RuntimeError: If every refinement fails.
+        """
+        t_arr = np.asarray(t, dtype=float)
+        y_arr = np.asarray(y, dtype=float).ravel()
+        if bounds is None:
+            limits = list(model.bounds(t, y).values())
+            bounds = ([b[0] for b in limits], [b[1] for b in limits])
+        lower = np.asarray(bounds[0], dtype=float)
+        upper = np.asarray(bounds[1], dtype=float)
+
+        starts = self._sample_starts(model, t, y, lower, upper, p0)
+        w = 1.0 if weights is None else np.asarray(weights, dtype=float)
+        self.starts = starts
+        self.start_sse = self._screen(model, t_arr, y_arr, starts, w, covariates)
+
+        order = np.argsort(self.start_sse, kind="stable")
+        order = order[np.isfinite(self.start_sse[order])][: self.n_refine]
+        args = (model, self.fitter, t_arr, y_arr)
+        extra = ((list(lower), list(upper)), weights, covariates, kwargs)
+        if self.n_workers is None or self.n_workers <= 1:
+            self.refined = []
+            for i in order:
+                self.refined.append(_refine(*args, starts[i], *extra))
+                if self._agreed():
+                    break
+        else:
+            self.refined = self._refine_parallel(args, extra, starts[order])
+
+        successful = [
+            (params, sse) for params, sse in self.refined if params is not None
+        ]
+        if not successful:
+            raise RuntimeError("Fitting failed: no start could be refined.")
+        best_params, self.best_sse = min(successful, key=lambda result: result[1])
+        model.params_ = dict(zip(model.param_names, best_params))
+        return self
+
+    def _sample_starts(self, model, t, y, lower, upper, p0) -> np.ndarray:
+        guess = np.asarray(list(model.initial_guesses(t, y).values()), dtype=float)
+        guess = np.clip(guess, lower, upper)
+        # Replace infinite bounds by a window around the initial guesses
+        span = 2 * np.maximum(np.abs(guess), 1.0)
+        lo = np.where(np.isfinite(lower), lower, guess - span)
+        hi = np.where(np.isfinite(upper), upper, np.maximum(guess, lo) + span)
+
+        n_params = len(guess)
+        seed = np.random.default_rng(self.random_state)
+        if self.sampler == "sobol":
+            engine = qmc.Sobol(n_params, scramble=True, seed=seed)
+        else:
+            engine = qmc.LatinHypercube(n_params, seed=seed)
+        sampled = qmc.scale(engine.random(self.n_starts), lo, hi)
+
+        extra = [guess]
+        if p0 is not None:
+            extra.append(np.clip(np.asarray(p0, dtype=float), lower, upper))
+        return np.vstack(extra + [sampled])
+
+    def _screen(self, model, t, y, starts, w, covariates) -> np.ndarray:
+        """Computes the SSE of every start, in one batch where possible."""
+        if covariates:
+            return np.array([_sse(model, s, t, y, w, covariates) for s in starts])
+        with np.errstate(over="ignore", invalid="ignore"):
+            predictions = model.predict_many(t, starts).reshape(len(starts), -1)
+            sse = np.sum(w * (y - predictions) ** 2, axis=1)
+        return np.where(np.isfinite(sse), sse, np.inf)
+
+    def _agreed(self) -> bool:
+        sse = np.array([s for _, s in self.refined])
+        if not np.isfinite(sse).any():
+            return False
+        best = sse.min()
+        agreeing = np.abs(sse - best) <= self.rtol * max(abs(best), 1e-300)
+        return int(agreeing.sum()) >= self.n_agree
+
+    def _refine_parallel(self, args, extra, starts):
+        self.refined = []
+        with ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=(
+                multiprocessing.get_context(self.mp_context)
+                if self.mp_context
+                else None
+            ),
+        ) as executor:
+            pending = {
+                executor.submit(_refine, *args, start, *extra) for start in starts
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                self.refined.extend(future.result() for future in done)
+                if self._agreed():
+                    for future in pending:
+                        future.cancel()
+                    break
+        return self.refined
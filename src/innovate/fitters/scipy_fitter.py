@@ -1,13 +1,96 @@
-from typing import Sequence
+from typing import Dict, Optional, Sequence
 from typing_extensions import Self
 import numpy as np
-from scipy.optimize import curve_fit
+import pandas as pd
+from scipy.optimize import curve_fit, least_squares
 from innovate.base.base import DiffusionModel
 from innovate.compete.competition import MultiProductDiffusionModel  # Import the model
+from innovate.fitters.diagnostics import FitDiagnostics
+from innovate.fitters.mom_fitter import bass_mom_initial_guesses
+
+
+def _group_columns(pattern: np.ndarray) -> np.ndarray:
+    """Greedily assigns Jacobian columns with disjoint non-zero rows to groups."""
+    groups = np.empty(pattern.shape[1], dtype=int)
+    used_rows = []
+    for j, rows in enumerate(pattern.T):
+        for g in range(len(used_rows)):
+            if not (used_rows[g] & rows).any():
+                used_rows[g] |= rows
+                break
+        else:
+            g = len(used_rows)
+            used_rows.append(rows.copy())
+        groups[j] = g
+    return groups
+
+
+def _grouped_jacobian(residuals, sparsity, bounds, diff_step: float):
+    """
+    Forward-difference Jacobian that perturbs each group of columns at once.
+
+    Columns that never touch the same residual (per the ``sparsity``
+    pattern) share one residual evaluation, so the cost of a Jacobian
+    depends on the interaction structure rather than on the number of
+    parameters. The dense result keeps least_squares on its exact
+    trust-region solver. Steps that would cross an upper bound are taken
+    backwards, and steps too wide for either side shrink to the larger gap.
+    """
+    pattern = np.asarray(sparsity.todense()) != 0
+    groups = _group_columns(np.unique(pattern, axis=0))
+    lower, upper = (np.asarray(b, dtype=float) for b in bounds)
+
+    def jacobian(x):
+        f0 = residuals(x)
+        h = diff_step * np.maximum(1.0, np.abs(x))
+        room_up, room_down = upper - x, x - lower
+        h = np.where(
+            h <= room_up,
+            h,
+            np.where(
+                h <= room_down,
+                -h,
+                np.where(room_up >= room_down, room_up, -room_down),
+            ),
+        )
+        J = np.zeros((len(f0), len(x)))
+        for g in range(groups.max() + 1):
+            columns = np.flatnonzero(groups == g)
+            x_step = x.copy()
+            x_step[columns] += h[columns]
+            df = residuals(x_step) - f0
+            J[:, columns] = np.where(pattern[:, columns], df[:, None], 0.0) / h[columns]
+        return J
+
+    return jacobian
+
+
+def _panel_observations(model, t, y) -> np.ndarray:
+    """Returns the (T, N) observations of a multi-product panel in product order.
+
+    DataFrame columns are selected by ``model.names``, so extra or reordered
+    columns are ignored.
+    """
+    if isinstance(y, pd.DataFrame):
+        y = y[list(model.names)]
+    y_arr = np.asarray(y, dtype=float)
+    if y_arr.shape != (len(t), model.N):
+        raise ValueError(
+            f"Observed data must have shape (len(t), N) = ({len(t)}, {model.N})."
+        )
+    return y_arr
 
 
 class ScipyFitter:
-    """A fitter class that uses SciPy's curve_fit for model estimation."""
+    """A fitter class that uses SciPy's curve_fit for model estimation.
+
+    After each :meth:`fit`, ``diagnostics`` (also attached to the model as
+    ``model.diagnostics_``) is a :class:`FitDiagnostics` record of the
+    function and Jacobian evaluations, ODE work and phase timings.
+    """
+
+    def __init__(self):
+        self.diagnostics: Optional[FitDiagnostics] = None
 
     def fit(
         self,
@@ -17,6 +100,7 @@ class ScipyFitter:
         p0: Sequence[float] = None,
         bounds: tuple = None,
         weights: Sequence[float] = None,
+        covariates: Dict[str, Sequence[float]] = None,
         **kwargs,
     ) -> Self:
         """
@@ -26,10 +110,14 @@ class ScipyFitter:
             model: An instance of a DiffusionModel (e.g., BassModel, GompertzModel, LogisticModel).
             t: Time points (independent variable).
             y: Observed adoption data (dependent variable).
-            p0: Initial guesses for the parameters. If None, model.initial_guesses() is used.
+            p0: Initial guesses for the parameters. If None, model.initial_guesses() is used,
+                with p, q and m of a BassModel taken from estimate_bass_mom_batch() when valid.
             bounds: Bounds for the parameters. If None, model.bounds() is used.
             weights: Weights for the observed data points.
+            covariates: Optional covariate time series, forwarded to the model.
             kwargs: Additional keyword arguments to pass to scipy.optimize.curve_fit.
+                If the model exposes a ``jacobian(t)`` method and no ``jac`` is
+                given, the analytic Jacobian is passed to curve_fit.
 
         Returns:
             The fitter instance.
@@ -37,50 +125,203 @@ class ScipyFitter:
         Raises:
             RuntimeError: If fitting fails.
         """
+        # Set before estimating so that a failed fit can be inspected
+        self.diagnostics = diagnostics = FitDiagnostics(type(self).__name__)
+        popt = self._estimate(
+            model,
+            t,
+            y,
+            p0,
+            bounds,
+            weights,
+            covariates,
+            diagnostics,
+            **kwargs,
+        )
+        if isinstance(model, MultiProductDiffusionModel):
+            y = _panel_observations(model, t, y)
+        with diagnostics.phase("predict"):
+            residuals = np.ravel(y) - np.ravel(model.evaluate(popt, t, covariates))
+            diagnostics.cost = float(np.sum(residuals**2))
+        if isinstance(model, MultiProductDiffusionModel):
+            p, Q, m = model.unpack_params(popt)
+            model.p, model.Q, model.m = p, Q, m
+            model.params_ = {"p": p.tolist(), "Q": Q.tolist(), "m": m.tolist()}
+        else:
+            model.params_ = dict(zip(model.param_names, popt))
+        model.diagnostics_ = diagnostics
+        return self
+
+    def estimate(
+        self,
+        model: DiffusionModel,
+        t: Sequence[float],
+        y: Sequence[float],
+        p0: Sequence[float] = None,
+        bounds: tuple = None,
+        weights: Sequence[float] = None,
+        covariates: Dict[str, Sequence[float]] = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Estimates parameters without modifying ``model``.
+
+        Takes the same arguments as :meth:`fit` but returns the optimal
+        parameter vector (in ``model.param_names`` order) instead of writing
+        it to ``model.params_``. The objective goes through
+        ``model.evaluate``, so a single model instance can be used as a
+        template from several threads at once.
+        """
+        return self._estimate(
+            model,
+            t,
+            y,
+            p0,
+            bounds,
+            weights,
+            covariates,
+            FitDiagnostics(type(self).__name__),
+            **kwargs,
+        )
+
+    def _estimate(
+        self, model, t, y, p0, bounds, weights, covariates, diagnostics, **kwargs
+    ) -> np.ndarray:
+        """Runs :meth:`estimate`, recording the work done in ``diagnostics``."""
         t_arr = np.array(t)
         y_arr = np.array(y)
         sigma = 1.0 / np.sqrt(weights) if weights is not None else None
 
-        # Check for MultiProductDiffusionModel and handle accordingly
+        # Multi-product panels are fitted with least_squares instead
         if isinstance(model, MultiProductDiffusionModel):
-            raise NotImplementedError(
-                "Fitting MultiProductDiffusionModel with ScipyFitter is not yet implemented"
+            return self._estimate_multi_product(
+                model, t_arr, y, p0, bounds, sigma, diagnostics, **kwargs
             )
         else:
             y_arr = y_arr.flatten()
 
             def fit_function(t, *params):
-                param_dict = dict(zip(model.param_names, params))
-                model.params_ = param_dict
-                return model.predict(t).flatten()
+                diagnostics.nfev += 1
+                return np.asarray(model.evaluate(params, t, covariates)).flatten()
 
             x_fit = t_arr
 
-        # Determine initial guesses if not provided
-        if p0 is None:
-            p0 = list(model.initial_guesses(t, y).values())
+            # Use the model's analytic Jacobian instead of finite differences.
+            jacobian = getattr(model, "jacobian", None)
+            if callable(jacobian) and "jac" not in kwargs:
 
-        # Determine bounds if not provided
-        if bounds is None:
-            lower_bounds = [b[0] for b in model.bounds(t, y).values()]
-            upper_bounds = [b[1] for b in model.bounds(t, y).values()]
-            bounds = (lower_bounds, upper_bounds)
+                def jac_function(t, *params):
+                    diagnostics.njev += 1
+                    if covariates:
+                        return jacobian(t, covariates, params=params)
+                    return jacobian(t, params=params)
+
+                kwargs["jac"] = jac_function
+
+        # Determine initial guesses if not provided, seeding Bass models with
+        # their Method of Moments estimates where those are valid
+        with diagnostics.phase("initial_guesses"):
+            if p0 is None:
+                mom_guesses = bass_mom_initial_guesses(model, t_arr, y_arr[None, :])
+                if mom_guesses is not None:
+                    p0 = list(mom_guesses[0])
+                else:
+                    p0 = list(model.initial_guesses(t, y).values())
+
+            # Determine bounds if not provided
+            if bounds is None:
+                lower_bounds = [b[0] for b in model.bounds(t, y).values()]
+                upper_bounds = [b[1] for b in model.bounds(t, y).values()]
+                bounds = (lower_bounds, upper_bounds)
 
         try:
-            popt, _ = curve_fit(
-                fit_function,
-                x_fit,
-                y_arr,
-                p0=p0,
-                bounds=bounds,
-                sigma=sigma,
-                absolute_sigma=True,
-                **kwargs,
-            )
-            model.params_ = dict(zip(model.param_names, popt))
+            with diagnostics.phase("optimization"):
+                popt, _, _, mesg, _ = curve_fit(
+                    fit_function,
+                    x_fit,
+                    y_arr,
+                    p0=p0,
+                    bounds=bounds,
+                    sigma=sigma,
+                    absolute_sigma=True,
+                    full_output=True,
+                    **kwargs,
+                )
         except ValueError as e:
+            diagnostics.status, diagnostics.message = "failed", str(e)
             raise RuntimeError(f"Fitting failed due to invalid parameters or data: {e}")
         except RuntimeError as e:
+            # curve_fit raises instead of returning when it runs out of
+            # evaluations: "maxfev" with "lm", the long form with "trf"
+            message = str(e)
+            exhausted = "maxfev" in message or "maximum number of function" in message
+            diagnostics.status = "max_iter" if exhausted else "failed"
+            diagnostics.message = message
             raise RuntimeError(f"Fitting failed: {e}")
 
-        return self
+        diagnostics.message = mesg
+        diagnostics.status = "converged"
+        return popt
+
+    def _estimate_multi_product(
+        self, model, t_arr, y, p0, bounds, sigma, diagnostics, **kwargs
+    ) -> np.ndarray:
+        """
+        Fits a (T, N) panel of a MultiProductDiffusionModel with least_squares.
+
+        The parameter vector follows ``model.pack_params``, and only the
+        entries in ``model.free_params`` are optimised. Finite differences
+        use the sparsity pattern from ``model.jac_sparsity``, so products
+        that cannot influence each other are perturbed together.
+        """
+        y_arr = _panel_observations(model, t_arr, y)
+        if sigma is not None:
+            sigma = np.broadcast_to(np.asarray(sigma, dtype=float).T, y_arr.T.shape).T
+
+        with diagnostics.phase("initial_guesses"):
+            if p0 is None:
+                p0 = model.pack_params(model.p, model.Q, model.m)
+            p0 = np.asarray(p0, dtype=float)
+            if bounds is None:
+                n_q = len(p0) - 2 * model.N
+                lower = np.concatenate(
+                    [np.zeros(model.N), np.full(n_q, -np.inf), y_arr.max(axis=0)]
+                )
+                bounds = (lower, np.full(len(p0), np.inf))
+            p0 = np.clip(p0, bounds[0], bounds[1])
+
+        # Entries of Q outside the interaction mask keep their values from p0
+        free = model.free_params
+        bounds = tuple(np.broadcast_to(b, p0.shape)[free] for b in bounds)
+
+        def full_params(x):
+            params = p0.copy()
+            params[free] = x
+            return params
+
+        # Tight tolerances keep the ODE solution smooth under finite differences
+        ode_tol = {"rtol": 1e-10, "atol": 1e-10 * max(float(np.max(y_arr)), 1.0)}
+
+        def residuals(x):
+            diagnostics.nfev += 1
+            r = model.evaluate(full_params(x), t_arr, **ode_tol) - y_arr
+            return (r if sigma is None else r / sigma).ravel()
+
+        if "jac" not in kwargs and "jac_sparsity" not in kwargs:
+            kwargs["jac"] = _grouped_jacobian(
+                residuals,
+                model.jac_sparsity(len(t_arr))[:, free],
+                bounds,
+                kwargs.pop("diff_step", 1e-6),
+            )
+        kwargs.setdefault("x_scale", "jac")
+
+        with diagnostics.phase("optimization"):
+            result = least_squares(residuals, p0[free], bounds=bounds, **kwargs)
+        diagnostics.njev = int(result.njev or 0)
+        diagnostics.message = result.message
+        if not result.success:
+            diagnostics.status = "failed" if result.status < 0 else "max_iter"
+            raise RuntimeError(f"Fitting failed: {result.message}")
+        diagnostics.status = "converged"
+        return full_params(result.x)
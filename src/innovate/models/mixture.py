@@ -132,6 +132,30 @@ class MixtureModel(DiffusionModel):
         y_pred = B.sum(component_preds * self.weights[:, None], axis=0)
         return y_pred
 
+    def evaluate(
+        self,
+        params: Sequence[float],
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+    ) -> Sequence[float]:
+        """
+        Predicts with explicit parameter values without updating the submodels.
+
+        ``params`` follows ``param_names``: each submodel's parameters in turn,
+        followed by the component weights.
+        """
+        t_arr = B.array(t)
+        component_preds = []
+        offset = 0
+        for model in self.models:
+            n_params = len(model.param_names)
+            component_preds.append(
+                B.array(model.evaluate(params[offset : offset + n_params], t_arr))
+            )
+            offset += n_params
+        weights = B.array(params[offset : offset + self.num_components])
+        return B.sum(B.stack(component_preds) * weights[:, None], axis=0)
+
     @property
     def params_(self) -> Dict[str, float]:
         return self._params
@@ -2,6 +2,24 @@ import numpy as np
 from typing import Sequence, Dict
 from innovate.base.base import DiffusionModel
 from scipy.integrate import odeint
+from innovate.utils.sensitivity import sse_and_gradient
+from innovate.backend import current_backend as B
+
+
+def _lock_in_kernel(y, t, params):
+    """
+    Right-hand side over a flat ``param_names`` array, in the NumPy subset
+    that the Numba backend compiles. Matches ``differential_equation``.
+    """
+    alpha1, alpha2, beta1, beta2 = params[0], params[1], params[2], params[3]
+    gamma1, gamma2, m = params[4], params[5], params[6]
+    n1 = max(0.0, min(y[0], m))
+    n2 = max(0.0, min(y[1], m))
+    share = 1 - (n1 + n2) / m
+    dydt = np.empty(2)
+    dydt[0] = alpha1 * n1 * share + beta1 * n1 * (n1 / m) - gamma1 * n1 * (n2 / m)
+    dydt[1] = alpha2 * n2 * share + beta2 * n2 * (n2 / m) - gamma2 * n2 * (n1 / m)
+    return dydt
 
 
 class LockInModel(DiffusionModel):
@@ -86,22 +104,136 @@ class LockInModel(DiffusionModel):
 
         return [dn1_dt, dn2_dt]
 
+    def _rhs(self, y, t, params):
+        return self.differential_equation(y, t, *params)
+
+    @staticmethod
+    def _clamp_derivatives(y, m):
+        """Derivatives of ``clip(y, 0, m)`` with respect to y and to m."""
+        y = np.asarray(y, dtype=float)
+        return ((y > 0) & (y < m)).astype(float), (y >= m).astype(float)
+
+    def ode_jacobians(self, y, t, params):
+        """
+        Jacobians of the right-hand side for the forward sensitivity equations.
+
+        The populations are clamped to [0, m] as in
+        :meth:`differential_equation`; a clamped population does not respond
+        to its own value, and one clamped at m follows m.
+
+        Returns:
+            A tuple with the derivatives with respect to (n1, n2), of shape
+            (2, 2), and with respect to ``param_names``, of shape (2, 7).
+        """
+        alpha1, alpha2, beta1, beta2, gamma1, gamma2, m = params
+        n1 = max(0, min(y[0], m))
+        n2 = max(0, min(y[1], m))
+        share = 1 - (n1 + n2) / m
+        d_state = np.array(
+            [
+                [
+                    alpha1 * share - (alpha1 * n1 - 2 * beta1 * n1 + gamma1 * n2) / m,
+                    -(alpha1 + gamma1) * n1 / m,
+                ],
+                [
+                    -(alpha2 + gamma2) * n2 / m,
+                    alpha2 * share - (alpha2 * n2 - 2 * beta2 * n2 + gamma2 * n1) / m,
+                ],
+            ]
+        )
+        dm1 = (alpha1 * n1 * (n1 + n2) - beta1 * n1**2 + gamma1 * n1 * n2) / m**2
+        dm2 = (alpha2 * n2 * (n1 + n2) - beta2 * n2**2 + gamma2 * n1 * n2) / m**2
+        d_params = np.array(
+            [
+                [n1 * share, 0.0, n1**2 / m, 0.0, -n1 * n2 / m, 0.0, dm1],
+                [0.0, n2 * share, 0.0, n2**2 / m, 0.0, -n1 * n2 / m, dm2],
+            ]
+        )
+        if not (0 < y[0] < m and 0 < y[1] < m):
+            inside, at_m = self._clamp_derivatives(y, m)
+            d_params[:, -1] += d_state @ at_m
+            d_state = d_state * inside
+        return d_state, d_params
+
+    @staticmethod
+    def batch_rhs(y, t, params):
+        """
+        Right-hand side for K systems at once, as used by ``solve_ode_batch``.
+
+        Args:
+            y: States of shape (K, 2).
+            t: Times of shape (K,); the equations are autonomous.
+            params: Parameters of shape (K, 7) in ``param_names`` order.
+
+        Returns:
+            Derivatives of shape (K, 2).
+        """
+        alpha1, alpha2, beta1, beta2, gamma1, gamma2, m = (
+            params[:, i] for i in range(7)
+        )
+        # Clamped with where so that the JAX backend can trace the equations
+        y = B.where(y < 0, 0.0, B.where(y > m[:, None], m[:, None], y))
+        n1, n2 = y[:, 0], y[:, 1]
+        share = 1 - (n1 + n2) / m
+        dn1_dt = alpha1 * n1 * share + beta1 * n1 * (n1 / m) - gamma1 * n1 * (n2 / m)
+        dn2_dt = alpha2 * n2 * share + beta2 * n2 * (n2 / m) - gamma2 * n2 * (n1 / m)
+        return B.stack([dn1_dt, dn2_dt]).T
+
+    def simulate_many(
+        self,
+        t: Sequence[float],
+        params_matrix: Sequence[Sequence[float]],
+        y0: Sequence[float],
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Simulates both technologies for K parameter vectors in one batched solve.
+
+        Unlike ``predict_many`` on single-curve models, every trajectory needs
+        initial adoptions and has two columns, hence the separate name.
+
+        Args:
+            t: Time points shared by every trajectory.
+            params_matrix: Array of shape (K, 7) in ``param_names`` order.
+            y0: Initial adoptions, of shape (2,) for all trajectories or (K, 2).
+            kwargs: Passed to the active backend's ``solve_ode_batch``.
+
+        Returns:
+            An array of shape (K, len(t), 2), clipped to [0, m] as in
+            :meth:`predict`.
+        """
+        params_matrix = self._check_params_matrix(params_matrix)
+        y0 = np.broadcast_to(np.asarray(y0, dtype=float), (len(params_matrix), 2))
+        sol = B.solve_ode_batch(self.batch_rhs, y0, t, params_matrix, **kwargs)
+        return np.clip(sol, 0, params_matrix[:, -1, None, None])
+
     def predict(self, t: Sequence[float], y0: Sequence[float]) -> np.ndarray:
         if not self._params:
             raise RuntimeError("Model parameters have not been set.")
 
-        sol = odeint(
-            self.differential_equation,
-            y0,
-            t,
-            args=tuple(self._params.values()),
-        )
+        solve_ode_kernel = getattr(B, "solve_ode_kernel", None)
+        if solve_ode_kernel is not None:
+            params = [self._params[name] for name in self.param_names]
+            sol = solve_ode_kernel(_lock_in_kernel, y0, t, params)
+        else:
+            sol = odeint(
+                self.differential_equation,
+                y0,
+                t,
+                args=tuple(self._params.values()),
+            )
         sol = np.maximum(0, sol)
         m = self._params.get("m", np.inf)
         sol = np.minimum(sol, m)
         return sol
 
     def fit(self, t: Sequence[float], y: np.ndarray, **kwargs):
+        """
+        Fits the model to the data.
+
+        The gradient of the squared-error objective comes from the forward
+        sensitivity equations, so each optimizer step costs one ODE solve.
+        """
         from scipy.optimize import minimize
 
         y = np.array(y)
@@ -113,9 +245,24 @@ class LockInModel(DiffusionModel):
         y0 = y[0, :]
 
         def objective(params, t, y_obs):
-            self.params_ = dict(zip(self.param_names, params))
-            y_pred = self.predict(t, y0)
-            return np.sum((y_obs - y_pred) ** 2)
+            m = params[-1]
+
+            def clip_output(y_pred, sensitivities):
+                # Clip the trajectory and its derivatives as predict() does
+                inside, at_m = self._clamp_derivatives(y_pred, m)
+                sensitivities = sensitivities * inside[..., None]
+                sensitivities[..., -1] += at_m
+                return np.clip(y_pred, 0, m), sensitivities
+
+            return sse_and_gradient(
+                self._rhs,
+                self.ode_jacobians,
+                y0,
+                t,
+                params,
+                y_obs,
+                output=clip_output,
+            )
 
         initial_params = list(self.initial_guesses(t, y).values())
         param_bounds = list(self.bounds(t, y).values())
@@ -126,6 +273,7 @@ class LockInModel(DiffusionModel):
             args=(t, y),
             bounds=param_bounds,
             method="L-BFGS-B",
+            jac=True,
             **kwargs,
         )
 
@@ -1,4 +1,5 @@
-import matplotlib.pyplot as plt
+# matplotlib is imported inside each function so that importing the
+# package does not load it
 import pandas as pd
 from typing import Sequence, Optional
 
@@ -25,6 +26,8 @@ def plot_diffusion_curve(
         ylabel: Y-axis label.
         save_path: Optional path to save the plot (e.g., 'plot.png').
     """
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
     plt.plot(t, y_obs, "o", label="Observed", alpha=0.6)
     plt.plot(t, y_pred, "-", label="Predicted", linewidth=2)
@@ -58,6 +61,8 @@ def plot_multi_product_diffusion(
         ylabel: Y-axis label.
         save_path: Optional path to save the plot (e.g., 'plot.png').
     """
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 7))
 
     # Plot predicted curves
@@ -1,6 +1,13 @@
 # src/innovate/preprocess/__init__.py
 
-from .decomposition import stl_decomposition
-from .time_series import rolling_average, sarima_fit
+from innovate.utils.lazy import attach
 
-__all__ = ["stl_decomposition", "rolling_average", "sarima_fit"]
+# Both modules wrap statsmodels, which is only imported once a helper is used
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "stl_decomposition": ".decomposition",
+        "rolling_average": ".time_series",
+        "sarima_fit": ".time_series",
+    },
+)
@@ -5,6 +5,7 @@ from typing import Sequence, Dict, List
 import numpy as np
 
 from innovate.backend import current_backend as B
+from innovate.fitters.diagnostics import record_ode_solve
 
 
 class CompositeDiffusionModel(DiffusionModel):
@@ -133,6 +134,7 @@ class CompositeDiffusionModel(DiffusionModel):
             rtol=1e-6,
             atol=1e-6,
         )
+        record_ode_solve(sol.nfev)
         return sol.sol(t).T
 
     def differential_equation(self, t, y, params):
@@ -2,6 +2,7 @@
 
 from innovate.base.base import DiffusionModel
 from innovate import backend
+from innovate.utils.initializers import fisher_pry_initial_params
 from typing import Sequence, Dict
 import numpy as np
 
@@ -28,33 +29,22 @@ class FisherPryModel(DiffusionModel):
     ) -> Dict[str, float]:
         """
         Provides initial guesses for the model parameters.
-        - t0 is estimated as the time at which the market share is closest to 50%.
-        - alpha is estimated from a linearization of the logistic function.
+        - alpha and t0 come from a weighted least-squares fit of the logit
+          linearization log(y / (1 - y)) = alpha * (t - t0).
+        - If the data admit no increasing fit, t0 falls back to the time at
+          which the market share is closest to 50% and alpha to 0.5.
         """
-        y_arr = backend.current_backend.array(y)
-        t_arr = backend.current_backend.array(t)
-
-        # Estimate t0 as the time when market share is closest to 0.5
-        t0_guess = t_arr[
-            backend.current_backend.argmin(backend.current_backend.abs(y_arr - 0.5))
-        ]
-
-        # Linearize the logistic equation: log(y / (1 - y)) = alpha * (t - t0)
-        # To avoid division by zero or log of zero, we clip y
-        y_clipped = backend.current_backend.clip(y_arr, 1e-6, 1 - 1e-6)
-        linearized_y = backend.current_backend.log(y_clipped / (1 - y_clipped))
-
-        # Perform a linear regression to find the slope (alpha)
-        try:
-            # Using polyfit for a simple linear regression
-            slope, _ = np.polyfit(t_arr, linearized_y, 1)
-            alpha_guess = max(0, slope)  # Ensure alpha is non-negative
-        except (np.linalg.LinAlgError, ValueError):
-            alpha_guess = 0.5  # Fallback value
-
+        alpha_guess, t0_guess = (float(v[0]) for v in fisher_pry_initial_params(t, y))
+        if not np.isfinite(alpha_guess):
+            y_arr = np.asarray(y, dtype=float)
+            t_arr = np.asarray(t, dtype=float)
+            alpha_guess = 0.5
+            t0_guess = t_arr[np.argmin(np.abs(y_arr - 0.5))]
+
+        t0_bounds = self.bounds(t, y)["t0"]
         return {
             "alpha": alpha_guess,
-            "t0": t0_guess,
+            "t0": float(np.clip(t0_guess, *t0_bounds)),
         }
 
     def bounds(self, t: Sequence[float], y: Sequence[float]) -> Dict[str, tuple]:
@@ -83,11 +73,91 @@ class FisherPryModel(DiffusionModel):
         if not self._params:
             raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
 
+        return self.evaluate([self._params["alpha"], self._params["t0"]], t)
+
+    def evaluate(
+        self, params: Sequence[float], t: Sequence[float], covariates=None
+    ) -> Sequence[float]:
+        """
+        Predicts market share fractions for explicit (alpha, t0) values without touching ``params_``.
+
+        Args:
+            params: The parameter values in ``param_names`` order.
+            t: A sequence of time points.
+            covariates: Unused; accepted for interface compatibility.
+
+        Returns:
+            A sequence of predicted market share fractions (between 0 and 1).
+        """
+        alpha, t0 = params
         t_arr = backend.current_backend.array(t)
-        alpha = self._params["alpha"]
-        t0 = self._params["t0"]
         return 1 / (1 + backend.current_backend.exp(-alpha * (t_arr - t0)))
 
+    def predict_many(
+        self, t: Sequence[float], params_matrix: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Predicts market share fractions for K parameter vectors at once.
+
+        Args:
+            t: A sequence of time points shared by every parameter vector.
+            params_matrix: An array of shape (K, 2) with columns alpha and t0.
+
+        Returns:
+            An array of shape (K, len(t)).
+        """
+        params = self._params_columns(params_matrix)
+        t_arr = np.asarray(t, dtype=float)
+        return 1 / (1 + np.exp(-params["alpha"] * (t_arr - params["t0"])))
+
+    def jacobian(
+        self,
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]] = None,
+        params: Sequence[float] = None,
+    ) -> np.ndarray:
+        """
+        Returns the analytic Jacobian of :meth:`predict` with respect to alpha and t0.
+
+        Args:
+            t: A sequence of time points.
+            covariates: Unused; accepted for interface compatibility.
+            params: Optional (alpha, t0) values. Defaults to ``params_``.
+
+        Returns:
+            An array of shape ``(len(t), 2)``.
+        """
+        if params is None:
+            if not self._params:
+                raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
+            params = [self._params["alpha"], self._params["t0"]]
+
+        t_arr = np.asarray(t, dtype=float)
+        alpha, t0 = params
+        y = 1 / (1 + np.exp(-alpha * (t_arr - t0)))
+        slope = y * (1 - y)
+        return np.stack([slope * (t_arr - t0), -slope * alpha], axis=-1)
+
+    def jacobian_many(
+        self, t: Sequence[float], params_matrix: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Returns the analytic Jacobian for K parameter vectors at once.
+
+        Args:
+            t: A sequence of time points shared by every parameter vector.
+            params_matrix: An array of shape (K, 2) with columns alpha and t0.
+
+        Returns:
+            An array of shape (K, len(t), 2).
+        """
+        params = self._params_columns(params_matrix)
+        t_arr = np.asarray(t, dtype=float)
+        alpha, t0 = params["alpha"], params["t0"]
+        y = 1 / (1 + np.exp(-alpha * (t_arr - t0)))
+        slope = y * (1 - y)
+        return np.stack([slope * (t_arr - t0), -slope * alpha], axis=-1)
+
     def score(self, t: Sequence[float], y: Sequence[float]) -> float:
         """
         Calculates the R^2 score for the model fit.
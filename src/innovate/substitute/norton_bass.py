@@ -1,20 +1,45 @@
 from ..base import DiffusionModel
 from innovate.backend import current_backend as B
+from innovate.utils.covariates import prepare_covariates
+from innovate.fitters.diagnostics import record_ode_solve
 import numpy as np
 from typing import Sequence, Dict
 
 
+def _norton_bass_kernel(y, t, params):
+    """
+    Right-hand side without covariates over the flat (p, q, m) parameters,
+    in the NumPy subset that the Numba backend compiles.
+    """
+    n = y.shape[0]
+    dydt = np.zeros(n)
+    # Adoptions of later generations cannibalize earlier ones
+    later = 0.0
+    for i in range(n - 1, -1, -1):
+        p, q, m = params[i], params[n + i], params[2 * n + i]
+        if m > 0:
+            dydt[i] = (p + q * y[i] / m) * (m - y[i] - later)
+        later += y[i]
+    return dydt
+
+
 class NortonBassModel(DiffusionModel):
     """
     Norton-Bass Model for successive generations of technologies.
     """
 
-    def __init__(self, n_generations: int = 1, covariates: Sequence[str] = None):
+    def __init__(
+        self,
+        n_generations: int = 1,
+        covariates: Sequence[str] = None,
+        covariate_interpolation: str = "linear",
+    ):
         if n_generations < 1:
             raise ValueError("Number of generations must be at least 1.")
         self.n_generations = n_generations
         self._params: Dict[str, float] = {}
         self.covariates = covariates if covariates else []
+        self.covariate_interpolation = covariate_interpolation
 
     @property
     def param_names(self) -> Sequence[str]:
@@ -82,10 +107,16 @@ class NortonBassModel(DiffusionModel):
         # Set a small initial value for the first generation to kickstart the diffusion
         y0[0] = 1e-6
 
-        params = [self._params[name] for name in self.param_names]
+        params = np.array([self._params[name] for name in self.param_names])
+        covariates = prepare_covariates(covariates, t, self.covariate_interpolation)
+        solve_ode_kernel = getattr(B, "solve_ode_kernel", None)
+        if solve_ode_kernel is not None and not covariates:
+            return solve_ode_kernel(
+                _norton_bass_kernel, y0, t, params[: 3 * self.n_generations]
+            )
 
-        def ode_func(t, y):
-            return self.differential_equation(t, y, params, covariates, t)
+        def ode_func(t_i, y):
+            return self.differential_equation(t_i, y, params, covariates, t)
 
         sol = solve_ivp(
             ode_func,
@@ -94,6 +125,7 @@ class NortonBassModel(DiffusionModel):
             t_eval=t,
             method="LSODA",
         )
+        record_ode_solve(sol.nfev)
         return sol.y.T
 
     def differential_equation(self, t, y, params, covariates, t_eval):
@@ -109,15 +141,21 @@ class NortonBassModel(DiffusionModel):
         q_t = B.array(q_base)
         m_t = B.array(m_base)
 
+        covariates = prepare_covariates(
+            covariates, t_eval, self.covariate_interpolation
+        )
         if covariates:
-            param_idx = 3 * self.n_generations
-            for cov_name, cov_values in covariates.items():
-                cov_val_t = np.interp(t, t_eval, cov_values)
-                for i in range(self.n_generations):
-                    p_t[i] += params[param_idx] * cov_val_t
-                    q_t[i] += params[param_idx + 1] * cov_val_t
-                    m_t[i] += params[param_idx + 2] * cov_val_t
-                    param_idx += 3
+            cov_val_t = covariates(t)
+            offset = 3 * self.n_generations
+            n_betas = 3 * self.n_generations * len(cov_val_t)
+            # Per covariate, one (p, q, m) row of coefficients per generation.
+            betas = np.reshape(
+                params[offset : offset + n_betas], (-1, self.n_generations, 3)
+            )
+            effects = np.tensordot(cov_val_t, betas, axes=1)
+            p_t = p_t + effects[:, 0]
+            q_t = q_t + effects[:, 1]
+            m_t = m_t + effects[:, 2]
 
         dydt = B.zeros_like(y)
 
@@ -164,12 +202,37 @@ class NortonBassModel(DiffusionModel):
             raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
 
         y_pred = self.predict(t, covariates)
-        params = [self._params[name] for name in self.param_names]
+        return self._trajectory_rate(t, y_pred, covariates)
 
-        rates = B.array(
-            [
-                self.differential_equation(ti, yi, params, covariates, t)
-                for ti, yi in zip(t, y_pred)
-            ]
-        )
-        return rates
+    def _trajectory_rate(
+        self,
+        t: Sequence[float],
+        y_pred: np.ndarray,
+        covariates: Dict[str, Sequence[float]] = None,
+    ) -> np.ndarray:
+        """
+        Adoption rates along a whole trajectory in one vectorized pass.
+
+        Equivalent to calling :meth:`differential_equation` at every row of
+        ``y_pred`` (shape ``(len(t), n_generations)``).
+        """
+        n = self.n_generations
+        params = np.array([self._params[name] for name in self.param_names])
+        y = np.asarray(y_pred, dtype=float).reshape(len(t), n)
+        p_t = np.broadcast_to(params[:n], y.shape)
+        q_t = np.broadcast_to(params[n : 2 * n], y.shape)
+        m_t = np.broadcast_to(params[2 * n : 3 * n], y.shape)
+
+        covariates = prepare_covariates(covariates, t, self.covariate_interpolation)
+        if covariates:
+            betas = params[3 * n : 3 * n + 3 * n * len(covariates)].reshape(-1, n, 3)
+            effects = np.tensordot(covariates.values(t), betas, axes=1)
+            p_t = p_t + effects[..., 0]
+            q_t = q_t + effects[..., 1]
+            m_t = m_t + effects[..., 2]
+
+        # Adoption of every later generation cannibalizes generation i.
+        cannibalization = np.cumsum(y[:, ::-1], axis=1)[:, ::-1] - y
+        m_safe = np.where(m_t > 0, m_t, 1.0)
+        rates = (p_t + q_t * y / m_safe) * (m_t - y - cannibalization)
+        return B.array(np.where(m_t > 0, rates, 0.0))
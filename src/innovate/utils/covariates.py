@@ -0,0 +1,123 @@
+import bisect
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+INTERPOLATION_KINDS = ("linear", "cubic")
+
+
+class CovariateInterpolant:
+    """Piecewise-polynomial interpolant over a set of covariate series.
+
+    The polynomial coefficients for every interval are computed once, so an
+    ODE right-hand side can look up all covariates at a time point with a
+    single interval search and a Horner evaluation instead of one
+    ``np.interp`` call per covariate. On an evenly spaced grid the interval
+    index is found arithmetically in O(1). Outside the sampled range the
+    end values are held constant, matching ``np.interp``.
+
+    Args:
+        t: Time points at which the covariates are sampled.
+        covariates: A dictionary of covariate names and their values.
+        kind: ``"linear"`` for piecewise-linear interpolation (the historical
+            behaviour) or ``"cubic"`` for a not-a-knot cubic spline.
+        names: Order of the covariates in the returned vectors. Defaults to
+            the dictionary order.
+    """
+
+    def __init__(
+        self,
+        t: Sequence[float],
+        covariates: Dict[str, Sequence[float]],
+        kind: str = "linear",
+        names: Optional[Sequence[str]] = None,
+    ):
+        if kind not in INTERPOLATION_KINDS:
+            raise ValueError(
+                f"Unknown interpolation kind '{kind}'. "
+                f"Expected one of {INTERPOLATION_KINDS}."
+            )
+        self.kind = kind
+        self.names = list(covariates) if names is None else list(names)
+        t = np.asarray(t, dtype=float)
+        values = np.column_stack(
+            [np.asarray(covariates[name], dtype=float) for name in self.names]
+        )
+        if values.shape[0] != len(t):
+            raise ValueError("Covariate series must have the same length as `t`.")
+
+        self._t = t
+        self._knots = t.tolist()
+        self._n_intervals = max(len(t) - 1, 1)
+        if len(t) == 1:
+            coeffs = values[None, :, :]
+        elif kind == "linear":
+            slopes = np.diff(values, axis=0) / np.diff(t)[:, None]
+            coeffs = np.stack([slopes, values[:-1]])
+        else:
+            from scipy.interpolate import CubicSpline
+
+            coeffs = CubicSpline(t, values, axis=0).c
+        # (interval, power, covariate), highest power first, so that a lookup
+        # is a single dot product of the powers of dx with one table row.
+        self._coeffs = np.ascontiguousarray(coeffs.transpose(1, 0, 2))
+        self._order = self._coeffs.shape[1]
+
+        steps = np.diff(t)
+        self._step = None
+        if len(steps) and np.allclose(steps, steps[0]):
+            self._step = float(steps[0])
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _interval(self, t: float) -> int:
+        if self._step is not None:
+            i = int((t - self._knots[0]) / self._step)
+        else:
+            i = bisect.bisect_right(self._knots, t) - 1
+        return min(max(i, 0), self._n_intervals - 1)
+
+    def __call__(self, t: float) -> np.ndarray:
+        """Returns the covariate values at a scalar time as a vector."""
+        t = min(max(float(t), self._knots[0]), self._knots[-1])
+        i = self._interval(t)
+        dx = t - self._knots[i]
+        if self._order == 2:
+            powers = (dx, 1.0)
+        elif self._order == 4:
+            powers = (dx * dx * dx, dx * dx, dx, 1.0)
+        else:
+            powers = (1.0,)
+        return np.dot(powers, self._coeffs[i])
+
+    def values(self, t: Sequence[float]) -> np.ndarray:
+        """Evaluates the covariates at many time points, shape ``(len(t), n)``."""
+        t = np.clip(np.asarray(t, dtype=float), self._t[0], self._t[-1])
+        i = np.clip(
+            np.searchsorted(self._t, t, side="right") - 1, 0, self._n_intervals - 1
+        )
+        dx = (t - self._t[i])[:, None]
+        coeffs = self._coeffs[i]
+        result = coeffs[:, 0]
+        for power in range(1, self._order):
+            result = result * dx + coeffs[:, power]
+        return result
+
+
+def prepare_covariates(
+    covariates: Union[Dict[str, Sequence[float]], CovariateInterpolant, None],
+    t: Sequence[float],
+    kind: str = "linear",
+    names: Optional[Sequence[str]] = None,
+) -> Optional[CovariateInterpolant]:
+    """Builds a :class:`CovariateInterpolant` once, ahead of an ODE solve.
+
+    Already prepared interpolants are returned unchanged and empty covariates
+    yield ``None``, so model code can call this unconditionally.
+    """
+    if isinstance(covariates, CovariateInterpolant):
+        return covariates
+    if not covariates or (names is not None and not len(names)):
+        return None
+    return CovariateInterpolant(t, covariates, kind=kind, names=names)
@@ -0,0 +1,185 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+# Candidate saturation levels, as multiples of the largest observation. Every
+# candidate is linearised and scored, and the best one is kept per series.
+SATURATION_GRID = (
+    1.001,
+    1.005,
+    1.01,
+    1.02,
+    1.05,
+    1.1,
+    1.2,
+    1.35,
+    1.5,
+    1.75,
+    2.0,
+    2.5,
+    3.0,
+)
+
+_EPS = 1e-9
+
+
+def _as_batch(t, y_batched) -> Tuple[np.ndarray, np.ndarray]:
+    y = np.atleast_2d(np.asarray(y_batched, dtype=float))
+    t = np.broadcast_to(np.asarray(t, dtype=float), y.shape)
+    return t, y
+
+
+def _weighted_line(x, z, w) -> Tuple[np.ndarray, np.ndarray]:
+    """Weighted least-squares line ``z = intercept + slope * x`` along the last axis.
+
+    Rows with fewer than two weighted points yield NaN.
+    """
+    sw = w.sum(axis=-1)
+    sw_safe = np.where(sw > 0, sw, 1.0)
+    x_mean = (w * x).sum(axis=-1) / sw_safe
+    z_mean = (w * z).sum(axis=-1) / sw_safe
+    dx = x - x_mean[..., None]
+    sxx = (w * dx * dx).sum(axis=-1)
+    sxz = (w * dx * (z - z_mean[..., None])).sum(axis=-1)
+    slope = np.where(sxx > 0, sxz / np.where(sxx > 0, sxx, 1.0), np.nan)
+    return slope, z_mean - slope * x_mean
+
+
+def _best_candidate(y, curves, ok):
+    """Index of the lowest-SSE admissible candidate along axis 1."""
+    observed = np.isfinite(y)[:, None, :]
+    residuals = np.where(observed, y[:, None, :] - curves, 0.0)
+    sse = np.where(ok, np.sum(residuals**2, axis=-1), np.inf)
+    return np.argmin(sse, axis=1), np.isfinite(np.min(sse, axis=1))
+
+
+def _logit_fit(t, y, saturation):
+    """Logit-linearised fits for a (K, G) grid of saturation levels.
+
+    Returns the slope and intercept of ``logit(y / L)`` against ``t``, each
+    of shape (K, G), and the back-transformed curves of shape (K, G, T).
+    """
+    L = saturation[..., None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = y[:, None, :] / L
+    valid = np.isfinite(u) & (u > 0) & (u < 1)
+    u_c = np.clip(np.where(np.isfinite(u), u, 0.5), _EPS, 1 - _EPS)
+    z = np.log(u_c / (1 - u_c))
+    # Delta method: var(logit(u)) is proportional to 1 / (u * (1 - u))**2.
+    w = np.where(valid, (u_c * (1 - u_c)) ** 2, 0.0)
+    tt = np.broadcast_to(t[:, None, :], z.shape)
+    slope, intercept = _weighted_line(tt, z, w)
+    with np.errstate(over="ignore", invalid="ignore"):
+        curves = L / (1 + np.exp(-(intercept[..., None] + slope[..., None] * tt)))
+    return slope, intercept, curves
+
+
+def logistic_initial_params(
+    t: Sequence[float], y_batched: Sequence[Sequence[float]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Estimates logistic parameters (L, k, x0) from the logit linearisation.
+
+    For every candidate saturation level in :data:`SATURATION_GRID`,
+    ``logit(y / L) = k * t - k * x0`` is fitted by weighted least squares,
+    with weights from the delta method so that points near 0 or L, where the
+    transform amplifies noise, count less. The candidate whose
+    back-transformed curve has the smallest squared error is kept. All series
+    are processed at once.
+
+    Args:
+        t: Time points, shared of shape (T,) or per series (K, T).
+        y_batched: Observed cumulative values of shape (K, T) or (T,).
+
+    Returns:
+        A tuple (L, k, x0) of arrays of length K. Series without a usable
+        increasing linearisation are NaN.
+    """
+    t_arr, y_arr = _as_batch(t, y_batched)
+    y_max = np.nanmax(np.where(np.isfinite(y_arr), y_arr, -np.inf), axis=1)
+    saturation = y_max[:, None] * np.asarray(SATURATION_GRID)
+    slope, intercept, curves = _logit_fit(t_arr, y_arr, saturation)
+    ok = np.isfinite(slope) & (slope > 0) & (saturation > 0)
+    best, found = _best_candidate(y_arr, curves, ok)
+
+    rows = np.arange(len(y_arr))
+    k = slope[rows, best]
+    x0 = -intercept[rows, best] / np.where(found, k, 1.0)
+    L = saturation[rows, best]
+    return (
+        np.where(found, L, np.nan),
+        np.where(found, k, np.nan),
+        np.where(found, x0, np.nan),
+    )
+
+
+def fisher_pry_initial_params(
+    t: Sequence[float], y_batched: Sequence[Sequence[float]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimates Fisher-Pry parameters (alpha, t0) from the logit linearisation.
+
+    Market shares saturate at 1, so ``logit(y) = alpha * t - alpha * t0`` is
+    fitted directly by weighted least squares, as in
+    :func:`logistic_initial_params`.
+
+    Args:
+        t: Time points, shared of shape (T,) or per series (K, T).
+        y_batched: Observed market share fractions of shape (K, T) or (T,).
+
+    Returns:
+        A tuple (alpha, t0) of arrays of length K. Series without a usable
+        increasing linearisation are NaN.
+    """
+    t_arr, y_arr = _as_batch(t, y_batched)
+    saturation = np.ones((len(y_arr), 1))
+    slope, intercept, _ = _logit_fit(t_arr, y_arr, saturation)
+    alpha, intercept = slope[:, 0], intercept[:, 0]
+    found = np.isfinite(alpha) & (alpha > 0)
+    t0 = -intercept / np.where(found, alpha, 1.0)
+    return np.where(found, alpha, np.nan), np.where(found, t0, np.nan)
+
+
+def gompertz_initial_params(
+    t: Sequence[float], y_batched: Sequence[Sequence[float]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimates Gompertz parameters (a, c) from the log-log linearisation.
+
+    For every candidate ceiling ``a`` in :data:`SATURATION_GRID`,
+    ``log(-log(y / a)) = log(-log(y0 / a)) - c * (t - t0)`` is fitted by
+    weighted least squares, with delta-method weights ``(u * log(u))**2``
+    for ``u = y / a``. The candidate whose back-transformed curve has the
+    smallest squared error is kept. All series are processed at once.
+
+    Args:
+        t: Time points, shared of shape (T,) or per series (K, T).
+        y_batched: Observed cumulative values of shape (K, T) or (T,).
+
+    Returns:
+        A tuple (a, c) of arrays of length K. Series without a usable
+        increasing linearisation are NaN.
+    """
+    t_arr, y_arr = _as_batch(t, y_batched)
+    y_max = np.nanmax(np.where(np.isfinite(y_arr), y_arr, -np.inf), axis=1)
+    saturation = y_max[:, None] * np.asarray(SATURATION_GRID)
+
+    a = saturation[..., None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = y_arr[:, None, :] / a
+    valid = np.isfinite(u) & (u > 0) & (u < 1)
+    u_c = np.clip(np.where(np.isfinite(u), u, 0.5), _EPS, 1 - _EPS)
+    z = np.log(-np.log(u_c))
+    w = np.where(valid, (u_c * np.log(u_c)) ** 2, 0.0)
+    tt = np.broadcast_to(t_arr[:, None, :], z.shape)
+    slope, intercept = _weighted_line(tt, z, w)
+    with np.errstate(over="ignore", invalid="ignore"):
+        curves = a * np.exp(-np.exp(intercept[..., None] + slope[..., None] * tt))
+
+    ok = np.isfinite(slope) & (slope < 0) & (saturation > 0)
+    best, found = _best_candidate(y_arr, curves, ok)
+    rows = np.arange(len(y_arr))
+    return (
+        np.where(found, saturation[rows, best], np.nan),
+        np.where(found, -slope[rows, best], np.nan),
+    )
@@ -0,0 +1,48 @@
+from importlib import import_module
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def attach(
+    package: str,
+    submodules: Sequence[str] = (),
+    attributes: Optional[Dict[str, str]] = None,
+) -> Tuple[Callable, Callable, List[str]]:
+    """Builds a lazy ``__getattr__`` for a package (PEP 562).
+
+    Submodules and the attributes re-exported from them are only imported on
+    first access, so importing the package itself stays cheap even when its
+    modules depend on heavy optional libraries. A loaded attribute is cached
+    in the package namespace and later lookups bypass ``__getattr__``.
+
+    Usage in a package ``__init__``::
+
+        __getattr__, __dir__, __all__ = attach(
+            __name__, attributes={"InnovationModel": ".model"}
+        )
+
+    Args:
+        package: Name of the package, normally ``__name__``.
+        submodules: Submodules exposed as attributes of the package.
+        attributes: Maps each re-exported name to the module, relative to the
+            package, that defines it.
+
+    Returns:
+        A tuple (__getattr__, __dir__, __all__) for the package namespace.
+    """
+    attributes = dict(attributes or {})
+    names = list(submodules) + list(attributes)
+
+    def __getattr__(name):
+        if name in attributes:
+            value = getattr(import_module(attributes[name], package), name)
+        elif name in submodules:
+            value = import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(import_module(package), name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(import_module(package))) | set(names))
+
+    return __getattr__, __dir__, names
@@ -13,7 +13,6 @@ from .metrics import (
     calculate_aic,
     calculate_bic,
 )
-from statsmodels.tsa.stattools import acf, pacf
 
 
 def model_aic(model: DiffusionModel, t: Sequence[float], y: Sequence[float]) -> float:
@@ -156,6 +155,8 @@ def residual_acf(
     model: DiffusionModel, t: Sequence[float], y: Sequence[float], nlags: int = 40
 ) -> np.ndarray:
     """Return the autocorrelation function of model residuals."""
+    from statsmodels.tsa.stattools import acf
+
     residuals = compute_residuals(model, t, y)
     return acf(residuals, nlags=nlags)
 
@@ -164,5 +165,7 @@ def residual_pacf(
     model: DiffusionModel, t: Sequence[float], y: Sequence[float], nlags: int = 40
 ) -> np.ndarray:
     """Return the partial autocorrelation function of model residuals."""
+    from statsmodels.tsa.stattools import pacf
+
     residuals = compute_residuals(model, t, y)
     return pacf(residuals, nlags=nlags)
@@ -1,7 +1,6 @@
 import pandas as pd
 import numpy as np
 from typing import Sequence, Tuple, Union
-from statsmodels.tsa.seasonal import STL
 
 
 def ensure_datetime_index(
@@ -48,6 +47,8 @@ def apply_stl_decomposition(
                 "Period must be specified for STL decomposition if data length is too short for inference."
             )
 
+    from statsmodels.tsa.seasonal import STL
+
     try:
         stl = STL(data, period=period, robust=robust)
         res = stl.fit()
@@ -0,0 +1,165 @@
+import threading
+
+import jax
+import numpy as np
+import pytest
+
+from innovate import backend
+from innovate.backends.jax_backend import JaxBackend
+from innovate.backends.numpy_backend import NumPyBackend
+from innovate.diffuse import gompertz
+
+
+def test_using_scopes_backend_to_block():
+    assert isinstance(backend.get_backend(), NumPyBackend)
+    with backend.using("jax") as active:
+        assert isinstance(active, JaxBackend)
+        assert backend.get_backend() is active
+        with backend.using("numpy"):
+            assert isinstance(backend.get_backend(), NumPyBackend)
+        assert backend.get_backend() is active
+    assert isinstance(backend.get_backend(), NumPyBackend)
+
+
+def test_import_time_bindings_follow_active_backend():
+    # gompertz binds ``current_backend as B`` when it is imported
+    x = np.zeros(3)
+
+    assert isinstance(gompertz.B.exp(x), np.ndarray)
+    with backend.using("jax"):
+        assert isinstance(gompertz.B.exp(x), jax.Array)
+    assert isinstance(gompertz.B.exp(x), np.ndarray)
+
+
+def test_using_is_local_to_thread():
+    seen = {}
+    inside = threading.Event()
+    release = threading.Event()
+
+    def serve():
+        inside.wait()
+        seen["other"] = backend.get_backend()
+        release.set()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    with backend.using("jax"):
+        inside.set()
+        release.wait()
+        seen["own"] = backend.get_backend()
+    thread.join()
+
+    assert isinstance(seen["own"], JaxBackend)
+    assert isinstance(seen["other"], NumPyBackend)
+
+
+def test_use_backend_sets_process_default():
+    try:
+        backend.use_backend("jax")
+        assert isinstance(backend.get_backend(), JaxBackend)
+        with backend.using("numpy"):
+            assert isinstance(backend.get_backend(), NumPyBackend)
+    finally:
+        backend.use_backend("numpy")
+    with pytest.raises(ValueError, match="Unknown backend"):
+        backend.use_backend("torch")
+
+
+def _logistic_batch_rhs(y, t, params):
+    return params[:, :1] * y * (1 - y / params[:, 1:2])
+
+
+def _robertson_batch_rhs(y, t, params):
+    a, b, c = y[:, 0], y[:, 1], y[:, 2]
+    k1, k2, k3 = params[:, 0], params[:, 1], params[:, 2]
+    return np.stack(
+        [-k1 * a + k3 * b * c, k1 * a - k3 * b * c - k2 * b**2, k2 * b**2], axis=1
+    )
+
+
+def test_solve_ode_batch_matches_closed_form():
+    t = np.linspace(0, 10, 21)
+    params = np.array([[0.5, 100.0], [1.2, 50.0], [2.0, 10.0]])
+    y0 = np.array([[1.0], [2.0], [0.5]])
+    r, K = params[:, :1], params[:, 1:]
+    expected = K / (1 + (K / y0 - 1) * np.exp(-r * t))
+
+    solution = NumPyBackend().solve_ode_batch(
+        _logistic_batch_rhs, y0, t, params, rtol=1e-8, atol=1e-10
+    )
+
+    assert solution.shape == (3, len(t), 1)
+    np.testing.assert_allclose(solution[..., 0], expected, rtol=1e-6)
+
+
+def test_solve_ode_batch_stiff_method():
+    from scipy.integrate import odeint
+
+    t = np.array([0.0, 1.0, 10.0, 100.0])
+    params = np.array([[0.04, 3e7, 1e4], [0.08, 3e7, 1e4]])
+    y0 = np.array([1.0, 0.0, 0.0])
+    expected = [
+        odeint(
+            lambda y, t_i, p: _robertson_batch_rhs(y[None], t_i, p[None])[0],
+            y0,
+            t,
+            args=(p,),
+            rtol=1e-10,
+            atol=1e-14,
+        )
+        for p in params
+    ]
+
+    solution = NumPyBackend().solve_ode_batch(
+        _robertson_batch_rhs, [y0, y0], t, params, method="ROS2", atol=1e-10
+    )
+
+    np.testing.assert_allclose(solution, expected, rtol=1e-3, atol=1e-9)
+    with pytest.raises(ValueError, match="Unknown method"):
+        NumPyBackend().solve_ode_batch(
+            _robertson_batch_rhs, [y0], t, params[:1], method="Euler"
+        )
+
+
+def test_jax_solve_ode_batch_matches_numpy():
+    t = np.linspace(0, 10, 6)
+    params = np.array([[0.5, 100.0], [1.2, 50.0]])
+    y0 = np.array([[1.0], [2.0]])
+
+    expected = NumPyBackend().solve_ode_batch(_logistic_batch_rhs, y0, t, params)
+    solution = JaxBackend().solve_ode_batch(_logistic_batch_rhs, y0, t, params)
+
+    np.testing.assert_allclose(np.asarray(solution), expected, rtol=1e-4)
+
+
+def test_numba_backend_kernels_match_numpy():
+    pytest.importorskip("numba")
+    from innovate.compete.competition import MultiProductDiffusionModel
+    from innovate.path_dependence.lock_in import LockInModel
+    from innovate.substitute.norton_bass import NortonBassModel
+
+    t = np.linspace(0, 50, 51)
+    lock_in = LockInModel()
+    lock_in.params_ = dict(
+        zip(lock_in.param_names, [0.1, 0.08, 0.005, 0.007, 0.001, 0.001, 1000.0])
+    )
+    norton_bass = NortonBassModel(n_generations=3)
+    norton_bass.params_ = dict(
+        zip(norton_bass.param_names, [0.03, 0.02, 0.01, 0.2, 0.3, 0.4, 1e3, 1.5e3, 800])
+    )
+    multi_product = MultiProductDiffusionModel(
+        p=[0.02, 0.015], Q=[[0.3, 0.05], [0.03, 0.25]], m=[1000, 800]
+    )
+    predictions = [
+        lambda: lock_in.predict(t, [1.0, 1.0]),
+        lambda: norton_bass.predict(t),
+        lambda: multi_product.predict(t).values,
+    ]
+
+    for predict in predictions:
+        expected = predict()
+        with backend.using("numba") as numba_backend:
+            assert hasattr(numba_backend, "solve_ode_kernel")
+            np.testing.assert_allclose(
+                predict(), expected, rtol=1e-3, atol=1e-3 * np.max(expected)
+            )
@@ -1,7 +1,14 @@
+import os
+import subprocess
+import sys
+
 import pytest
 import numpy as np
+import innovate
 from innovate.fitters.batched_fitter import BatchedFitter
 from innovate.fitters.scipy_fitter import ScipyFitter
+from innovate.diffuse.bass import BassModel
+from innovate.diffuse.gompertz import GompertzModel
 from innovate.diffuse.logistic import LogisticModel
 
 
@@ -49,20 +56,58 @@ def test_batched_fitter_predict(synthetic_batched_data):
     assert predictions.shape == (2, 50)
 
 
+@pytest.mark.parametrize("model_class", [BassModel, GompertzModel, LogisticModel])
+def test_batched_predict_vectorizes_on_numpy(model_class, monkeypatch):
+    model = model_class()
+    rows = {
+        BassModel: [[0.03, 0.4, 1000.0], [0.01, 0.6, 500.0]],
+        GompertzModel: [[100.0, 5.0, 0.5], [80.0, 3.0, 0.2]],
+        LogisticModel: [[1.0, 1.5, 10.0], [1.5, 0.5, 15.0]],
+    }[model_class]
+    t_batched = np.array([np.linspace(0, 20, 30), np.linspace(5, 30, 30)])
+    expected = np.array([model.evaluate(row, t) for row, t in zip(rows, t_batched)])
+
+    calls = []
+    evaluate = model_class.evaluate
+    monkeypatch.setattr(
+        model_class,
+        "evaluate",
+        lambda self, *args, **kwargs: (
+            calls.append(1) or evaluate(self, *args, **kwargs)
+        ),
+    )
+    batched_fitter = BatchedFitter(model, ScipyFitter())
+    batched_fitter.fitted_params = np.array(rows)
+
+    np.testing.assert_allclose(batched_fitter.predict(t_batched), expected, rtol=1e-12)
+    assert len(calls) == 1
+
+
+def test_supports_batch_follows_closed_form():
+    assert LogisticModel().supports_batch
+    assert LogisticModel(t_event=10.0).supports_batch
+    model = LogisticModel(covariates=["x"])
+    assert not model.supports_batch
+
+    rows = np.array([[1.0, 1.5, 10.0, 0.1, 0.0, 0.0], [1.5, 0.5, 15.0, 0.0, 0.1, 0.0]])
+    t = np.linspace(0, 20, 30)
+    expected = [model.evaluate(row, t) for row in rows]
+    np.testing.assert_allclose(model.evaluate_batch(rows, t), expected)
+
+
 def test_batched_fitter_jax(synthetic_batched_data):
-    from innovate.backend import use_backend, current_backend
+    from innovate.backend import using
     from innovate.fitters.jax_fitter import JaxFitter
 
-    original_backend = current_backend
-    use_backend("jax")
-
     t_batched, y_batched = synthetic_batched_data
 
     model = LogisticModel()
     fitter = JaxFitter()
     batched_fitter = BatchedFitter(model, fitter)
 
-    fitted_params = batched_fitter.fit(t_batched, y_batched)
+    with using("jax"):
+        fitted_params = batched_fitter.fit(t_batched, y_batched)
+        predictions = batched_fitter.predict(t_batched)
 
     assert fitted_params is not None
     assert fitted_params.shape == (2, 3)
@@ -71,9 +116,112 @@ def test_batched_fitter_jax(synthetic_batched_data):
     assert np.allclose(fitted_params[0], [1.0, 1.5, 10.0], atol=0.2)
     assert np.allclose(fitted_params[1], [1.5, 0.5, 15.0], atol=0.2)
 
-    predictions = batched_fitter.predict(t_batched)
-
     assert predictions is not None
     assert predictions.shape == (2, 50)
 
-    use_backend(original_backend.__class__.__name__.lower().replace("backend", ""))
+
+def test_batched_fitter_process_pool_matches_serial(synthetic_batched_data):
+    t_batched, y_batched = synthetic_batched_data
+    # Rectangular batches are shared with the workers through shared memory.
+    t_batched = np.stack([t_batched[0], t_batched[1]] * 2)
+    y_batched = np.stack([y_batched[0], y_batched[1]] * 2)
+
+    serial = BatchedFitter(LogisticModel(), ScipyFitter())
+    parallel = BatchedFitter(
+        LogisticModel(), ScipyFitter(), n_workers=2, chunksize=3, mp_context="spawn"
+    )
+
+    expected = serial.fit(t_batched, y_batched)
+    fitted_params = parallel.fit(t_batched, y_batched)
+
+    assert fitted_params.shape == (4, 3)
+    np.testing.assert_allclose(fitted_params, expected)
+    assert parallel.fit_errors == [None] * 4
+
+
+@pytest.mark.parametrize("mp_context", ["fork", "spawn"])
+def test_batched_fitter_shared_memory_leaves_stderr_clean(mp_context):
+    # The resource tracker reports unregistration errors on its own stderr,
+    # which only a separate interpreter can capture
+    code = f"""
+import numpy as np
+from innovate.diffuse.logistic import LogisticModel
+from innovate.fitters.batched_fitter import BatchedFitter
+from innovate.fitters.scipy_fitter import ScipyFitter
+
+if __name__ == "__main__":
+    t = np.linspace(0, 20, 40)
+    y = [1.0 / (1 + np.exp(-k * (t - 10.0))) for k in (1.0, 1.5, 2.0, 2.5)]
+    fitter = BatchedFitter(
+        LogisticModel(), ScipyFitter(), n_workers=2, mp_context="{mp_context}"
+    )
+    fitter.fit(np.stack([t] * 4), np.stack(y))
+"""
+    src = os.path.dirname(os.path.dirname(innovate.__file__))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, PYTHONPATH=src),
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stderr == ""
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_batched_fitter_captures_errors(synthetic_batched_data, n_workers):
+    t_batched, y_batched = synthetic_batched_data
+    y_bad = np.full_like(y_batched[0], np.nan)
+    t_batched = [t_batched[0], t_batched[0][:10], t_batched[1]]
+    y_batched = [y_batched[0], y_bad[:10], y_batched[1]]
+
+    batched_fitter = BatchedFitter(
+        LogisticModel(), ScipyFitter(), n_workers=n_workers, errors="capture"
+    )
+    fitted_params = batched_fitter.fit(t_batched, y_batched)
+
+    assert fitted_params.shape == (3, 3)
+    assert np.all(np.isnan(fitted_params[1]))
+    assert np.allclose(fitted_params[0], [1.0, 1.5, 10.0], atol=0.2)
+    assert np.allclose(fitted_params[2], [1.5, 0.5, 15.0], atol=0.2)
+    assert batched_fitter.fit_errors[0] is None
+    assert isinstance(batched_fitter.fit_errors[1], Exception)
+    assert batched_fitter.diagnostics[1] is None
+    assert batched_fitter.diagnostics[2].status == "converged"
+    assert batched_fitter.diagnostics[2].nfev > 0
+
+    strict = BatchedFitter(LogisticModel(), ScipyFitter(), n_workers=n_workers)
+    with pytest.raises(RuntimeError, match="must not contain infs or NaNs"):
+        strict.fit(t_batched, y_batched)
+
+
+def test_batched_fitter_bass_mom_warm_start():
+    from innovate.diffuse.bass import BassModel
+    from innovate.fitters.mom_fitter import (
+        bass_mom_initial_guesses,
+        estimate_bass_mom,
+        estimate_bass_mom_batch,
+    )
+
+    t = np.arange(0, 25.0)
+    true_params = [[0.02, 0.2, 800.0], [0.05, 0.05, 100.0], [0.01, 0.4, 300.0]]
+    y_batched = BassModel().predict_many(t, true_params)
+    y_batched = y_batched * (1 + 0.01 * np.sin(np.arange(25.0)))
+
+    p, q, m, valid = estimate_bass_mom_batch(t, y_batched)
+    for k in np.flatnonzero(valid):
+        np.testing.assert_allclose(
+            (p[k], q[k], m[k]), estimate_bass_mom(t, y_batched[k])
+        )
+    assert valid.any()
+    guesses = bass_mom_initial_guesses(BassModel(), t, y_batched)
+    assert guesses.shape == (3, 3)
+
+    t_batched = np.tile(t, (3, 1))
+    cold = BatchedFitter(BassModel(), ScipyFitter(), warm_start=False)
+    warm = BatchedFitter(BassModel(), ScipyFitter())
+    np.testing.assert_allclose(
+        warm.fit(t_batched, y_batched), cold.fit(t_batched, y_batched), rtol=1e-4
+    )
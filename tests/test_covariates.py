@@ -0,0 +1,91 @@
+# tests/test_covariates.py
+
+import pytest
+import numpy as np
+from scipy.interpolate import CubicSpline
+from innovate.utils.covariates import CovariateInterpolant, prepare_covariates
+from innovate.diffuse.bass import BassModel
+from innovate.substitute.norton_bass import NortonBassModel
+
+
+@pytest.fixture
+def covariate_series():
+    t = np.array([0.0, 1.0, 2.5, 4.0, 7.0, 10.0])
+    covariates = {"price": np.cos(t), "ads": 0.1 * t**2}
+    return t, covariates
+
+
+@pytest.mark.parametrize("uniform", [True, False])
+def test_linear_interpolant_matches_np_interp(covariate_series, uniform):
+    t, covariates = covariate_series
+    if uniform:
+        t = np.linspace(0, 10, len(t))
+    interpolant = CovariateInterpolant(t, covariates)
+    t_query = np.linspace(-1, 11, 57)
+
+    expected = np.column_stack([np.interp(t_query, t, v) for v in covariates.values()])
+    np.testing.assert_allclose([interpolant(ti) for ti in t_query], expected)
+    np.testing.assert_allclose(interpolant.values(t_query), expected)
+
+
+def test_cubic_interpolant_matches_spline(covariate_series):
+    t, covariates = covariate_series
+    interpolant = CovariateInterpolant(t, covariates, kind="cubic", names=["ads"])
+    t_query = np.linspace(0, 10, 41)
+
+    expected = CubicSpline(t, covariates["ads"])(t_query)
+    np.testing.assert_allclose(interpolant.values(t_query)[:, 0], expected)
+
+
+def test_prepare_covariates(covariate_series):
+    t, covariates = covariate_series
+    interpolant = prepare_covariates(covariates, t)
+    assert prepare_covariates(interpolant, t) is interpolant
+    assert prepare_covariates(None, t) is None
+    with pytest.raises(ValueError):
+        prepare_covariates(covariates, t, kind="quadratic")
+
+
+def test_bass_prepared_covariates_match_dictionary():
+    t = np.linspace(0, 20, 21)
+    covariates = {"x": np.sin(t / 3), "z": np.linspace(0, 1, len(t))}
+    model = BassModel(covariates=["x", "z"])
+    params = np.array([0.02, 0.3, 500.0, 0.001, 0.01, 5.0, -0.002, 0.02, 10.0])
+    prepared = prepare_covariates(covariates, t)
+
+    for ti, yi in [(0.0, 1.0), (4.2, 80.0), (19.5, 400.0)]:
+        assert model.differential_equation(
+            ti, yi, params, prepared, t
+        ) == pytest.approx(model.differential_equation(ti, yi, params, covariates, t))
+
+
+def test_covariate_interpolation_option():
+    t = np.linspace(0, 20, 11)
+    covariates = {"x": np.sin(t / 2)}
+    linear = BassModel(covariates=["x"])
+    cubic = BassModel(covariates=["x"], covariate_interpolation="cubic")
+    params = {"p": 0.02, "q": 0.3, "m": 500.0, "beta_p_x": 0.01, "beta_q_x": 0.1}
+    params["beta_m_x"] = 50.0
+    linear.params_ = params
+    cubic.params_ = params
+
+    y_linear = linear.predict(t, covariates)
+    y_cubic = cubic.predict(t, covariates)
+    assert np.all(np.isfinite(y_cubic))
+    assert not np.allclose(y_linear, y_cubic)
+    np.testing.assert_allclose(y_linear, y_cubic, rtol=0.1)
+
+
+def test_norton_bass_predict_with_covariates():
+    t = np.linspace(0, 30, 31)
+    model = NortonBassModel(n_generations=1, covariates=["x"])
+    params = {"p1": 0.03, "q1": 0.2, "m1": 1000.0, "beta_p1_x": 0.0}
+    params.update({"beta_q1_x": 0.0, "beta_m1_x": 100.0})
+    model.params_ = params
+
+    y_shifted = model.predict(t, {"x": np.ones_like(t)})
+    model.params_ = {**params, "beta_m1_x": 0.0, "m1": 1100.0}
+    y_reference = model.predict(t, {"x": np.ones_like(t)})
+
+    assert y_shifted.shape == (len(t), 1)
+    np.testing.assert_allclose(y_shifted, y_reference, rtol=1e-6, atol=1e-6)
@@ -139,3 +139,41 @@ def test_fit_non_logistic_data():
     except RuntimeError:
         # If it fails to fit, that's also acceptable for this test
         pass
+
+
+def test_jacobian_matches_finite_differences(fisher_pry_data):
+    t, _, params = fisher_pry_data
+    model = FisherPryModel()
+    model.params_ = params
+
+    jac = model.jacobian(t)
+    # Same signature as the diffusion models: covariates come before params
+    shifted = [params["alpha"] * 1.1, params["t0"] + 1.0]
+    np.testing.assert_array_equal(
+        model.jacobian(t, None, shifted), model.jacobian(t, params=shifted)
+    )
+    step = 1e-6
+    columns = []
+    for name in model.param_names:
+        up, down = dict(params), dict(params)
+        up[name] += step
+        down[name] -= step
+        model.params_ = up
+        y_up = model.predict(t)
+        model.params_ = down
+        columns.append((y_up - model.predict(t)) / (2 * step))
+
+    np.testing.assert_allclose(jac, np.stack(columns, axis=-1), atol=1e-8)
+
+
+def test_predict_many(fisher_pry_data):
+    t, _, params = fisher_pry_data
+    model = FisherPryModel()
+    params_matrix = np.array([[params["alpha"], params["t0"]], [0.2, 5.0]])
+
+    predictions = model.predict_many(t, params_matrix)
+
+    assert predictions.shape == (2, len(t))
+    for row, values in zip(predictions, params_matrix):
+        model.params_ = dict(zip(model.param_names, values))
+        np.testing.assert_allclose(row, model.predict(t))
@@ -1,8 +1,15 @@
+import os
+import time
 import pytest
 from innovate.fitters.scipy_fitter import ScipyFitter
 from innovate.fitters.bootstrap_fitter import BootstrapFitter
 from innovate.fitters.jax_fitter import JaxFitter
+from innovate.fitters.batched_lm_fitter import BatchedLMFitter
+from innovate.fitters.multi_start_fitter import MultiStartFitter
 from innovate.diffuse.logistic import LogisticModel
+from innovate.diffuse.bass import BassModel
+from innovate.diffuse.gompertz import GompertzModel
+from innovate.substitute.fisher_pry import FisherPryModel
 import numpy as np
 
 
@@ -57,20 +64,432 @@ def test_bootstrap_fitter(synthetic_logistic_data):
     assert ses["L"] >= 0
 
 
-def test_jax_fitter(synthetic_logistic_data):
-    from innovate.backend import use_backend, current_backend
+def test_bootstrap_confidence_intervals_cover_true_bass_parameters():
+    t = np.arange(0, 30, dtype=float)
+    true_model = BassModel()
+    true_model.params_ = {"p": 0.02, "q": 0.3, "m": 1000.0}
+    # A fixed noise draw; the percentile intervals cover the truth for most
+    # draws but, being 95% intervals, not for every one
+    noise = np.random.default_rng(1).normal(0, 10, len(t))
+    y = true_model.predict(t) + noise
+
+    bootstrap_fitter = BootstrapFitter(ScipyFitter(), n_bootstraps=100, random_state=1)
+    bootstrap_fitter.fit(BassModel(), t, y)
+    cis = bootstrap_fitter.get_confidence_intervals()
+
+    for name, value in true_model.params_.items():
+        assert cis[name]["lower"] <= value <= cis[name]["upper"]
+        # Resamples that lose the time origin inflate p several-fold
+        assert 0.9 * value <= cis[name]["lower"]
+        assert cis[name]["upper"] <= 1.1 * value
+
+
+def test_bootstrap_fitter_keeps_model_configuration():
+    t = np.linspace(0, 20, 60)
+    model = LogisticModel(t_event=10.0)
+    y = model.evaluate([1.0, 1.5, 10.0, 1.2, 1.5, 10.0], t)
+    model.params_ = {"unrelated": 1.0}
+
+    bootstrap_fitter = BootstrapFitter(ScipyFitter(), n_bootstraps=4, random_state=0)
+    bootstrap_fitter.fit(model, t, y)
+
+    assert bootstrap_fitter.param_names == list(model.param_names)
+    assert bootstrap_fitter.replicates.shape == (4, 6)
+    assert bootstrap_fitter.n_failed == 0
+    assert model.params_ == {"unrelated": 1.0}
+
+
+def test_bootstrap_fitter_warns_about_failed_replicates():
+    t = np.linspace(0, 20, 30)
+    y = np.full_like(t, np.nan)
+
+    bootstrap_fitter = BootstrapFitter(ScipyFitter(), n_bootstraps=3, random_state=0)
+    with pytest.warns(RuntimeWarning, match="3 of 3 bootstrap fits failed"):
+        bootstrap_fitter.fit(LogisticModel(), t, y)
+
+    assert bootstrap_fitter.n_failed == 3
+    assert np.isnan(bootstrap_fitter.replicates).all()
+
 
-    original_backend = current_backend
-    use_backend("jax")
+def test_bootstrap_fitter_parallel_is_reproducible():
+    t = np.linspace(0, 20, 60)
+    y = 1.0 / (1 + np.exp(-1.5 * (t - 10.0))) + 0.01 * np.sin(7 * t)
+
+    serial = BootstrapFitter(ScipyFitter(), n_bootstraps=8, random_state=42)
+    serial.fit(LogisticModel(), t, y)
+    parallel = BootstrapFitter(
+        ScipyFitter(),
+        n_bootstraps=8,
+        random_state=42,
+        n_workers=2,
+        chunksize=3,
+        warm_start=True,
+        mp_context="spawn",
+    )
+    parallel.fit(LogisticModel(), t, y)
+
+    assert serial.replicates.shape == (8, 3)
+    assert parallel.point_estimate.shape == (3,)
+    np.testing.assert_allclose(parallel.replicates, serial.replicates, rtol=1e-4)
+    ses = serial.get_standard_errors()
+    np.testing.assert_allclose(
+        list(ses.values()), np.std(serial.replicates, axis=0), rtol=1e-12
+    )
+
+
+def test_bootstrap_fitter_adaptive_stops_early():
+    t = np.linspace(0, 20, 60)
+    y = 1.0 / (1 + np.exp(-1.5 * (t - 10.0))) + 0.01 * np.sin(7 * t)
+
+    adaptive = BootstrapFitter(
+        ScipyFitter(),
+        n_bootstraps=200,
+        random_state=3,
+        adaptive=True,
+        batch_size=10,
+        ci_tol=0.2,
+    )
+    adaptive.fit(LogisticModel(), t, y)
+    fixed = BootstrapFitter(ScipyFitter(), n_bootstraps=200, random_state=3)
+    fixed.fit(LogisticModel(), t, y)
+
+    used = adaptive.n_replicates_used
+    assert adaptive.stop_reason == "converged"
+    assert used < 200 and used % 10 == 0
+    assert adaptive.replicates.shape == (used, 3)
+    np.testing.assert_allclose(adaptive.replicates, fixed.replicates[:used])
+
+    budgeted = BootstrapFitter(
+        ScipyFitter(), n_bootstraps=200, adaptive=True, ci_tol=0.0, max_time=0.0
+    )
+    budgeted.fit(LogisticModel(), t, y)
+    assert budgeted.stop_reason == "max_time"
+    assert budgeted.n_replicates_used == 50
+
+
+def test_jax_fitter(synthetic_logistic_data):
+    from innovate.backend import using
 
     t, y = synthetic_logistic_data
     model = LogisticModel()
     jax_fitter = JaxFitter()
-    jax_fitter.fit(model, t, y)
+    with using("jax"):
+        jax_fitter.fit(model, t, y)
 
     assert model.params_ is not None
     assert len(model.params_) == 3  # L, k, x0
     # Allow a larger tolerance for JAX fitting
     assert np.allclose(list(model.params_.values()), [1.0, 1.5, 10.0], atol=0.2)
 
-    use_backend(original_backend.__class__.__name__.lower().replace("backend", ""))
+
+def test_jax_fitter_reuses_compiled_solver():
+    from innovate import backend
+    from innovate.fitters import jax_fitter
+
+    t = np.linspace(0, 20, 37)
+    original_backend = backend.current_backend
+    fitter = JaxFitter()
+    fitter.fit(LogisticModel(), t, 1.0 / (1 + np.exp(-1.5 * (t - 10.0))))
+    n_compiled = len(jax_fitter._COMPILED_SOLVERS)
+    fitter.fit(LogisticModel(), t, 1.2 / (1 + np.exp(-0.8 * (t - 9.0))))
+
+    assert len(jax_fitter._COMPILED_SOLVERS) == n_compiled
+    assert backend.current_backend is original_backend
+
+
+def test_jax_fitter_solver_cache_is_bounded_and_keyed_by_configuration(
+    monkeypatch,
+):
+    import gc
+    import weakref
+    from collections import OrderedDict
+    from innovate.fitters import jax_fitter
+
+    t = np.linspace(0, 20, 23)
+    linear, cubic = (
+        jax_fitter._solver_key(
+            BassModel(covariates=["x"], covariate_interpolation=kind),
+            t,
+            None,
+            500,
+            1e-3,
+        )
+        for kind in ("linear", "cubic")
+    )
+    assert linear != cubic
+
+    monkeypatch.setattr(jax_fitter, "_COMPILED_SOLVERS", OrderedDict())
+    monkeypatch.setattr(jax_fitter, "_MAX_COMPILED_SOLVERS", 1)
+    model = LogisticModel()
+    model_ref = weakref.ref(model)
+    JaxFitter().fit(model, t, 1.0 / (1 + np.exp(-1.5 * (t - 10.0))))
+    JaxFitter().fit(LogisticModel(t_event=12.0), t, np.ones_like(t))
+
+    assert len(jax_fitter._COMPILED_SOLVERS) == 1
+    del model
+    gc.collect()
+    assert model_ref() is None
+
+
+def test_jax_fitter_fit_batch_matches_single_fits():
+    t = np.linspace(0, 20, 50)
+    true_params = [[1.0, 1.5, 10.0], [1.5, 0.5, 15.0], [0.8, 0.9, 8.0]]
+    y_batched = LogisticModel().predict_many(t, true_params)
+
+    fitter = JaxFitter()
+    fitted_params = fitter.fit_batch(LogisticModel(), t, y_batched)
+
+    assert fitted_params.shape == (3, 3)
+    assert fitter.n_iter.shape == (3,)
+    np.testing.assert_allclose(fitted_params, true_params, rtol=1e-2)
+    for series, params in zip(y_batched, fitted_params):
+        single = JaxFitter().fit(LogisticModel(), t, series)
+        np.testing.assert_allclose(params, list(single.values()), rtol=1e-4)
+
+
+def test_scipy_fitter_estimate_does_not_mutate_model(synthetic_logistic_data):
+    t, y = synthetic_logistic_data
+    model = LogisticModel()
+
+    popt = ScipyFitter().estimate(model, t, y)
+
+    assert model.params_ == {}
+    assert np.allclose(popt, [1.0, 1.5, 10.0], atol=0.2)
+    np.testing.assert_allclose(
+        model.evaluate(popt, t), 1.0 / (1 + np.exp(-1.5 * (t - 10.0))), atol=0.05
+    )
+
+
+def test_scipy_fitter_shared_template_in_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    t = np.linspace(0, 20, 60)
+    true_params = [(1.0, 1.5, 10.0), (2.0, 0.8, 8.0), (0.5, 1.0, 12.0), (1.5, 2.0, 6.0)]
+    series = [L / (1 + np.exp(-k * (t - x0))) for L, k, x0 in true_params]
+    template = LogisticModel()
+    fitter = ScipyFitter()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda y: fitter.estimate(template, t, y), series))
+
+    assert template.params_ == {}
+    for popt, expected in zip(results, true_params):
+        np.testing.assert_allclose(popt, expected, rtol=1e-3)
+
+
+@pytest.mark.parametrize(
+    "model, true_params",
+    [
+        (LogisticModel(), [[1.0, 1.5, 10.0], [1.5, 0.5, 12.0], [0.8, 0.9, 8.0]]),
+        (BassModel(), [[0.03, 0.3, 1000.0], [0.01, 0.5, 500.0], [0.02, 0.2, 800.0]]),
+        (GompertzModel(), [[1000.0, 1.0, 0.2], [500.0, 1.0, 0.3], [800.0, 1.0, 0.15]]),
+        (FisherPryModel(), [[0.5, 10.0], [1.2, 8.0], [0.3, 12.0]]),
+    ],
+)
+def test_batched_lm_fitter_recovers_parameters(model, true_params):
+    t = np.linspace(1, 20, 40)
+    y_batched = model.predict_many(t, true_params)
+
+    fitter = BatchedLMFitter(model)
+    fitted_params = fitter.fit(t, y_batched)
+
+    assert fitted_params.shape == (3, len(model.param_names))
+    assert fitter.converged.all()
+    np.testing.assert_allclose(fitter.predict(t), y_batched, rtol=1e-5, atol=1e-6)
+    free = [name != "b" for name in model.param_names]  # Gompertz b is inert
+    np.testing.assert_allclose(
+        fitted_params[:, free], np.asarray(true_params)[:, free], rtol=1e-4
+    )
+
+
+def test_batched_lm_fitter_matches_scipy(synthetic_logistic_data):
+    t, y = synthetic_logistic_data
+    y_batched = np.stack([y, 2 * y])
+
+    fitter = BatchedLMFitter(LogisticModel())
+    fitted_params = fitter.fit(t, y_batched, p0=[1.0, 1.0, 9.0])
+
+    for series, params in zip(y_batched, fitted_params):
+        expected = ScipyFitter().estimate(LogisticModel(), t, series)
+        np.testing.assert_allclose(params, expected, rtol=1e-5)
+
+
+@pytest.mark.parametrize("sampler", ["lhs", "sobol"])
+def test_multi_start_fitter_stops_once_starts_agree(sampler):
+    t = np.linspace(0, 30, 31)
+    y = 1.0 / (1 + np.exp(-0.8 * (t - 12.0)))
+    model = LogisticModel()
+    fitter = MultiStartFitter(n_starts=32, n_refine=8, n_agree=2, sampler=sampler)
+
+    model.fit(fitter, t, y)
+
+    # initial_guesses, the p0 passed by model.fit and 32 sampled starts
+    assert fitter.starts.shape == (34, 3)
+    assert fitter.start_sse.shape == (34,)
+    assert 2 <= len(fitter.refined) < 8
+    np.testing.assert_allclose(
+        list(model.params_.values()), [1.0, 0.8, 12.0], rtol=1e-3
+    )
+    assert fitter.best_sse == min(sse for _, sse in fitter.refined)
+
+
+def test_cached_fitter_skips_optimization_on_hit(tmp_path):
+    from innovate.fitters.cached_fitter import CachedFitter, FitCache
+
+    class CountingFitter(ScipyFitter):
+        calls = 0
+
+        def fit(self, model, t, y, **kwargs):
+            CountingFitter.calls += 1
+            return super().fit(model, t, y, **kwargs)
+
+    t = np.linspace(0, 20, 40)
+    y = 1.0 / (1 + np.exp(-1.5 * (t - 10.0)))
+    fitter = CachedFitter(CountingFitter(), FitCache(tmp_path))
+
+    first = LogisticModel().fit(fitter, t, y)
+    assert fitter.last_hit is False
+    second = LogisticModel().fit(fitter, t, y)
+    assert fitter.last_hit is True
+    assert CountingFitter.calls == 1
+    assert second.params_ == pytest.approx(first.params_)
+    assert second.diagnostics_.as_dict() == first.diagnostics_.as_dict()
+
+    LogisticModel().fit(fitter, t, 2 * y)
+    GompertzModel().fit(fitter, t, y)
+    assert CountingFitter.calls == 3
+    assert fitter.cache.hits == 1
+
+
+def test_cached_fitter_round_trips_array_parameters(tmp_path):
+    from innovate.compete.competition import MultiProductDiffusionModel
+    from innovate.fitters.cached_fitter import CachedFitter, FitCache
+
+    p, Q, m = [0.02, 0.01], [[0.3, 0.1], [0.0, 0.25]], [100.0, 80.0]
+    t = np.arange(0, 15.0)
+    y = MultiProductDiffusionModel(p, Q, m).predict(t).values
+    fitter = CachedFitter(ScipyFitter(), FitCache(tmp_path))
+
+    first = MultiProductDiffusionModel(p, Q, m)
+    fitter.fit(first, t, y)
+    second = MultiProductDiffusionModel(p, Q, m)
+    fitter.fit(second, t, y)
+
+    assert fitter.last_hit is True
+    assert np.shape(second.params_["Q"]) == (2, 2)
+    for name in ("p", "Q", "m"):
+        np.testing.assert_allclose(second.params_[name], first.params_[name])
+    np.testing.assert_allclose(second.predict(t), first.predict(t))
+
+
+def test_fit_cache_evicts_least_recently_used(tmp_path):
+    from innovate.fitters.cached_fitter import FitCache
+
+    cache = FitCache(tmp_path)
+    for key in ("a", "b", "c"):
+        cache.put(key, {"params": [1.0] * 50})
+        time.sleep(0.01)
+    assert cache.get("a") is not None  # refreshes "a"
+    entry_size = os.path.getsize(tmp_path / "a.json")
+
+    cache.max_bytes = 2 * entry_size
+    cache.put("d", {"params": [1.0] * 50})
+
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["a", "d"]
+    assert cache.get("b") is None
+
+
+@pytest.mark.parametrize("method", ["refine", "ekf"])
+def test_incremental_fitter_tracks_cold_refits(method):
+    from innovate.fitters.incremental_fitter import IncrementalFitter
+
+    t = np.arange(1.0, 41.0)
+    y = BassModel().evaluate([0.01, 0.3, 1000.0], t) + 2.0 * np.sin(5 * t)
+    model = BassModel()
+    fitter = IncrementalFitter(method=method)
+    fitter.fit(model, t[:25], y[:25])
+    for i in range(25, 40):
+        fitter.update(model, t[i : i + 1], y[i : i + 1])
+        assert fitter.last_update == method
+
+    cold = BassModel().fit(ScipyFitter(), t, y)
+    assert fitter.n_full_refits == 0
+    assert fitter.t_.shape == (40,)
+    np.testing.assert_allclose(
+        list(model.params_.values()), list(cold.params_.values()), rtol=0.05
+    )
+
+
+def test_incremental_fitter_refits_on_regime_change():
+    from innovate.fitters.incremental_fitter import IncrementalFitter
+
+    t = np.linspace(0, 20, 41)
+    y = 1.0 / (1 + np.exp(-1.5 * (t - 10.0))) + 0.01 * np.sin(7 * t)
+    model = LogisticModel()
+    fitter = IncrementalFitter(method="ekf").fit(model, t[:30], y[:30])
+
+    fitter.update(model, t[30:], 2.0 * y[30:])
+
+    assert fitter.last_update == "full"
+    assert fitter.n_full_refits == 1
+    with pytest.raises(RuntimeError):
+        IncrementalFitter().update(model, [21.0], [1.0])
+
+
+def test_fitters_record_diagnostics():
+    from innovate.fitters.mom_fitter import MoMFitter
+
+    t = np.arange(0.0, 12.0)
+    y = BassModel().evaluate([0.03, 0.4, 1000.0], t)
+    model = BassModel().fit(ScipyFitter(), t, y)
+
+    diagnostics = model.diagnostics_
+    assert diagnostics.status == "converged"
+    assert diagnostics.nfev > 0 and diagnostics.njev > 0
+    assert diagnostics.n_rhs == 0  # closed-form solution
+    assert set(diagnostics.phase_times) == {
+        "initial_guesses",
+        "optimization",
+        "predict",
+    }
+    assert diagnostics.wall_time == pytest.approx(sum(diagnostics.phase_times.values()))
+    assert diagnostics.as_dict()["cost"] == pytest.approx(0.0, abs=1e-6)
+
+    fitter = ScipyFitter()
+    with pytest.raises(RuntimeError, match="maximum number of function"):
+        fitter.fit(BassModel(), t, y, max_nfev=2)
+    assert fitter.diagnostics.status == "max_iter"
+
+    covariates = {"x": 0.01 * np.sin(t)}
+    ode_model = BassModel(covariates=["x"])
+    fitter = ScipyFitter()
+    ode_model.fit(fitter, t, y, covariates=covariates)
+    assert fitter.diagnostics is ode_model.diagnostics_
+    assert fitter.diagnostics.n_ode_solves > 0
+    assert fitter.diagnostics.n_rhs >= fitter.diagnostics.n_ode_solves
+
+    mom = MoMFitter()
+    mom.fit(BassModel(), t, y)
+    assert mom.diagnostics.nfev == 0
+    assert mom.diagnostics.phase_times["optimization"] > 0
+
+
+def test_grouped_jacobian_steps_stay_within_bounds():
+    from scipy.sparse import csr_matrix
+    from innovate.fitters.scipy_fitter import _grouped_jacobian
+
+    evaluated = []
+
+    def residuals(x):
+        evaluated.append(x.copy())
+        return np.array([x[0] ** 2, np.exp(x[1]), np.sqrt(x[2] - 1.0)])
+
+    bounds = ([0.0, -np.inf, 1.0], [1.0, 0.0, 1.0 + 1e-8])
+    jacobian = _grouped_jacobian(residuals, csr_matrix(np.eye(3)), bounds, 1e-3)
+    x = np.array([1.0, 0.0, 1.0 + 4e-9])
+    J = jacobian(x)
+
+    for x_step in evaluated:
+        assert np.all(x_step >= bounds[0]) and np.all(x_step <= bounds[1])
+    np.testing.assert_allclose(np.diag(J)[:2], [2.0, 1.0], rtol=2e-3)
+    assert np.isfinite(J).all()
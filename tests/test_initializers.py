@@ -0,0 +1,46 @@
+# tests/test_initializers.py
+
+import numpy as np
+from innovate.utils.initializers import (
+    fisher_pry_initial_params,
+    gompertz_initial_params,
+    logistic_initial_params,
+)
+from innovate.diffuse.logistic import LogisticModel
+from innovate.diffuse.gompertz import GompertzModel
+from innovate.substitute.fisher_pry import FisherPryModel
+
+
+def test_logistic_initial_params_batch():
+    t = np.linspace(0, 20, 40)
+    true_params = [[1.0, 1.5, 10.0], [1.5, 0.5, 12.0], [0.8, 0.9, 8.0]]
+    y_batched = LogisticModel().predict_many(t, true_params)
+
+    L, k, x0 = logistic_initial_params(t, y_batched)
+
+    np.testing.assert_allclose(np.column_stack([L, k, x0]), true_params, rtol=0.05)
+    single = LogisticModel().initial_guesses(t, y_batched[1])
+    np.testing.assert_allclose(list(single.values()), [L[1], k[1], x0[1]])
+
+
+def test_gompertz_and_fisher_pry_initial_params():
+    t = np.linspace(1, 20, 40)
+    gompertz = [[1000.0, 1.0, 0.2], [500.0, 1.0, 0.3]]
+    a, c = gompertz_initial_params(t, GompertzModel().predict_many(t, gompertz))
+    np.testing.assert_allclose(a, [1000.0, 500.0], rtol=0.1)
+    np.testing.assert_allclose(c, [0.2, 0.3], rtol=0.1)
+
+    fisher_pry = [[0.5, 10.0], [1.2, 8.0]]
+    alpha, t0 = fisher_pry_initial_params(
+        t, FisherPryModel().predict_many(t, fisher_pry)
+    )
+    np.testing.assert_allclose(np.column_stack([alpha, t0]), fisher_pry, rtol=1e-6)
+
+
+def test_initial_params_fall_back_without_growth():
+    t = np.linspace(0, 10, 11)
+    L, k, x0 = logistic_initial_params(t, np.zeros((2, len(t))))
+    assert np.all(np.isnan(k))
+
+    guesses = GompertzModel().initial_guesses(t, np.linspace(5, 1, len(t)))
+    assert guesses == {"a": 5.5, "b": 1.0, "c": 0.1}
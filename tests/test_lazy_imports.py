@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import innovate
+
+SRC = os.path.dirname(os.path.dirname(innovate.__file__))
+
+
+def _loaded_after_import(module):
+    """Imports ``module`` in a fresh interpreter and lists the loaded packages."""
+    code = (
+        f"import sys, {module}; "
+        "print(' '.join(sorted({name.partition('.')[0] for name in sys.modules})))"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "innovate",
+        "innovate.diffuse.bass",
+        "innovate.fitters.scipy_fitter",
+        "innovate.abm",
+        "innovate.preprocess",
+        "innovate.plots",
+    ],
+)
+def test_import_does_not_load_optional_stacks(module):
+    loaded = _loaded_after_import(module)
+
+    heavy = {"jax", "mesa", "ndlib", "jitcdde", "statsmodels", "matplotlib"}
+    assert not loaded & heavy
+
+
+def test_lazy_attributes_resolve_on_access():
+    from innovate import abm, backend
+
+    assert innovate.diffuse.__name__ == "innovate.diffuse"
+    assert "InnovationModel" in dir(abm)
+    assert abm.InnovationModel.__module__ == "innovate.abm.model"
+    assert backend.JaxBackend.__name__ == "JaxBackend"
+    assert not hasattr(innovate, "not_a_subpackage")
@@ -56,6 +56,22 @@ def test_lotka_volterra_predict():
     assert predictions[-1, 1] > y0[1]
 
 
+def test_lotka_volterra_simulate_many_matches_predict():
+    model = LotkaVolterraModel()
+    params_matrix = np.array(
+        [[0.5, 0.1, 0.4, 0.1], [1.0, 0.3, 0.6, 0.05], [0.2, 0.0, 0.9, 0.2]]
+    )
+    t = np.linspace(0, 20, 21)
+    y0 = [0.01, 0.02]
+
+    predictions = model.simulate_many(t, params_matrix, y0, rtol=1e-9, atol=1e-12)
+
+    assert predictions.shape == (3, len(t), 2)
+    for row, prediction in zip(params_matrix, predictions):
+        model.params_ = dict(zip(model.param_names, row))
+        np.testing.assert_allclose(prediction, model.predict(t, y0), atol=1e-6)
+
+
 @pytest.fixture
 def lotka_volterra_data():
     """Generate synthetic data for the Lotka-Volterra model."""
@@ -181,20 +181,90 @@ def test_scipy_fitter_single_model(synthetic_data):
     assert all(param in model.params_ for param in ["p", "q", "m"])
 
 
-def test_scipy_fitter_multi_product_model_not_implemented():
+def test_scipy_fitter_multi_product_model():
+    p_vals = np.array([0.02, 0.015, 0.01, 0.025])
+    Q_matrix = np.array(
+        [
+            [0.3, 0.05, 0.0, 0.0],
+            [-0.03, 0.25, 0.0, 0.0],
+            [0.0, 0.0, 0.35, 0.04],
+            [0.0, 0.0, -0.02, 0.2],
+        ]
+    )
+    m_vals = np.array([1000.0, 800.0, 600.0, 1200.0])
+    true_model = MultiProductDiffusionModel(p=p_vals, Q=Q_matrix, m=m_vals)
+    time_points = np.arange(0, 20.0)
+    data = pd.DataFrame(
+        true_model.evaluate(
+            true_model.pack_params(p_vals, Q_matrix, m_vals), time_points
+        ),
+        columns=true_model.names,
+    )
+    # Columns are matched by name, so extra and reordered columns are ignored
+    panel = data[data.columns[::-1]].assign(total=data.sum(axis=1))
+
+    model = MultiProductDiffusionModel(
+        p=p_vals * 1.5,
+        Q=Q_matrix * 0.8,
+        m=m_vals * 1.2,
+        interaction_mask=Q_matrix != 0,
+    )
     fitter = ScipyFitter()
-    p_vals = [0.02, 0.015]
-    Q_matrix = [[0.3, 0.05], [0.03, 0.25]]
-    m_vals = [1000, 800]
-    model = MultiProductDiffusionModel(p=p_vals, Q=Q_matrix, m=m_vals)
-    time_points = np.arange(1, 10)
-    data = pd.DataFrame(np.random.rand(len(time_points), 2) * 100, columns=model.names)
+    fitter.fit(model, time_points, panel)
+
+    np.testing.assert_allclose(model.p, p_vals, rtol=1e-4)
+    np.testing.assert_allclose(model.Q, Q_matrix, atol=1e-4)
+    np.testing.assert_allclose(model.m, m_vals, rtol=1e-4)
+    assert model.params_["Q"][0][2] == 0.0
+    assert fitter.diagnostics.status == "converged"
+    residuals = data.values - model.predict(time_points).values
+    assert fitter.diagnostics.cost == pytest.approx(np.sum(residuals**2))
+
+
+def test_scipy_fitter_multi_product_fits_initially_zero_interactions():
+    p_vals = np.array([0.02, 0.01])
+    Q_matrix = np.array([[0.3, 0.1], [-0.05, 0.25]])
+    m_vals = np.array([1000.0, 800.0])
+    true_model = MultiProductDiffusionModel(p=p_vals, Q=Q_matrix, m=m_vals)
+    time_points = np.arange(0, 25.0)
+    y = true_model.evaluate(
+        true_model.pack_params(p_vals, Q_matrix, m_vals), time_points
+    )
 
-    with pytest.raises(
-        NotImplementedError,
-        match="Fitting MultiProductDiffusionModel with ScipyFitter is not yet implemented",
-    ):
-        fitter.fit(model, time_points, data)
+    # Off-diagonal zeros in the starting Q are fitted like any other entry
+    model = MultiProductDiffusionModel(
+        p=p_vals * 1.5, Q=np.diag([0.2, 0.2]), m=m_vals * 1.2
+    )
+    ScipyFitter().fit(model, time_points, y)
+
+    np.testing.assert_allclose(model.Q, Q_matrix, atol=1e-4)
+    assert len(model.pack_params(model.p, model.Q, model.m)) == 8
+
+
+def test_multi_product_model_jac_sparsity():
+    Q_matrix = [[0.3, 0.05, 0.0], [0.0, 0.25, 0.0], [0.0, 0.0, 0.2]]
+    model = MultiProductDiffusionModel(
+        p=[0.01] * 3,
+        Q=Q_matrix,
+        m=[100.0] * 3,
+        interaction_mask=np.array(Q_matrix) != 0,
+    )
+    sparsity = model.jac_sparsity(2).toarray()
+
+    # Columns: p1..p3, Q11..Q33 row-major, m1..m3; masked-out Q entries
+    # are not fitted and have empty columns
+    per_time = np.array(
+        [
+            [1, 1, 0, 1, 1, 0, 0, 1, 0, 0, 0, 0, 1, 1, 0],
+            [0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0],
+            [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1],
+        ]
+    )
+    np.testing.assert_array_equal(sparsity, np.tile(per_time, (2, 1)))
+
+    # Without a mask every product may interact with every other
+    dense = MultiProductDiffusionModel(p=[0.01] * 3, Q=Q_matrix, m=[100.0] * 3)
+    assert dense.jac_sparsity(1).toarray().all()
 
 
 def test_mixture_model():
@@ -339,3 +409,349 @@ def test_hierarchical_model_group_behavior(monkeypatch):
     monkeypatch.setattr(BassModel, "predict", _predict)
 
     np.testing.assert_allclose(model.predict(t), expected)
+
+
+def test_bass_closed_form_matches_ode():
+    from scipy.integrate import solve_ivp
+
+    t = np.arange(1, 51, dtype=float)
+    model = BassModel()
+    model.params_ = {"p": 0.03, "q": 0.3, "m": 1000.0}
+
+    def rhs(_, y):
+        return (0.03 + 0.3 * y / 1000.0) * (1000.0 - y)
+
+    reference = solve_ivp(
+        rhs, (t[0], t[-1]), [1e-6], t_eval=t, rtol=1e-11, atol=1e-12
+    ).y[0]
+
+    np.testing.assert_allclose(model.predict(t), reference, rtol=1e-6, atol=1e-9)
+    # The default LSODA fallback is only accurate to solver tolerance.
+    np.testing.assert_allclose(model._predict_ode(t), reference, rtol=1e-3, atol=1e-3)
+    np.testing.assert_allclose(
+        model.predict_adoption_rate(t), rhs(t, reference), rtol=1e-6, atol=1e-9
+    )
+
+
+def test_closed_form_not_used_with_covariates():
+    assert BassModel(t_event=10.0)._use_closed_form()
+    assert not BassModel(covariates=["x"])._use_closed_form()
+    assert GompertzModel(t_event=10.0)._use_closed_form()
+    assert not GompertzModel(covariates=["x"])._use_closed_form()
+
+
+def _piecewise_reference(rhs_pre, rhs_post, t, t_event, y0=1e-6):
+    from scipy.integrate import solve_ivp
+
+    tol = dict(rtol=1e-11, atol=1e-13)
+    pre = solve_ivp(rhs_pre, (t[0], t_event), [y0], dense_output=True, **tol)
+    y_event = pre.y[0, -1]
+    post = solve_ivp(rhs_post, (t_event, t[-1]), [y_event], dense_output=True, **tol)
+    return np.where(t < t_event, pre.sol(t)[0], post.sol(t)[0])
+
+
+def test_bass_structural_break_closed_form():
+    t = np.arange(1, 51, dtype=float)
+    model = BassModel(t_event=20.5)
+    model.params_ = {
+        "p": 0.03,
+        "q": 0.3,
+        "m": 1000.0,
+        "p_post": 0.01,
+        "q_post": 0.5,
+        "m_post": 1500.0,
+    }
+    reference = _piecewise_reference(
+        lambda _, y: (0.03 + 0.3 * y / 1000.0) * (1000.0 - y),
+        lambda _, y: (0.01 + 0.5 * y / 1500.0) * (1500.0 - y),
+        t,
+        20.5,
+    )
+
+    np.testing.assert_allclose(model.predict(t), reference, rtol=1e-6, atol=1e-9)
+    np.testing.assert_allclose(model._predict_ode(t), reference, rtol=1e-3, atol=1.0)
+
+
+def test_gompertz_structural_break_closed_form():
+    t = np.arange(1, 51, dtype=float)
+    model = GompertzModel(t_event=20.5)
+    model.params_ = {
+        "a": 1000.0,
+        "b": 1.0,
+        "c": 0.2,
+        "a_post": 1500.0,
+        "b_post": 1.0,
+        "c_post": 0.1,
+    }
+    reference = _piecewise_reference(
+        lambda _, y: 0.2 * y * (np.log(1000.0) - np.log(y)),
+        lambda _, y: 0.1 * y * (np.log(1500.0) - np.log(y)),
+        t,
+        20.5,
+    )
+
+    np.testing.assert_allclose(model.predict(t), reference, rtol=1e-6, atol=1e-9)
+    rates = model.predict_adoption_rate(t)
+    params = list(model.params_.values())
+    expected = [
+        model.differential_equation(ti, yi, params, None, t)
+        for ti, yi in zip(t, model.predict(t))
+    ]
+    np.testing.assert_allclose(rates, expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize(
+    "model, params",
+    [
+        (
+            BassModel(t_event=20.5),
+            [0.03, 0.3, 1000.0, 0.01, 0.5, 1500.0],
+        ),
+        # a_post below the state at the break exercises the running maximum
+        (
+            GompertzModel(t_event=20.5),
+            [1000.0, 1.0, 0.2, 600.0, 1.0, 0.1],
+        ),
+    ],
+)
+def test_closed_form_handles_unsorted_time(model, params):
+    t = np.arange(1, 51, dtype=float)
+    order = np.random.default_rng(0).permutation(len(t))
+    model.params_ = dict(zip(model.param_names, params))
+
+    np.testing.assert_allclose(model.predict(t[order]), model.predict(t)[order])
+    np.testing.assert_allclose(model.jacobian(t[order]), model.jacobian(t)[order])
+    np.testing.assert_allclose(
+        model.predict_many(t[order], [params, params]),
+        model.predict_many(t, [params, params])[:, order],
+    )
+
+
+@pytest.mark.parametrize("model_cls", [BassModel, GompertzModel])
+def test_adoption_rate_with_covariates_matches_pointwise(model_cls):
+    t = np.linspace(0, 40, 81)
+    covariates = {"x": np.sin(t / 5), "z": np.linspace(0, 1, len(t))}
+    model = model_cls(covariates=["x", "z"], t_event=15.0)
+    base = [0.02, 0.3, 500.0, 0.01, 0.2, 800.0]
+    if model_cls is GompertzModel:
+        base = [500.0, 1.0, 0.2, 800.0, 1.0, 0.1]
+    values = base + [0.001, 0.01, 5.0, -0.002, 0.02, 10.0]
+    model.params_ = dict(zip(model.param_names, values))
+
+    rates = model.predict_adoption_rate(t, covariates)
+    params = np.array(values)
+    expected = [
+        model.differential_equation(ti, yi, params, covariates, t)
+        for ti, yi in zip(t, model.predict(t, covariates))
+    ]
+    np.testing.assert_allclose(rates, expected, rtol=1e-10, atol=1e-12)
+
+
+def _finite_difference_jacobian(model, t, covariates=None, rel_step=1e-6):
+    base = dict(model.params_)
+    columns = []
+    for name in model.param_names:
+        step = rel_step * max(abs(base[name]), 1e-2)
+        up, down = dict(base), dict(base)
+        up[name] += step
+        down[name] -= step
+        model.params_ = up
+        y_up = model.predict(t, covariates)
+        model.params_ = down
+        y_down = model.predict(t, covariates)
+        columns.append((y_up - y_down) / (2 * step))
+    model.params_ = base
+    return np.stack(columns, axis=-1)
+
+
+@pytest.mark.parametrize(
+    "model, params",
+    [
+        (BassModel(), {"p": 0.03, "q": 0.3, "m": 1000.0}),
+        (
+            BassModel(t_event=20.5),
+            {
+                "p": 0.03,
+                "q": 0.3,
+                "m": 1000.0,
+                "p_post": 0.01,
+                "q_post": 0.5,
+                "m_post": 1500.0,
+            },
+        ),
+        (GompertzModel(), {"a": 1000.0, "b": 1.0, "c": 0.2}),
+        (
+            GompertzModel(t_event=20.5),
+            {
+                "a": 1000.0,
+                "b": 1.0,
+                "c": 0.2,
+                "a_post": 1500.0,
+                "b_post": 1.0,
+                "c_post": 0.1,
+            },
+        ),
+        (LogisticModel(), {"L": 1000.0, "k": 0.2, "x0": 20.0}),
+        (
+            LogisticModel(t_event=20.5),
+            {
+                "L": 1000.0,
+                "k": 0.2,
+                "x0": 20.0,
+                "L_post": 1200.0,
+                "k_post": 0.3,
+                "x0_post": 22.0,
+            },
+        ),
+    ],
+)
+def test_analytic_jacobian_matches_finite_differences(model, params):
+    t = np.arange(1, 51, dtype=float)
+    model.params_ = params
+    jac = model.jacobian(t)
+    assert jac.shape == (len(t), len(model.param_names))
+    np.testing.assert_allclose(
+        jac, _finite_difference_jacobian(model, t), rtol=1e-4, atol=1e-5
+    )
+
+
+@pytest.mark.parametrize(
+    "model, params",
+    [
+        (
+            BassModel(covariates=["x"]),
+            {
+                "p": 0.03,
+                "q": 0.3,
+                "m": 1000.0,
+                "beta_p_x": 0.001,
+                "beta_q_x": 0.01,
+                "beta_m_x": 10.0,
+            },
+        ),
+        (
+            LogisticModel(covariates=["x"]),
+            {
+                "L": 1000.0,
+                "k": 0.2,
+                "x0": 20.0,
+                "beta_L_x": 10.0,
+                "beta_k_x": 0.01,
+                "beta_x0_x": 1.0,
+            },
+        ),
+    ],
+)
+def test_analytic_jacobian_covariate_columns(model, params):
+    t = np.arange(1, 51, dtype=float)
+    covariates = {"x": np.sin(t / 5)}
+    model.params_ = params
+    jac = model.jacobian(t, covariates)
+    expected = _finite_difference_jacobian(model, t, covariates, rel_step=1e-3)
+    # ODE-backed Jacobians come from forward sensitivities, so they agree with
+    # finite differences only up to the solver tolerance.
+    scale = np.max(np.abs(expected), axis=0)
+    assert np.all(np.max(np.abs(jac - expected), axis=0) <= 2e-2 * scale)
+
+
+def test_scipy_fitter_uses_model_jacobian(monkeypatch):
+    t = np.arange(1, 51, dtype=float)
+    exp_term = np.exp(-0.33 * t)
+    y = 1000 * (1 - exp_term) / (1 + 10 * exp_term)
+    calls = []
+    original = BassModel.jacobian
+
+    def counting_jacobian(self, t_vals, covariates=None, params=None):
+        calls.append(1)
+        return original(self, t_vals, covariates, params)
+
+    monkeypatch.setattr(BassModel, "jacobian", counting_jacobian)
+    model = BassModel()
+    ScipyFitter().fit(model, t, y)
+
+    assert calls
+    assert model.score(t, y) > 0.99
+
+
+_PARAMS_MATRIX_CASES = [
+    (BassModel(), [[0.03, 0.3, 1000.0], [0.01, 0.5, 500.0]]),
+    (
+        BassModel(t_event=20.5),
+        [
+            [0.03, 0.3, 1000.0, 0.01, 0.5, 1500.0],
+            [0.02, 0.2, 800.0, 0.02, 0.4, 900.0],
+        ],
+    ),
+    (GompertzModel(), [[1000.0, 1.0, 0.2], [500.0, 1.0, 0.1]]),
+    (
+        GompertzModel(t_event=20.5),
+        [[1000.0, 1.0, 0.2, 1500.0, 1.0, 0.1], [800.0, 1.0, 0.1, 900.0, 1.0, 0.3]],
+    ),
+    (LogisticModel(), [[1000.0, 0.2, 20.0], [500.0, 0.5, 10.0]]),
+    (
+        LogisticModel(t_event=20.5),
+        [
+            [1000.0, 0.2, 20.0, 1200.0, 0.3, 22.0],
+            [500.0, 0.5, 10.0, 600.0, 0.1, 15.0],
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize("model, params_matrix", _PARAMS_MATRIX_CASES)
+def test_predict_many_matches_predict(model, params_matrix):
+    t = np.arange(1, 51, dtype=float)
+    predictions = model.predict_many(t, params_matrix)
+
+    assert predictions.shape == (len(params_matrix), len(t))
+    assert not model.params_
+    for row, expected_params in zip(predictions, params_matrix):
+        model.params_ = dict(zip(model.param_names, expected_params))
+        np.testing.assert_allclose(row, model.predict(t), rtol=1e-10)
+
+
+@pytest.mark.parametrize("model, params_matrix", _PARAMS_MATRIX_CASES)
+def test_jacobian_many_matches_jacobian(model, params_matrix):
+    t = np.arange(1, 51, dtype=float)
+    jacobians = model.jacobian_many(t, params_matrix)
+
+    assert jacobians.shape == (len(params_matrix), len(t), len(model.param_names))
+    for jac, params in zip(jacobians, params_matrix):
+        np.testing.assert_allclose(jac, model.jacobian(t, params=params), rtol=1e-12)
+
+
+def test_predict_many_loop_fallback_and_validation():
+    t = np.arange(1, 11, dtype=float)
+    model = BassModel(covariates=["x"])
+    params_matrix = [[0.03, 0.3, 1000.0, 0.0, 0.0, 0.0]] * 2
+    predictions = model.predict_many(t, params_matrix)
+    assert predictions.shape == (2, len(t))
+
+    with pytest.raises(ValueError):
+        model.predict_many(t, [[0.03, 0.3, 1000.0]])
+
+
+def test_evaluate_is_side_effect_free():
+    t = np.arange(1, 51, dtype=float)
+    for model, params in [
+        (BassModel(), [0.03, 0.3, 1000.0]),
+        (GompertzModel(), [1000.0, 1.0, 0.2]),
+        (LogisticModel(), [1000.0, 0.2, 20.0]),
+    ]:
+        predictions = model.evaluate(params, t)
+        assert model.params_ == {}
+        model.params_ = dict(zip(model.param_names, params))
+        np.testing.assert_allclose(predictions, model.predict(t))
+
+
+def test_mixture_model_evaluate_leaves_submodels_untouched():
+    t = np.linspace(1, 4, 4)
+    models = [LogisticModel(), LogisticModel()]
+    model = MixtureModel(models, [0.6, 0.4])
+    params = [50.0, 0.1, 5.0, 150.0, 0.2, 8.0, 0.6, 0.4]
+
+    predictions = model.evaluate(params, t)
+
+    assert all(m.params_ == {} for m in models)
+    model.params_ = dict(zip(model.param_names, params))
+    np.testing.assert_allclose(predictions, model.predict(t))
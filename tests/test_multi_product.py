@@ -58,3 +58,21 @@ def test_multi_product_model_fit(synthetic_multi_product_data):
 
     # Use a high relative tolerance to account for the difficulty of fitting this model
     assert np.allclose(fitted_params, true_params, rtol=0.4)
+
+
+def test_multi_product_adoption_rate_matches_pointwise():
+    t = np.linspace(0, 30, 61)
+    covariates = {"x": np.sin(t / 4), "z": np.linspace(0, 1, len(t))}
+    model = MultiProductDiffusionModel(n_products=3, covariates=["x", "z"])
+    values = [0.01, 0.02, 0.01, 0.3, 0.3, 0.2, 100.0, 80.0, 50.0]
+    values += [0.1, 0.2, 0.05, 0.3, 0.15, 0.25]
+    values += list(np.linspace(-0.01, 0.01, len(model.param_names) - len(values)))
+    model.params_ = dict(zip(model.param_names, values))
+
+    rates = model.predict_adoption_rate(t, covariates)
+    params = np.array(values)
+    expected = [
+        model.differential_equation(ti, yi, params, covariates, t)
+        for ti, yi in zip(t, model.predict(t, covariates))
+    ]
+    np.testing.assert_allclose(rates, expected, rtol=1e-10, atol=1e-12)
@@ -33,7 +33,7 @@ def test_norton_bass_model_fit(synthetic_norton_bass_data):
 
     # Provide slightly perturbed initial guesses to guide the optimizer
     p0 = np.array(true_params) * (
-        1 + np.random.uniform(-0.1, 0.1, size=len(true_params))
+        1 + np.random.default_rng(1).uniform(-0.1, 0.1, size=len(true_params))
     )
 
     # Use the ScipyFitter to fit the model
@@ -49,3 +49,20 @@ def test_norton_bass_model_fit(synthetic_norton_bass_data):
 
     # Use a high relative tolerance to account for the difficulty of fitting this model
     assert np.allclose(fitted_params, true_params, rtol=0.4)
+
+
+def test_norton_bass_adoption_rate_matches_pointwise():
+    t = np.linspace(0, 30, 61)
+    covariates = {"x": np.sin(t / 4)}
+    model = NortonBassModel(n_generations=3, covariates=["x"])
+    values = [0.01, 0.02, 0.03, 0.3, 0.25, 0.2, 100.0, 80.0, 90.0]
+    values += [0.001, 0.002, 1.0, -0.001, 0.01, 2.0, 0.0, 0.003, -1.0]
+    model.params_ = dict(zip(model.param_names, values))
+
+    rates = model.predict_adoption_rate(t, covariates)
+    params = np.array(values)
+    expected = [
+        model.differential_equation(ti, yi, params, covariates, t)
+        for ti, yi in zip(t, model.predict(t, covariates))
+    ]
+    np.testing.assert_allclose(rates, expected, rtol=1e-10, atol=1e-12)
@@ -23,7 +23,8 @@ def lock_in_data():
 
     y_true = model.predict(t, y0)
 
-    noise = np.random.normal(0, 5, y_true.shape)  # Add some noise
+    rng = np.random.default_rng(1)
+    noise = rng.normal(0, 5, y_true.shape)  # Add some noise
     y_noisy = np.clip(y_true + noise, 0, true_params["m"])  # Ensure within bounds
 
     return t, y_noisy, true_params
@@ -94,3 +95,43 @@ def test_lock_in_model_predict_adoption_rate(lock_in_data):
     assert isinstance(rates, np.ndarray)
     assert rates.shape == (len(t), 2)
     assert np.all(rates >= -1e-6)  # Rates should generally be non-negative
+
+
+def test_lock_in_model_simulate_many_matches_predict(lock_in_data):
+    t, _, true_params = lock_in_data
+    base = np.array(list(true_params.values()))
+    params_matrix = np.stack([base, base * 1.2, base * 0.8])
+
+    predictions = LockInModel().simulate_many(t, params_matrix, [1.0, 1.0])
+
+    assert predictions.shape == (3, len(t), 2)
+    model = LockInModel()
+    for row, prediction in zip(params_matrix, predictions):
+        model.params_ = dict(zip(model.param_names, row))
+        np.testing.assert_allclose(
+            prediction, model.predict(t, [1.0, 1.0]), rtol=1e-4, atol=1e-3
+        )
+
+
+def test_lock_in_model_simulate_many_uses_active_backend(lock_in_data, monkeypatch):
+    from innovate.backend import JaxBackend, using
+
+    t, _, true_params = lock_in_data
+    base = np.array(list(true_params.values()))
+    params_matrix = np.stack([base, base * 1.2])
+    expected = LockInModel().simulate_many(t, params_matrix, [1.0, 1.0])
+
+    calls = []
+    solve_ode_batch = JaxBackend.solve_ode_batch
+    monkeypatch.setattr(
+        JaxBackend,
+        "solve_ode_batch",
+        lambda self, *args, **kwargs: (
+            calls.append(1) or solve_ode_batch(self, *args, **kwargs)
+        ),
+    )
+    with using("jax"):
+        predictions = LockInModel().simulate_many(t, params_matrix, [1.0, 1.0])
+
+    assert len(calls) == 1
+    np.testing.assert_allclose(predictions, expected, rtol=1e-3, atol=1e-2)
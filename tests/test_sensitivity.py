@@ -0,0 +1,96 @@
+from functools import partial
+
+import numpy as np
+import pytest
+from scipy.integrate import odeint
+from scipy.optimize import approx_fprime
+
+from innovate.compete.lotka_volterra import LotkaVolterraModel
+from innovate.ecosystem.complementary_goods import ComplementaryGoodsModel
+from innovate.path_dependence.lock_in import LockInModel
+from innovate.utils.covariates import prepare_covariates
+from innovate.utils.sensitivity import solve_sensitivities, sse_and_gradient
+
+TIGHT = {"rtol": 1e-11, "atol": 1e-12}
+
+
+def test_sensitivities_match_finite_differences():
+    t = np.arange(0.0, 20.0)
+    model = ComplementaryGoodsModel()
+    params = np.array([0.3, 0.2, 0.1, 0.15])
+    y0 = [0.01, 0.01]
+
+    y, S = solve_sensitivities(
+        model.differential_equation, model.ode_jacobians, y0, t, params, **TIGHT
+    )
+
+    assert y.shape == (20, 2) and S.shape == (20, 2, 4)
+    np.testing.assert_allclose(S[0], 0.0)
+    for j in range(4):
+        step = np.zeros(4)
+        step[j] = 1e-6
+        upper = odeint(
+            model.differential_equation, y0, t, args=(params + step,), **TIGHT
+        )
+        lower = odeint(
+            model.differential_equation, y0, t, args=(params - step,), **TIGHT
+        )
+        np.testing.assert_allclose(S[..., j], (upper - lower) / 2e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize("with_covariates", [False, True])
+def test_lotka_volterra_sse_gradient_is_exact(with_covariates):
+    t = np.linspace(0, 20, 41)
+    covariates = {"x": np.cos(t / 3)} if with_covariates else None
+    model = LotkaVolterraModel(covariates=["x"] if with_covariates else None)
+    params = np.array([0.5, 0.3, 0.4, 0.2, 0.05, 0.02, -0.03, 0.01])
+    params = params[: len(model.param_names)]
+    model.params_ = dict(zip(model.param_names, params))
+    y_obs = 1.02 * model.predict(t, [0.1, 0.05], covariates)
+    prepared = prepare_covariates(covariates, t)
+
+    def objective(p):
+        return sse_and_gradient(
+            partial(model.differential_equation, covariates=prepared, t_eval=t),
+            partial(model.ode_jacobians, covariates=prepared, t_eval=t),
+            y_obs[0],
+            t,
+            p,
+            y_obs,
+            **TIGHT,
+        )
+
+    sse, gradient = objective(0.9 * params)
+    numeric = approx_fprime(0.9 * params, lambda p: objective(p)[0], 1e-6)
+    assert sse > 0
+    np.testing.assert_allclose(gradient, numeric, rtol=1e-3, atol=1e-6)
+
+
+def test_lock_in_sse_gradient_is_exact():
+    true_params = {
+        "alpha1": 0.1,
+        "alpha2": 0.08,
+        "beta1": 0.005,
+        "beta2": 0.007,
+        "gamma1": 0.001,
+        "gamma2": 0.001,
+        "m": 1000.0,
+    }
+    t = np.arange(0.0, 60.0)
+    model = LockInModel()
+    model.params_ = true_params
+    y = model.predict(t, [1.0, 1.0])
+
+    params = 1.05 * np.array(list(true_params.values()))
+    _, gradient = sse_and_gradient(
+        model._rhs, model.ode_jacobians, y[0], t, params, y, **TIGHT
+    )
+    scale = np.maximum(np.abs(params), 1e-3)
+    numeric = approx_fprime(
+        params,
+        lambda p: sse_and_gradient(
+            model._rhs, model.ode_jacobians, y[0], t, p, y, **TIGHT
+        )[0],
+        1e-7 * scale,
+    )
+    np.testing.assert_allclose(gradient, numeric, rtol=1e-3)